@@ -1,9 +1,31 @@
-from django.contrib import admin
-from .models import User, Profile
+from django.contrib import admin, messages
+from .models import User, Profile, APIKey
+from .api_keys import generate_key, hash_key
 
 class ProfileAdmin(admin.ModelAdmin):
     list_display = ('user', 'full_name', 'country', 'date')
 
+class APIKeyAdmin(admin.ModelAdmin):
+    list_display = ('name', 'prefix', 'user', 'scopes', 'throttle_rate', 'is_active', 'expires_at', 'revoked_at', 'created_at')
+    list_filter = ('is_active',)
+    search_fields = ('name', 'prefix', 'user__email')
+    readonly_fields = ('prefix', 'revoked_at', 'created_at')
+    raw_id_fields = ('user',)
+    actions = ['revoke_keys']
+
+    def save_model(self, request, obj, form, change):
+        if not change:
+            # 키 원문은 저장하지 않으므로 생성할 때 한 번만 보여준다
+            obj.prefix, raw_key = generate_key()
+            obj.hashed_key = hash_key(raw_key)
+            messages.warning(request, f"API key (shown only once): {raw_key}")
+        super().save_model(request, obj, form, change)
+
+    @admin.action(description="선택한 API 키 폐기")
+    def revoke_keys(self, request, queryset):
+        count = queryset.revoke()
+        messages.success(request, f"{count} API key(s) revoked.")
+
 admin.site.register(User)
 admin.site.register(Profile, ProfileAdmin)
-
+admin.site.register(APIKey, APIKeyAdmin)
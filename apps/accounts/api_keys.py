@@ -0,0 +1,136 @@
+# accounts/api_keys.py
+"""
+API 키 생성/해시와 프로세스 로컬 검증 캐시
+
+키는 충분히 긴 난수이므로 느린 비밀번호 해시 대신 SHA-256으로 저장하고 조회한다.
+검증된 키(와 사용자)는 API_KEY_CACHE_TTL초 동안 프로세스 메모리에 보관해, 캐시 적중 시 인증 비용은 해시 한 번과 dict 조회뿐이다.
+
+폐기/수정된 키는 공유 캐시(API_KEY_CACHE_ALIAS)의 버전 번호를 올려 알리고, 각 프로세스는
+API_KEY_CACHE_SYNC_INTERVAL초마다 버전을 확인해 바뀌었으면 로컬 캐시를 비운다.
+따라서 폐기는 모든 웹 워커에서 최대 동기화 간격 안에 반영된다 (공유 캐시가 없어도 TTL이 지나면 반영).
+"""
+import hashlib
+import logging
+import secrets
+import threading
+import time
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX_LENGTH = 8
+VERSION_CACHE_KEY = 'api-keys:version'
+# 존재하지 않는 키도 캐시해, 잘못된 키로 반복 요청해도 DB를 조회하지 않게 한다
+MISSING = object()
+
+
+def generate_key() -> Tuple[str, str]:
+    """새 API 키: (식별용 접두사, 전체 키 '<접두사>.<비밀값>')"""
+    prefix = secrets.token_hex(KEY_PREFIX_LENGTH // 2)
+    return prefix, f"{prefix}.{secrets.token_urlsafe(32)}"
+
+
+def hash_key(raw_key: str) -> str:
+    return hashlib.sha256(raw_key.encode()).hexdigest()
+
+
+def get_shared_cache():
+    return caches[getattr(settings, 'API_KEY_CACHE_ALIAS', 'default')]
+
+
+class APIKeyCache:
+    """
+    해시된 키 -> (만료 시각, APIKey 또는 MISSING)
+
+    Args:
+        ttl (float): 항목 유효 시간(초)
+        max_size (int): 최대 항목 수. 넘으면 가장 오래된 항목부터 제거
+        sync_interval (float): 공유 캐시의 폐기 버전을 확인하는 간격(초)
+    """
+
+    def __init__(self, ttl: float, max_size: int, sync_interval: float):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.sync_interval = sync_interval
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._version = None
+        self._synced_at = 0.0
+
+    def get(self, key_hash: str):
+        """캐시된 키, 없는 키면 MISSING, 캐시에 없으면 None"""
+        now = time.monotonic()
+        if now - self._synced_at >= self.sync_interval:
+            self.sync(now)
+        entry = self._entries.get(key_hash)
+        if entry is None:
+            return None
+        expires, api_key = entry
+        if expires <= now:
+            self._entries.pop(key_hash, None)
+            return None
+        return api_key
+
+    def set(self, key_hash: str, api_key) -> None:
+        with self._lock:
+            while len(self._entries) >= self.max_size:
+                self._entries.pop(next(iter(self._entries)), None)
+            self._entries[key_hash] = (time.monotonic() + self.ttl, api_key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def sync(self, now: Optional[float] = None) -> None:
+        """다른 프로세스에서 키가 폐기/수정되었으면 로컬 캐시를 비움"""
+        self._synced_at = time.monotonic() if now is None else now
+        try:
+            version = get_shared_cache().get(VERSION_CACHE_KEY, 0)
+        except Exception as e:
+            logger.warning(f"Failed to read API key cache version: {e}")
+            return
+        if version != self._version:
+            if self._version is not None:
+                self.clear()
+            self._version = version
+
+
+_cache: Optional[APIKeyCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_api_key_cache() -> APIKeyCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = APIKeyCache(
+                    ttl=getattr(settings, 'API_KEY_CACHE_TTL', 60),
+                    max_size=getattr(settings, 'API_KEY_CACHE_MAX_SIZE', 10000),
+                    sync_interval=getattr(settings, 'API_KEY_CACHE_SYNC_INTERVAL', 5),
+                )
+    return _cache
+
+
+def reset_api_key_cache() -> None:
+    """설정이 바뀌었을 때 캐시를 다시 만들도록 초기화 (테스트용)"""
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+def invalidate_api_keys() -> None:
+    """키가 폐기/수정되었음을 모든 프로세스에 알림 (이 프로세스의 캐시는 바로 비움)"""
+    shared = get_shared_cache()
+    try:
+        shared.add(VERSION_CACHE_KEY, 0, timeout=None)
+        shared.incr(VERSION_CACHE_KEY)
+    except Exception as e:
+        logger.warning(f"Failed to publish API key revocation: {e}")
+    cache = get_api_key_cache()
+    cache.clear()
+    cache.sync()
@@ -0,0 +1,51 @@
+# accounts/authentication.py
+from typing import Optional
+
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication
+
+from .api_keys import MISSING, get_api_key_cache, hash_key
+from .models import APIKey
+
+
+API_KEY_KEYWORD = 'Api-Key'
+
+
+class APIKeyAuthentication(BaseAuthentication):
+    """
+    API 키 인증: `Authorization: Api-Key <키>` 또는 `X-API-Key: <키>`
+
+    검증된 키와 사용자는 프로세스 로컬 캐시(api_keys.APIKeyCache)에 보관하므로,
+    캐시가 유효한 동안에는 DB를 조회하지 않는다. 인증에 성공하면 request.auth는 APIKey다.
+    """
+
+    def get_raw_key(self, request) -> Optional[str]:
+        header = request.META.get('HTTP_AUTHORIZATION', '')
+        keyword, _, raw_key = header.partition(' ')
+        if keyword == API_KEY_KEYWORD:
+            return raw_key.strip()
+        return request.META.get('HTTP_X_API_KEY') or None
+
+    def authenticate(self, request):
+        raw_key = self.get_raw_key(request)
+        if raw_key is None:
+            return None
+
+        key_hash = hash_key(raw_key)
+        cache = get_api_key_cache()
+        api_key = cache.get(key_hash)
+        if api_key is None:
+            api_key = APIKey.objects.select_related('user').filter(hashed_key=key_hash).first() or MISSING
+            cache.set(key_hash, api_key)
+
+        # 만료 시각과 사용자 활성 상태는 캐시된 키에서도 매 요청 확인 (세션/Basic 인증과 마찬가지로 비활성 사용자 거절)
+        if api_key is MISSING:
+            raise exceptions.AuthenticationFailed('Invalid API key.')
+        if not api_key.user.is_active:
+            raise exceptions.AuthenticationFailed('User inactive or deleted.')
+        if not api_key.is_valid():
+            raise exceptions.AuthenticationFailed('Invalid API key.')
+        return api_key.user, api_key
+
+    def authenticate_header(self, request):
+        return API_KEY_KEYWORD
@@ -0,0 +1,36 @@
+# Generated by Django 6.1.2 on 2026-10-17 23:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_populate_profile'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='APIKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('prefix', models.CharField(editable=False, max_length=16, unique=True)),
+                ('hashed_key', models.CharField(editable=False, max_length=64, unique=True)),
+                ('scopes', models.JSONField(blank=True, default=list, help_text='사용할 수 있는 API 범위 (예: ["qr", "seavoyage"]). 비어 있으면 전체')),
+                ('throttle_rate', models.CharField(blank=True, help_text='키별 요청 제한 (예: 1000/min). 비어 있으면 기본값', max_length=32)),
+                ('is_active', models.BooleanField(default=True)),
+                ('expires_at', models.DateTimeField(blank=True, null=True)),
+                ('revoked_at', models.DateTimeField(blank=True, editable=False, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='api_keys', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'API 키',
+                'verbose_name_plural': 'API 키들',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.1.2 on 2026-10-17 23:14
+
+import apps.accounts.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_apikey'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='apikey',
+            name='throttle_rate',
+            field=models.CharField(blank=True, help_text='키별 요청 제한 (예: 1000/min). 비어 있으면 기본값', max_length=32, validators=[apps.accounts.models.validate_throttle_rate]),
+        ),
+    ]
@@ -1,7 +1,15 @@
+from typing import Optional
+
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.dispatch import receiver
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from core.throttling import parse_rate
+
+from .api_keys import generate_key, hash_key, invalidate_api_keys
 
 class User(AbstractUser):
     """
@@ -83,4 +91,99 @@ def set_superuser_for_specific_email(sender, instance, **kwargs):
         instance.is_active = True
         
 post_save.connect(create_user_profile, sender=User)
-post_save.connect(save_user_profile, sender=User)
\ No newline at end of file
+post_save.connect(save_user_profile, sender=User)
+
+def validate_throttle_rate(value: str) -> None:
+    """'num/period' 형식이고 토큰 보충 간격이 1ms 이상인지 확인 (초당 1000회 초과는 제한 없음과 같음)"""
+    try:
+        _, interval = parse_rate(value)
+    except (ValueError, KeyError, IndexError, ZeroDivisionError):
+        raise ValidationError("Enter a rate like '1000/min' (period: s, m, h or d).")
+    if interval < 1:
+        raise ValidationError("Rate must be at most 1000 requests per second.")
+
+
+class APIKeyQuerySet(models.QuerySet):
+    def revoke(self) -> int:
+        """여러 키를 한 번에 폐기 (update는 시그널을 보내지 않으므로 캐시 무효화를 직접 알림)"""
+        count = self.filter(revoked_at__isnull=True).update(is_active=False, revoked_at=timezone.now())
+        invalidate_api_keys()
+        return count
+
+
+class APIKeyManager(models.Manager.from_queryset(APIKeyQuerySet)):
+    def create_key(self, user, name: str, **kwargs):
+        """
+        새 API 키 생성
+
+        Returns:
+            tuple: (APIKey, 전체 키). 전체 키는 저장하지 않으므로 이때만 확인할 수 있다.
+        """
+        prefix, raw_key = generate_key()
+        api_key = self.model(user=user, name=name, prefix=prefix, hashed_key=hash_key(raw_key), **kwargs)
+        api_key.full_clean()
+        api_key.save(force_insert=True, using=self.db)
+        return api_key, raw_key
+
+
+class APIKey(models.Model):
+    """
+    B2B 연동용 API 키
+
+    키 원문은 저장하지 않고 SHA-256 해시만 저장한다. scopes가 비어 있으면 모든 API를 사용할 수 있고,
+    throttle_rate('1000/min' 형식)를 지정하면 기본 요청 제한 대신 키별 제한을 적용한다.
+    """
+    is_api_key = True
+
+    user = models.ForeignKey(User, related_name='api_keys', on_delete=models.CASCADE)
+    name = models.CharField(max_length=100)
+    prefix = models.CharField(max_length=16, unique=True, editable=False)
+    hashed_key = models.CharField(max_length=64, unique=True, editable=False)
+    scopes = models.JSONField(default=list, blank=True, help_text='사용할 수 있는 API 범위 (예: ["qr", "seavoyage"]). 비어 있으면 전체')
+    throttle_rate = models.CharField(
+        max_length=32, blank=True, validators=[validate_throttle_rate],
+        help_text='키별 요청 제한 (예: 1000/min). 비어 있으면 기본값',
+    )
+    is_active = models.BooleanField(default=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+    revoked_at = models.DateTimeField(null=True, blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = APIKeyManager()
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'API 키'
+        verbose_name_plural = 'API 키들'
+
+    def __str__(self):
+        return f"{self.name} ({self.prefix})"
+
+    def is_valid(self) -> bool:
+        """사용할 수 있는 키인지 확인 (비활성화된 사용자의 키도 거절)"""
+        if not self.is_active or self.revoked_at is not None or not self.user.is_active:
+            return False
+        return self.expires_at is None or self.expires_at > timezone.now()
+
+    def has_scope(self, scope: Optional[str]) -> bool:
+        return not self.scopes or scope in self.scopes
+
+    def revoke(self) -> None:
+        self.is_active = False
+        self.revoked_at = timezone.now()
+        self.save(update_fields=['is_active', 'revoked_at'])
+
+
+@receiver(post_save, sender=APIKey)
+@receiver(post_delete, sender=APIKey)
+def invalidate_cached_api_keys(sender, instance, **kwargs):
+    """키가 수정/폐기/삭제되면 모든 프로세스의 검증 캐시를 무효화"""
+    if not kwargs.get('created'):
+        invalidate_api_keys()
+
+
+@receiver(post_save, sender=User)
+def invalidate_cached_user_api_keys(sender, instance, created, **kwargs):
+    """키를 가진 사용자가 수정(비활성화 등)되면 검증 캐시를 무효화"""
+    if not created and APIKey.objects.filter(user=instance).exists():
+        invalidate_api_keys()
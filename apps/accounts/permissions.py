@@ -0,0 +1,17 @@
+# accounts/permissions.py
+from rest_framework.permissions import BasePermission
+
+
+class APIKeyScopePermission(BasePermission):
+    """
+    API 키로 인증한 요청은 뷰의 api_key_scope가 키의 scopes에 포함되어야 허용 (scopes가 비어 있는 키는 전체 허용)
+
+    API 키를 사용하지 않은 요청에는 적용하지 않는다.
+    """
+    message = 'This API key is not allowed to access this endpoint.'
+
+    def has_permission(self, request, view):
+        api_key = request.auth
+        if not getattr(api_key, 'is_api_key', False):
+            return True
+        return api_key.has_scope(getattr(view, 'api_key_scope', None))
@@ -1,3 +1,19 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import QRJob, QRJobChunk
+
+
+class QRJobChunkInline(admin.TabularInline):
+    model = QRJobChunk
+    extra = 0
+    fields = ('index', 'start_row', 'row_count', 'status', 'attempts', 'rendered_items', 'failed_items')
+    readonly_fields = fields
+    can_delete = False
+
+
+@admin.register(QRJob)
+class QRJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'status', 'input_format', 'total_items', 'rendered_items', 'failed_items', 'attempts', 'created_at', 'finished_at')
+    list_filter = ('status', 'input_format')
+    readonly_fields = ('id', 'created_at', 'updated_at', 'started_at', 'finished_at', 'worker')
+    inlines = [QRJobChunkInline]
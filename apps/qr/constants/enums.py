@@ -35,6 +35,44 @@ class QREyeStyles(str, Enum):
     def get_all_eye_styles(cls):
         return [style.value for style in cls]
 
+class QROutputFormats(str, Enum):
+    """QR 코드 출력 포맷 정의"""
+    PNG = 'png'
+    SVG = 'svg'
+    WEBP = 'webp'
+    MATRIX = 'matrix'  # 비트 패킹된 모듈 행렬 (바이너리)
+    MATRIX_JSON = 'matrix_json'  # base64 모듈 행렬과 메타데이터 (JSON)
+
+    @property
+    def content_type(self):
+        return {
+            QROutputFormats.PNG: 'image/png',
+            QROutputFormats.SVG: 'image/svg+xml',
+            QROutputFormats.WEBP: 'image/webp',
+            QROutputFormats.MATRIX: 'application/octet-stream',
+            QROutputFormats.MATRIX_JSON: 'application/json',
+        }[self]
+
+    @property
+    def extension(self):
+        return {
+            QROutputFormats.MATRIX: 'bin',
+            QROutputFormats.MATRIX_JSON: 'json',
+        }.get(self, self.value)
+
+    @classmethod
+    def get_all_output_formats(cls):
+        return [output_format.value for output_format in cls]
+
+    @classmethod
+    def get_image_formats(cls):
+        """Accept 헤더로 선택할 수 있는 이미지 포맷"""
+        return [cls.PNG, cls.SVG, cls.WEBP]
+
+    @classmethod
+    def get_matrix_formats(cls):
+        return [cls.MATRIX, cls.MATRIX_JSON]
+
 class WifiEncryption(str, Enum):
     """WiFi 암호화 방식 정의"""
     WPA = 'WPA'
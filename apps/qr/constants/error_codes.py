@@ -15,6 +15,12 @@ class QRErrorCodes(str, Enum):
     INVALID_BITCOIN = 'QR_INVALID_BITCOIN'
     INTERNAL_ERROR = 'QR_INTERNAL_ERROR'
     INVALID_COLOR = 'QR_INVALID_COLOR'
+    IMAGE_TOO_LARGE = 'QR_IMAGE_TOO_LARGE'
+    INVALID_SIGNATURE = 'QR_INVALID_SIGNATURE'
+    BATCH_TOO_LARGE = 'QR_BATCH_TOO_LARGE'
+    JOB_NOT_READY = 'QR_JOB_NOT_READY'
+    RENDER_BUSY = 'QR_RENDER_BUSY'
+    RENDER_TIMEOUT = 'QR_RENDER_TIMEOUT'
 
 class QRErrorMessages(dict):
     """에러 코드별 메시지 정의"""
@@ -31,6 +37,12 @@ class QRErrorMessages(dict):
         QRErrorCodes.INVALID_GEO: "Wrong location information.",
         QRErrorCodes.INVALID_BITCOIN: "Wrong Bitcoin information.",
         QRErrorCodes.INTERNAL_ERROR: "Internal server error occurred.",
+        QRErrorCodes.IMAGE_TOO_LARGE: "Requested QR code image is larger than the allowed maximum size.",
+        QRErrorCodes.INVALID_SIGNATURE: "Invalid or expired URL signature.",
+        QRErrorCodes.BATCH_TOO_LARGE: "Too many items in the batch request.",
+        QRErrorCodes.JOB_NOT_READY: "The QR generation job has no result yet.",
+        QRErrorCodes.RENDER_BUSY: "The QR renderer is busy. Please retry shortly.",
+        QRErrorCodes.RENDER_TIMEOUT: "Rendering the QR code took too long.",
     }
 
     @classmethod
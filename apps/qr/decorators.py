@@ -2,7 +2,7 @@ from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import serializers
 
-from apps.qr.constants.enums import QRStyles, QRColorMasks
+from apps.qr.constants.enums import QRStyles, QRColorMasks, QREyeStyles, QROutputFormats
 
 def qr_swagger_decorator(operation_id, serializer_class, tags=["QR Code"], description=None):
     """QR코드 생성 엔드포인트에 사용되는 Swagger 데코레이터"""
@@ -10,11 +10,19 @@ def qr_swagger_decorator(operation_id, serializer_class, tags=["QR Code"], descr
         description = ""
     description += f"""
     - `style`: {QRStyles.get_all_styles()}
+    - `eye_style`: {QREyeStyles.get_all_eye_styles()}
     - `color_mask`: {QRColorMasks.get_all_color_masks()}
     - `fill_color`: #000000 or black or rgb(0,0,0)
     - `back_color`: #FFFFFF or white or rgb(255,255,255)
     - `embedded_image`: Image file
     - `embedded_image_ratio`: 0.2 (0.1-0.5)
+    - `size`: target image width/height in pixels (optional)
+    - `border`: quiet zone in modules (0-20, default 4)
+    - `sizes`: several target sizes at once (max 8), returned as ZIP (or `Accept: multipart/mixed`)
+    - `formats`: output formats for `sizes` (default: `format`)
+    - `format`: {QROutputFormats.get_all_output_formats()} (or `Accept: image/svg+xml`, `Accept: image/webp`)
+      - `matrix`: 4-byte header (size, version, ECC 0-3 = L/M/Q/H, mask) + row bit-packed modules
+      - `matrix_json`: version, size, error_correction, mask_pattern, row_bytes, base64 `data`
     """
     def decorator(func):
         # 시리얼라이저의 필드들을 스키마로 변환
@@ -41,6 +49,15 @@ def qr_swagger_decorator(operation_id, serializer_class, tags=["QR Code"], descr
                     type=openapi.TYPE_NUMBER,
                     default=field.default if field.default != serializers.empty else None
                 )
+            elif isinstance(field, serializers.ListField):
+                schema = openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(
+                        type=openapi.TYPE_INTEGER
+                        if isinstance(field.child, serializers.IntegerField)
+                        else openapi.TYPE_STRING
+                    ),
+                )
             elif isinstance(field, serializers.ImageField):
                 schema = openapi.Schema(
                     type=openapi.TYPE_FILE,
@@ -58,6 +75,11 @@ def qr_swagger_decorator(operation_id, serializer_class, tags=["QR Code"], descr
                 description='QR code style  {}'.format(', '.join([style.name for style in QRStyles])),
                 default=QRStyles.SQUARE_MODULE.value
             ),
+            'eye_style': openapi.Schema(
+                type=openapi.TYPE_STRING,
+                description='QR code eye (finder pattern) style {}'.format(', '.join([style.name for style in QREyeStyles])),
+                default=QREyeStyles.SQUARE.value
+            ),
             'fill_color': openapi.Schema(
                 type=openapi.TYPE_STRING,
                 description='QR code pattern color',
@@ -95,7 +117,7 @@ def qr_swagger_decorator(operation_id, serializer_class, tags=["QR Code"], descr
             ),
             tags=tags,
             responses={
-                200: openapi.Response("QR Code Image (PNG)"),
+                200: openapi.Response("QR Code Image (PNG, WebP or SVG)"),
                 400: openapi.Response("Bad Request"),
                 500: openapi.Response("Server Error"),
             },
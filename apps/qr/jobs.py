@@ -0,0 +1,244 @@
+# qr/jobs.py
+"""
+백그라운드 QR 생성 작업 처리
+
+`manage.py qr_worker`가 DB에서 작업을 가져와(외부 브로커 없음) 업로드된 CSV/NDJSON을 스트리밍으로 읽고,
+청크 단위로 프로세스 풀에서 렌더링해 MEDIA_ROOT/qr-jobs/<id>/ 아래에 기록한다.
+실패한 청크만 다시 시도하고, 모든 청크가 끝나면 result.zip 하나로 합친다.
+"""
+import json
+import logging
+import os
+import socket
+import tempfile
+import zipfile
+from contextlib import contextmanager
+from concurrent.futures import BrokenExecutor, Executor
+from datetime import timedelta
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db.models import F, Q, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .constants import QROutputFormats
+from .models import QRJob, QRJobChunk
+from .utils.batch import MANIFEST_FILENAME, build_batch_items, iter_batch_results, iter_input_rows
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_CHUNK_SIZE = 500
+DEFAULT_JOB_MAX_ATTEMPTS = 3
+# RUNNING 상태에서 이 시간 동안 갱신이 없으면 워커가 죽은 것으로 보고 다른 워커가 이어받는다
+DEFAULT_JOB_STALE_SECONDS = 600
+# 작업 하나의 최대 업로드 크기(바이트)와 최대 행 수
+DEFAULT_JOB_MAX_UPLOAD_SIZE = 50 * 1024 * 1024
+DEFAULT_JOB_MAX_ITEMS = 100000
+# 청크마다 보관할 최대 행 오류 수
+MAX_CHUNK_ERRORS = 100
+RESULT_FILENAME = 'result.zip'
+
+
+def get_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def get_max_attempts() -> int:
+    return getattr(settings, 'QR_JOB_MAX_ATTEMPTS', DEFAULT_JOB_MAX_ATTEMPTS)
+
+
+def iter_job_rows(job: QRJob) -> Iterator:
+    """업로드 파일의 행을 하나씩 읽음 (파일 전체를 메모리에 올리지 않음)"""
+    return iter_input_rows(default_storage.path(job.input_file.name), job.input_format)
+
+
+def iter_row_chunks(rows: Iterable, chunk_size: int) -> Iterator[tuple]:
+    """(청크 번호, 시작 행 번호, 행 목록)"""
+    iterator = iter(rows)
+    index = 0
+    while True:
+        chunk_rows = list(islice(iterator, chunk_size))
+        if not chunk_rows:
+            return
+        yield index, index * chunk_size, chunk_rows
+        index += 1
+
+
+def claim_next_job(worker_id: Optional[str] = None) -> Optional[QRJob]:
+    """
+    대기 중이거나 담당 워커가 멈춘 작업 하나를 가져옴
+
+    상태와 updated_at이 그대로일 때만 갱신하는 조건부 UPDATE로 잡으므로,
+    여러 워커가 동시에 실행되어도 한 작업은 한 워커만 가져간다.
+    """
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=getattr(settings, 'QR_JOB_STALE_SECONDS', DEFAULT_JOB_STALE_SECONDS))
+    candidates = (
+        QRJob.objects
+        .filter(Q(status=QRJob.Status.PENDING) | Q(status=QRJob.Status.RUNNING, updated_at__lt=stale_before))
+        .order_by('created_at')
+        .values_list('pk', 'status', 'updated_at')[:10]
+    )
+    for pk, status, updated_at in candidates:
+        claimed = QRJob.objects.filter(pk=pk, status=status, updated_at=updated_at).update(
+            status=QRJob.Status.RUNNING,
+            worker=worker_id or get_worker_id(),
+            attempts=F('attempts') + 1,
+            started_at=Coalesce(F('started_at'), Value(now)),
+            updated_at=now,
+        )
+        if claimed:
+            return QRJob.objects.get(pk=pk)
+    return None
+
+
+def _chunk_archive_name(job: QRJob, chunk: QRJobChunk) -> str:
+    return f"{job.job_dir}/chunks/chunk-{chunk.index:05d}.zip"
+
+
+@contextmanager
+def _atomic_zip(name: str):
+    """임시 파일에 ZIP을 쓰고, 정상 종료하면 os.replace로 제자리에 옮김"""
+    path = default_storage.path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as fp, zipfile.ZipFile(fp, 'w') as archive:
+            yield archive
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_chunk_archive(job: QRJob, chunk: QRJobChunk, results: Iterable[tuple]) -> tuple:
+    """
+    렌더링 결과를 청크 ZIP으로 기록
+
+    Returns:
+        tuple: (아카이브 이름, 렌더링된 수, 행 오류 목록)
+    """
+    name = _chunk_archive_name(job, chunk)
+    rendered, errors = 0, []
+    with _atomic_zip(name) as archive:
+        for item, content, error in results:
+            if error is not None:
+                errors.append({'index': item.index, 'error': error})
+                continue
+            compression = zipfile.ZIP_DEFLATED if item.output_format == QROutputFormats.SVG else zipfile.ZIP_STORED
+            archive.writestr(item.filename, content, compress_type=compression)
+            rendered += 1
+    return name, rendered, errors
+
+
+def process_chunk(job: QRJob, chunk: QRJobChunk, rows: List, executor: Optional[Executor] = None) -> QRJobChunk:
+    """청크 하나를 검증/렌더링하고 완료로 기록"""
+    items, invalid = build_batch_items(rows, start=chunk.start_row, defaults=job.options)
+    row_errors = [{'index': index, 'error': error} for index, error in invalid.items()]
+
+    name, rendered, render_errors = write_chunk_archive(job, chunk, iter_batch_results(items, executor=executor))
+    row_errors.extend(render_errors)
+
+    chunk.status = QRJob.Status.COMPLETED
+    chunk.archive = name
+    chunk.rendered_items = rendered
+    chunk.failed_items = len(row_errors)
+    chunk.errors = sorted(row_errors, key=lambda e: e['index'])[:MAX_CHUNK_ERRORS]
+    chunk.save()
+    return chunk
+
+
+def update_job_progress(job: QRJob) -> None:
+    """완료된 청크 합계로 진행 상황을 갱신 (재시도해도 중복 집계되지 않음). updated_at은 하트비트 역할"""
+    totals = job.chunks.filter(status=QRJob.Status.COMPLETED).aggregate(
+        rendered=Sum('rendered_items'), failed=Sum('failed_items'),
+    )
+    job.rendered_items = totals['rendered'] or 0
+    job.failed_items = totals['failed'] or 0
+    job.save(update_fields=['rendered_items', 'failed_items', 'updated_at'])
+
+
+def process_job(job: QRJob, executor: Optional[Executor] = None) -> QRJob:
+    """
+    작업의 남은 청크를 모두 처리
+
+    완료된 청크는 행만 건너뛰고 다시 렌더링하지 않는다. 실패한 청크는 QR_JOB_MAX_ATTEMPTS까지 재시도하며,
+    워커 풀이 깨지면(BrokenExecutor) 청크를 실패로 기록한 뒤 호출자에게 알려 풀을 다시 만들게 한다.
+    """
+    max_attempts = get_max_attempts()
+    if job.total_items is None:
+        job.total_items = sum(1 for _ in iter_job_rows(job))
+        job.save(update_fields=['total_items', 'updated_at'])
+
+    chunks = {chunk.index: chunk for chunk in job.chunks.all()}
+    for index, start_row, rows in iter_row_chunks(iter_job_rows(job), job.chunk_size):
+        chunk = chunks.get(index)
+        if chunk is None:
+            chunk = QRJobChunk.objects.create(job=job, index=index, start_row=start_row, row_count=len(rows))
+        if chunk.status == QRJob.Status.COMPLETED or chunk.attempts >= max_attempts:
+            continue
+
+        chunk.attempts += 1
+        try:
+            process_chunk(job, chunk, rows, executor=executor)
+        except Exception as e:
+            logger.error(f"QR job {job.pk} chunk {index} failed (attempt {chunk.attempts}): {e}")
+            chunk.status = QRJob.Status.FAILED
+            chunk.errors = [{'error': str(e)}]
+            chunk.save()
+            if isinstance(e, BrokenExecutor):
+                job.status = QRJob.Status.PENDING
+                job.save(update_fields=['status', 'updated_at'])
+                raise
+        update_job_progress(job)
+
+    return finish_job(job)
+
+
+def finish_job(job: QRJob) -> QRJob:
+    """재시도할 청크가 남았으면 다시 대기 상태로, 아니면 결과 ZIP을 만들고 종료 상태로 기록"""
+    max_attempts = get_max_attempts()
+    chunks = list(job.chunks.all())
+    failed = [chunk for chunk in chunks if chunk.status != QRJob.Status.COMPLETED]
+    if any(chunk.attempts < max_attempts for chunk in failed):
+        job.status = QRJob.Status.PENDING
+        job.save(update_fields=['status', 'updated_at'])
+        return job
+
+    job.result_file.name = assemble_result(job, [chunk for chunk in chunks if chunk.status == QRJob.Status.COMPLETED])
+    job.status = QRJob.Status.FAILED if failed else QRJob.Status.COMPLETED
+    job.error = f"{len(failed)} chunks failed after {max_attempts} attempts" if failed else ''
+    job.finished_at = timezone.now()
+    job.save()
+    logger.info(f"QR job {job.pk} {job.status}: {job.rendered_items} rendered, {job.failed_items} failed")
+    return job
+
+
+def assemble_result(job: QRJob, chunks: List[QRJobChunk]) -> str:
+    """청크 ZIP들을 순서대로 result.zip에 복사하고 manifest.json을 추가한 뒤 청크 파일을 삭제"""
+    name = f"{job.job_dir}/{RESULT_FILENAME}"
+    errors = []
+    with _atomic_zip(name) as archive:
+        for chunk in chunks:
+            with zipfile.ZipFile(default_storage.path(chunk.archive)) as source:
+                for info in source.infolist():
+                    archive.writestr(info, source.read(info))
+            errors.extend(chunk.errors)
+        archive.writestr(
+            MANIFEST_FILENAME,
+            json.dumps({
+                'total_items': job.total_items,
+                'rendered_items': job.rendered_items,
+                'failed_items': job.failed_items,
+                'errors': errors,
+            }, ensure_ascii=False, indent=2),
+            compress_type=zipfile.ZIP_DEFLATED,
+        )
+
+    for chunk in chunks:
+        default_storage.delete(chunk.archive)
+    return name
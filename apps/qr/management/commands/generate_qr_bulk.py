@@ -0,0 +1,179 @@
+import json
+import os
+import time
+import zipfile
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.qr.constants import QROutputFormats
+from apps.qr.utils.batch import (
+    INPUT_FORMAT_CSV,
+    INPUT_FORMAT_NDJSON,
+    MANIFEST_FILENAME,
+    build_batch_item,
+    get_batch_workers,
+    guess_input_format,
+    iter_batch_results,
+    iter_input_rows,
+    make_batch_executor,
+)
+from apps.qr.utils.cache import make_render_key
+
+
+class Command(BaseCommand):
+    help = (
+        "Render QR codes from a CSV/JSONL file of payloads and style options into a directory or ZIP, "
+        "using a process pool (no running server needed)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("input", help="CSV (with header row) or JSONL/NDJSON file, one QR code per row")
+        parser.add_argument("output", help="Output directory, or a path ending in .zip")
+        parser.add_argument(
+            "--input-format",
+            choices=[INPUT_FORMAT_CSV, INPUT_FORMAT_NDJSON],
+            default=None,
+            help="Input format (default: guessed from the file extension)",
+        )
+        parser.add_argument("--type", default=None, help="QR type for rows without a `type` column (url, wifi, vcard, ...)")
+        parser.add_argument(
+            "--option",
+            action="append",
+            default=[],
+            metavar="KEY=VALUE",
+            help="Default parameter for every row, e.g. --option style=CIRCLE_MODULE --option format=svg",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of render processes (default: CPU count, 0 renders in this process)",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip rows whose output file already exists (from an interrupted run)",
+        )
+        parser.add_argument(
+            "--dedupe",
+            action="store_true",
+            help="Name files by a hash of their render inputs so identical rows are rendered and stored once",
+        )
+        parser.add_argument(
+            "--progress-every",
+            type=int,
+            default=1000,
+            help="Report throughput every N rows",
+        )
+
+    def parse_options(self, values):
+        defaults = {}
+        for value in values:
+            key, sep, option = value.partition("=")
+            if not sep or not key:
+                raise CommandError(f"Invalid --option {value!r}, expected KEY=VALUE")
+            defaults[key] = option
+        return defaults
+
+    def output_name(self, item, dedupe):
+        if not dedupe:
+            return item.filename
+        params = {key: value for key, value in item.params.items() if key != 'output_format'}
+        key = make_render_key(type=item.type, params=params, output_format=item.output_format)
+        return f"{key[:32]}.{item.output_format.extension}"
+
+    def handle(self, *args, **options):
+        input_path = options["input"]
+        if not os.path.isfile(input_path):
+            raise CommandError(f"Input file not found: {input_path}")
+        input_format = options["input_format"] or guess_input_format(input_path)
+
+        defaults = self.parse_options(options["option"])
+        if options["type"]:
+            defaults["type"] = options["type"]
+
+        output = options["output"]
+        to_zip = output.lower().endswith(".zip")
+        if to_zip:
+            if os.path.exists(output) and not options["resume"]:
+                raise CommandError(f"{output} already exists (use --resume to continue it)")
+            try:
+                sink = zipfile.ZipFile(output, "a" if options["resume"] else "w")
+            except zipfile.BadZipFile:
+                raise CommandError(f"{output} is not a complete ZIP file and cannot be resumed")
+            existing = set(sink.namelist())
+        else:
+            os.makedirs(output, exist_ok=True)
+            sink = None
+            existing = set(os.listdir(output)) if options["resume"] else set()
+
+        workers = options["workers"] if options["workers"] is not None else get_batch_workers()
+        manifest, seen = [], set()
+        counts = {"rendered": 0, "skipped": 0, "duplicates": 0, "failed": 0}
+        names = {}
+
+        def pending_items():
+            """검증 후 렌더링이 필요한 항목만 풀에 넘김 (이어하기/중복 제거 대상은 여기서 건너뜀)"""
+            for index, row in enumerate(iter_input_rows(input_path, input_format)):
+                item, error = build_batch_item(index, row, defaults)
+                if error is not None:
+                    counts["failed"] += 1
+                    manifest.append({"index": index, "error": error})
+                    continue
+                name = self.output_name(item, options["dedupe"])
+                manifest.append({"index": index, "type": item.type, "filename": name})
+                if name in seen:
+                    counts["duplicates"] += 1
+                    continue
+                seen.add(name)
+                if name in existing:
+                    counts["skipped"] += 1
+                    continue
+                names[index] = name
+                yield item
+
+        executor = make_batch_executor(workers)
+        started = time.monotonic()
+        processed = 0
+        self.stdout.write(f"Rendering {input_path} with {workers} processes into {output}")
+        try:
+            for item, content, error in iter_batch_results(pending_items(), executor=executor, window=max(1, workers * 2)):
+                name = names.pop(item.index)
+                if error is not None:
+                    counts["failed"] += 1
+                    manifest[item.index] = {"index": item.index, "type": item.type, "error": error}
+                elif sink is not None:
+                    compression = zipfile.ZIP_DEFLATED if item.output_format == QROutputFormats.SVG else zipfile.ZIP_STORED
+                    sink.writestr(name, content, compress_type=compression)
+                    counts["rendered"] += 1
+                else:
+                    path = os.path.join(output, name)
+                    with open(f"{path}.tmp", "wb") as fp:
+                        fp.write(content)
+                    os.replace(f"{path}.tmp", path)
+                    counts["rendered"] += 1
+
+                processed += 1
+                if options["progress_every"] and processed % options["progress_every"] == 0:
+                    elapsed = time.monotonic() - started
+                    self.stdout.write(f"{processed} processed ({processed / elapsed:.1f} codes/sec)")
+        finally:
+            executor.shutdown(wait=True)
+            manifest_data = json.dumps({"items": manifest, **counts}, ensure_ascii=False, indent=2)
+            if sink is not None:
+                if MANIFEST_FILENAME in sink.namelist():
+                    # ZIP에는 같은 이름을 덮어쓸 수 없으므로 이어하기 결과는 번호를 붙여 추가
+                    sink.writestr(f"manifest-{int(time.time())}.json", manifest_data)
+                else:
+                    sink.writestr(MANIFEST_FILENAME, manifest_data)
+                sink.close()
+            else:
+                with open(os.path.join(output, MANIFEST_FILENAME), "w", encoding="utf-8") as fp:
+                    fp.write(manifest_data)
+
+        elapsed = time.monotonic() - started
+        rate = counts["rendered"] / elapsed if elapsed > 0 else 0.0
+        self.stdout.write(self.style.SUCCESS(
+            f"Rendered {counts['rendered']} codes in {elapsed:.1f}s ({rate:.1f} codes/sec); "
+            f"skipped {counts['skipped']}, duplicates {counts['duplicates']}, failed {counts['failed']}"
+        ))
@@ -0,0 +1,66 @@
+import logging
+import time
+from concurrent.futures import BrokenExecutor
+
+from django.core.management.base import BaseCommand
+
+from apps.qr.jobs import claim_next_job, get_worker_id, process_job
+from apps.qr.utils.batch import get_batch_workers, make_batch_executor
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Process background QR generation jobs (uploaded CSV/NDJSON) using all CPU cores"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of render processes (default: QR_BATCH_WORKERS or CPU count, 0 renders in this process)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds to wait between polls when no job is pending",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit when no pending job is left instead of polling",
+        )
+
+    def handle(self, *args, **options):
+        workers = options["workers"] if options["workers"] is not None else get_batch_workers()
+        worker_id = get_worker_id()
+        executor = make_batch_executor(workers)
+        self.stdout.write(f"QR worker {worker_id} started with {workers} render processes")
+
+        try:
+            while True:
+                job = claim_next_job(worker_id)
+                if job is None:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+
+                self.stdout.write(f"Processing QR job {job.pk}")
+                try:
+                    job = process_job(job, executor=executor)
+                except BrokenExecutor:
+                    # 렌더링 프로세스가 죽으면 풀을 새로 만들고, 작업은 대기 상태로 돌아가 다시 처리된다
+                    logger.error(f"Render pool broken while processing QR job {job.pk}, restarting pool")
+                    executor.shutdown(wait=False)
+                    executor = make_batch_executor(workers)
+                    continue
+                self.stdout.write(
+                    f"QR job {job.pk} {job.status}: {job.rendered_items} rendered, {job.failed_items} failed"
+                )
+        except KeyboardInterrupt:
+            self.stdout.write("QR worker stopped")
+        finally:
+            executor.shutdown(wait=True)
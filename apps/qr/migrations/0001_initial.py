@@ -0,0 +1,65 @@
+# Generated by Django 6.1.2 on 2026-10-17 22:39
+
+import apps.qr.models
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QRJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '실행 중'), ('completed', '완료'), ('failed', '실패')], db_index=True, default='pending', max_length=16)),
+                ('input_file', models.FileField(upload_to=apps.qr.models.qr_job_input_path)),
+                ('input_format', models.CharField(choices=[('csv', 'CSV'), ('ndjson', 'NDJSON')], default='csv', max_length=16)),
+                ('options', models.JSONField(blank=True, default=dict, help_text='모든 행에 적용할 기본 파라미터 (type, style, format 등)')),
+                ('chunk_size', models.PositiveIntegerField(default=500)),
+                ('total_items', models.PositiveIntegerField(blank=True, null=True)),
+                ('rendered_items', models.PositiveIntegerField(default=0)),
+                ('failed_items', models.PositiveIntegerField(default=0)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('result_file', models.FileField(blank=True, upload_to='')),
+                ('worker', models.CharField(blank=True, max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'QR 생성 작업',
+                'verbose_name_plural': 'QR 생성 작업들',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='QRJobChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('index', models.PositiveIntegerField()),
+                ('start_row', models.PositiveIntegerField()),
+                ('row_count', models.PositiveIntegerField()),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '실행 중'), ('completed', '완료'), ('failed', '실패')], default='pending', max_length=16)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('rendered_items', models.PositiveIntegerField(default=0)),
+                ('failed_items', models.PositiveIntegerField(default=0)),
+                ('errors', models.JSONField(blank=True, default=list, help_text='행별 오류 [{"row": 0, "error": ...}]')),
+                ('archive', models.CharField(blank=True, max_length=255)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='qr.qrjob')),
+            ],
+            options={
+                'ordering': ['job', 'index'],
+                'constraints': [models.UniqueConstraint(fields=('job', 'index'), name='unique_qr_job_chunk')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.1.2 on 2026-10-17 23:16
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_apikey_throttle_rate_validator'),
+        ('qr', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='qrjob',
+            name='api_key',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='qr_jobs', to='accounts.apikey'),
+        ),
+        migrations.AddField(
+            model_name='qrjob',
+            name='user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='qr_jobs', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
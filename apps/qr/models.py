@@ -1,3 +1,7 @@
+import os
+import uuid
+
+from django.conf import settings
 from django.db import models
 from pydantic import BaseModel
 from datetime import datetime
@@ -7,3 +11,88 @@ class QrStyles(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+
+def qr_job_input_path(instance, filename):
+    """업로드 파일 경로: qr-jobs/<job id>/input.<ext>"""
+    _, ext = os.path.splitext(filename)
+    return f"qr-jobs/{instance.pk}/input{ext.lower()}"
+
+
+class QRJob(models.Model):
+    """
+    CSV/NDJSON 업로드로 만든 대량 QR 코드 생성 작업
+
+    `manage.py qr_worker`가 행을 청크 단위로 렌더링해 청크별 ZIP으로 기록하고,
+    모든 청크가 끝나면 하나의 결과 ZIP으로 합친다.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', '대기'
+        RUNNING = 'running', '실행 중'
+        COMPLETED = 'completed', '완료'
+        FAILED = 'failed', '실패'
+
+    class InputFormat(models.TextChoices):
+        CSV = 'csv', 'CSV'
+        NDJSON = 'ndjson', 'NDJSON'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, related_name='qr_jobs', null=True, blank=True, on_delete=models.CASCADE)
+    api_key = models.ForeignKey('accounts.APIKey', related_name='qr_jobs', null=True, blank=True, on_delete=models.SET_NULL)
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING, db_index=True)
+    input_file = models.FileField(upload_to=qr_job_input_path)
+    input_format = models.CharField(max_length=16, choices=InputFormat.choices, default=InputFormat.CSV)
+    options = models.JSONField(default=dict, blank=True, help_text='모든 행에 적용할 기본 파라미터 (type, style, format 등)')
+    chunk_size = models.PositiveIntegerField(default=500)
+    total_items = models.PositiveIntegerField(null=True, blank=True)
+    rendered_items = models.PositiveIntegerField(default=0)
+    failed_items = models.PositiveIntegerField(default=0)
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    result_file = models.FileField(blank=True)
+    worker = models.CharField(max_length=100, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'QR 생성 작업'
+        verbose_name_plural = 'QR 생성 작업들'
+
+    def __str__(self):
+        return f"{self.pk} ({self.status})"
+
+    @property
+    def processed_items(self) -> int:
+        return self.rendered_items + self.failed_items
+
+    @property
+    def job_dir(self) -> str:
+        return f"qr-jobs/{self.pk}"
+
+
+class QRJobChunk(models.Model):
+    """작업의 연속된 행 묶음. 완료된 청크는 재시도할 때 다시 렌더링하지 않는다."""
+
+    job = models.ForeignKey(QRJob, related_name='chunks', on_delete=models.CASCADE)
+    index = models.PositiveIntegerField()
+    start_row = models.PositiveIntegerField()
+    row_count = models.PositiveIntegerField()
+    status = models.CharField(max_length=16, choices=QRJob.Status.choices, default=QRJob.Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    rendered_items = models.PositiveIntegerField(default=0)
+    failed_items = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True, help_text='행별 오류 [{"row": 0, "error": ...}]')
+    archive = models.CharField(max_length=255, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['job', 'index']
+        constraints = [
+            models.UniqueConstraint(fields=['job', 'index'], name='unique_qr_job_chunk'),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id}#{self.index} ({self.status})"
@@ -2,6 +2,8 @@ import re
 from PIL import ImageColor
 
 import phonenumbers
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
 
 from apps.qr.constants.enums import *
@@ -12,6 +14,10 @@ class BaseQRSerializer(serializers.Serializer):
         choices=QRStyles.get_all_styles(),
         default=QRStyles.SQUARE_MODULE.value
     )
+    eye_style = serializers.ChoiceField(
+        choices=QREyeStyles.get_all_eye_styles(),
+        default=QREyeStyles.SQUARE.value
+    )
     fill_color = serializers.CharField(default='black')
     back_color = serializers.CharField(default='white')
     color_mask = serializers.ChoiceField(
@@ -24,6 +30,23 @@ class BaseQRSerializer(serializers.Serializer):
         min_value=0.1,
         max_value=0.5
     )
+    format = serializers.ChoiceField(
+        choices=QROutputFormats.get_all_output_formats(),
+        required=False
+    )
+    size = serializers.IntegerField(required=False, min_value=1)
+    sizes = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=8
+    )
+    formats = serializers.ListField(
+        child=serializers.ChoiceField(choices=QROutputFormats.get_all_output_formats()),
+        required=False,
+        allow_empty=False
+    )
+    border = serializers.IntegerField(default=4, min_value=0, max_value=20)
     
     def _color_validator(self, value):
         """색상 형식 검증"""
@@ -212,4 +235,146 @@ class BitcoinQRSerializer(BaseQRSerializer):
     address = serializers.CharField()
     amount = serializers.FloatField(required=False)
     label = serializers.CharField(required=False, allow_blank=True)
-    message = serializers.CharField(required=False, allow_blank=True)
\ No newline at end of file
+    message = serializers.CharField(required=False, allow_blank=True)
+
+class QRJobCreateSerializer(serializers.Serializer):
+    """대량 QR 코드 생성 작업 업로드 Serializer (나머지 필드는 모든 행에 적용할 기본 파라미터)"""
+    file = serializers.FileField()
+    input_format = serializers.ChoiceField(choices=['csv', 'ndjson'], required=False)
+    type = serializers.CharField(required=False)
+    chunk_size = serializers.IntegerField(required=False, min_value=1, max_value=10000)
+
+    def validate_file(self, value):
+        from apps.qr.jobs import DEFAULT_JOB_MAX_UPLOAD_SIZE
+
+        max_size = getattr(settings, 'QR_JOB_MAX_UPLOAD_SIZE', DEFAULT_JOB_MAX_UPLOAD_SIZE)
+        if value.size > max_size:
+            raise serializers.ValidationError(f"File is too large (max {max_size} bytes).")
+        return value
+
+    def validate_type(self, value):
+        from apps.qr.utils.batch import BATCH_ITEM_TYPES
+
+        if value not in BATCH_ITEM_TYPES:
+            raise serializers.ValidationError(f"Must be one of: {', '.join(BATCH_ITEM_TYPES)}.")
+        return value
+
+
+class QRJobSerializer(serializers.Serializer):
+    """대량 QR 코드 생성 작업 상태 Serializer"""
+    id = serializers.UUIDField()
+    status = serializers.CharField()
+    input_format = serializers.CharField()
+    total_items = serializers.IntegerField(allow_null=True)
+    processed_items = serializers.IntegerField()
+    rendered_items = serializers.IntegerField()
+    failed_items = serializers.IntegerField()
+    progress = serializers.SerializerMethodField()
+    throughput = serializers.SerializerMethodField()
+    chunks = serializers.SerializerMethodField()
+    errors = serializers.SerializerMethodField()
+    attempts = serializers.IntegerField()
+    error = serializers.CharField()
+    created_at = serializers.DateTimeField()
+    started_at = serializers.DateTimeField(allow_null=True)
+    finished_at = serializers.DateTimeField(allow_null=True)
+
+    def get_progress(self, job):
+        """처리된 행 비율 (0-1). 전체 행 수를 세기 전이면 None"""
+        if not job.total_items:
+            return None if job.total_items is None else 1.0
+        return round(job.processed_items / job.total_items, 4)
+
+    def get_throughput(self, job):
+        """초당 처리 행 수"""
+        if job.started_at is None:
+            return None
+        elapsed = ((job.finished_at or timezone.now()) - job.started_at).total_seconds()
+        return round(job.processed_items / elapsed, 2) if elapsed > 0 else None
+
+    def get_chunks(self, job):
+        counts = {'total': 0, 'completed': 0, 'failed': 0}
+        for status in job.chunks.values_list('status', flat=True):
+            counts['total'] += 1
+            if status in counts:
+                counts[status] += 1
+        return counts
+
+    def get_errors(self, job):
+        """행/청크 오류 미리보기"""
+        limit = self.context.get('error_limit', 50)
+        errors = []
+        for chunk_errors in job.chunks.values_list('errors', flat=True):
+            errors.extend(chunk_errors or [])
+            if len(errors) >= limit:
+                break
+        return errors[:limit]
+
+
+class QRSheetSerializer(serializers.Serializer):
+    """
+    라벨 시트 PDF 생성 Serializer
+
+    layout(Avery 규격 이름) 또는 page_size/columns/rows/label_width/label_height(mm)로 격자를 지정한다.
+    """
+    items = serializers.ListField(child=serializers.DictField(), allow_empty=False)
+    layout = serializers.CharField(required=False)
+    page_size = serializers.ChoiceField(choices=['a4', 'letter'], default='a4')
+    columns = serializers.IntegerField(required=False, min_value=1, max_value=20)
+    rows = serializers.IntegerField(required=False, min_value=1, max_value=40)
+    label_width = serializers.FloatField(required=False, min_value=5)
+    label_height = serializers.FloatField(required=False, min_value=5)
+    margin_left = serializers.FloatField(default=0, min_value=0)
+    margin_top = serializers.FloatField(default=0, min_value=0)
+    gap_x = serializers.FloatField(default=0, min_value=0)
+    gap_y = serializers.FloatField(default=0, min_value=0)
+    padding = serializers.FloatField(default=2, min_value=0)
+    fill_color = serializers.CharField(default='black')
+    back_color = serializers.CharField(default='white')
+    border = serializers.IntegerField(default=4, min_value=0, max_value=20)
+
+    def _color_validator(self, value):
+        """색상 형식 검증"""
+        try:
+            ImageColor.getrgb(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+
+    def validate_fill_color(self, value):
+        self._color_validator(value)
+        return value
+
+    def validate_back_color(self, value):
+        self._color_validator(value)
+        return value
+
+    def validate_layout(self, value):
+        from apps.qr.utils.pdf import LABEL_LAYOUTS
+
+        if value not in LABEL_LAYOUTS:
+            raise serializers.ValidationError(f"Must be one of: {', '.join(LABEL_LAYOUTS)}.")
+        return value
+
+    def validate(self, attrs):
+        """지정한 격자를 SheetLayout으로 변환해 sheet_layout에 담는다"""
+        from apps.qr.utils.pdf import LABEL_LAYOUTS, custom_layout
+
+        if 'layout' in attrs:
+            attrs['sheet_layout'] = LABEL_LAYOUTS[attrs['layout']]
+            return attrs
+
+        missing = [name for name in ('columns', 'rows', 'label_width', 'label_height') if name not in attrs]
+        if missing:
+            raise serializers.ValidationError(
+                {name: ["This field is required when no layout is given."] for name in missing}
+            )
+        try:
+            attrs['sheet_layout'] = custom_layout(
+                attrs['page_size'], attrs['columns'], attrs['rows'],
+                attrs['label_width'], attrs['label_height'],
+                margin_left_mm=attrs['margin_left'], margin_top_mm=attrs['margin_top'],
+                gap_x_mm=attrs['gap_x'], gap_y_mm=attrs['gap_y'], padding_mm=attrs['padding'],
+            )
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+        return attrs
@@ -14,23 +14,36 @@ from .views import (
     QrMeCardView,
     QrWhatsAppView,
     QrBitcoinView,
+    QrBatchView,
+    QrSheetView,
+    QrJobCreateView,
+    QrJobDetailView,
+    QrJobDownloadView,
+    QrRenderPoolView,
+    qr_view,
 )
 
 app_name = "qr"
 
 
 urlpatterns = [
-    path("url", QrUrlView.as_view(), name="qr_url_v1"),
-    path("email", QrEmailView.as_view(), name="qr_email_v1"),
-    path("text", QrTextView.as_view(), name="qr_text_v1"),
-    path("phonenumber", QrPhoneNumberView.as_view(), name="qr_phone_number_v1"),
-    path("vcard", QrVcardView.as_view(), name="qr_vcard_v1"),
-    path("wifi", QrWifiView.as_view(), name="qr_wifi_v1"),
-    path("sms", QrSmsView.as_view(), name="qr_sms_v1"),
-    path("geo", QrGeoView.as_view(), name="qr_geo_v1"),
-    path("event", QrEventView.as_view(), name="qr_event_v1"),
-    path("mecard", QrMeCardView.as_view(), name="qr_mecard_v1"),
-    path("whatsapp", QrWhatsAppView.as_view(), name="qr_whatsapp_v1"),
-    path("bitcoin", QrBitcoinView.as_view(), name="qr_bitcoin_v1"),
+    path("url", qr_view(QrUrlView), name="qr_url_v1"),
+    path("email", qr_view(QrEmailView), name="qr_email_v1"),
+    path("text", qr_view(QrTextView), name="qr_text_v1"),
+    path("phonenumber", qr_view(QrPhoneNumberView), name="qr_phone_number_v1"),
+    path("vcard", qr_view(QrVcardView), name="qr_vcard_v1"),
+    path("wifi", qr_view(QrWifiView), name="qr_wifi_v1"),
+    path("sms", qr_view(QrSmsView), name="qr_sms_v1"),
+    path("geo", qr_view(QrGeoView), name="qr_geo_v1"),
+    path("event", qr_view(QrEventView), name="qr_event_v1"),
+    path("mecard", qr_view(QrMeCardView), name="qr_mecard_v1"),
+    path("whatsapp", qr_view(QrWhatsAppView), name="qr_whatsapp_v1"),
+    path("bitcoin", qr_view(QrBitcoinView), name="qr_bitcoin_v1"),
+    path("batch", QrBatchView.as_view(), name="qr_batch_v1"),
+    path("sheet", QrSheetView.as_view(), name="qr_sheet_v1"),
+    path("jobs", QrJobCreateView.as_view(), name="qr_job_create_v1"),
+    path("jobs/<uuid:job_id>", QrJobDetailView.as_view(), name="qr_job_detail_v1"),
+    path("jobs/<uuid:job_id>/download", QrJobDownloadView.as_view(), name="qr_job_download_v1"),
+    path("render-pool", QrRenderPoolView.as_view(), name="qr_render_pool_v1"),
 ]
 
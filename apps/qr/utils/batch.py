@@ -0,0 +1,346 @@
+# qr/utils/batch.py
+"""
+배치 QR 코드 렌더링
+
+검증된 항목들을 프로세스 풀에서 병렬로 렌더링하고, 요청 순서대로 ZIP 스트림에 기록한다.
+동시에 진행 중인 항목 수를 제한하므로 배치 크기와 관계없이 메모리 사용량이 일정하다.
+"""
+import csv
+import inspect
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import zipfile
+from collections import deque
+from concurrent.futures import BrokenExecutor, Executor, Future, ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+
+from apps.qr.serializers import (
+    BitcoinQRSerializer,
+    EmailQRSerializer,
+    EventQRSerializer,
+    GeoQRSerializer,
+    MeCardQRSerializer,
+    PhoneQRSerializer,
+    SMSQRSerializer,
+    TextQRSerializer,
+    UrlQRSerializer,
+    VCardQRSerializer,
+    WhatsAppQRSerializer,
+    WiFiQRSerializer,
+)
+
+from ..constants import QROutputFormats
+from .matrix import QRMatrix
+from .qr_utils import (
+    generate_bitcoin_qr,
+    generate_email_qr,
+    generate_event_qr,
+    generate_geo_qr,
+    generate_mecard_qr,
+    generate_phone_qr,
+    generate_sms_qr,
+    generate_text_qr,
+    generate_url_qr,
+    generate_vcard_qr,
+    generate_whatsapp_qr,
+    generate_wifi_qr,
+)
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = 'manifest.json'
+DEFAULT_BATCH_MAX_ITEMS = 1000
+
+# 배치 항목 type -> (단일 엔드포인트와 같은 시리얼라이저, 생성 함수)
+BATCH_ITEM_TYPES: Dict[str, Tuple[type, Callable[..., bytes]]] = {
+    'url': (UrlQRSerializer, generate_url_qr),
+    'email': (EmailQRSerializer, generate_email_qr),
+    'text': (TextQRSerializer, generate_text_qr),
+    'phonenumber': (PhoneQRSerializer, generate_phone_qr),
+    'vcard': (VCardQRSerializer, generate_vcard_qr),
+    'wifi': (WiFiQRSerializer, generate_wifi_qr),
+    'sms': (SMSQRSerializer, generate_sms_qr),
+    'geo': (GeoQRSerializer, generate_geo_qr),
+    'event': (EventQRSerializer, generate_event_qr),
+    'mecard': (MeCardQRSerializer, generate_mecard_qr),
+    'whatsapp': (WhatsAppQRSerializer, generate_whatsapp_qr),
+    'bitcoin': (BitcoinQRSerializer, generate_bitcoin_qr),
+}
+
+# 배치에서는 업로드 이미지와 여러 해상도(sizes) 요청을 지원하지 않음
+UNSUPPORTED_BATCH_PARAMS = ('sizes', 'formats', 'embedded_image')
+
+INPUT_FORMAT_CSV = 'csv'
+INPUT_FORMAT_NDJSON = 'ndjson'
+
+
+class BatchItem(NamedTuple):
+    """렌더링할 배치 항목 하나 (검증이 끝난 generate_*_qr 인자)"""
+    index: int
+    type: str
+    generator_func: Callable[..., bytes]
+    params: dict
+    output_format: QROutputFormats
+
+    @property
+    def filename(self) -> str:
+        return f"{self.index + 1:05d}-{self.type}.{self.output_format.extension}"
+
+
+def build_batch_item(index: int, raw, defaults: Optional[dict] = None) -> Tuple[Optional[BatchItem], Optional[dict]]:
+    """
+    항목 하나를 검증해 BatchItem으로 변환
+
+    Args:
+        index (int): 배치 내 항목 번호 (0부터)
+        raw (dict): `type`과 해당 단일 엔드포인트 파라미터
+        defaults (dict, optional): 모든 항목에 적용할 기본 파라미터 (항목 값이 우선)
+
+    Returns:
+        tuple: (BatchItem, None) 또는 (None, 오류 dict)
+    """
+    if not isinstance(raw, dict):
+        return None, {'non_field_errors': ['Each item must be an object.']}
+    data = {**(defaults or {}), **raw}
+    item_type = str(data.get('type'))
+    if item_type not in BATCH_ITEM_TYPES:
+        return None, {'type': [f"Must be one of: {', '.join(BATCH_ITEM_TYPES)}."]}
+
+    serializer_class, generator_func = BATCH_ITEM_TYPES[item_type]
+    serializer = serializer_class(data=data)
+    if not serializer.is_valid():
+        return None, serializer.errors
+
+    # 생성 함수가 받는 파라미터만 전달 (단일 엔드포인트와 마찬가지로 요청 값을 그대로 사용)
+    accepted = inspect.signature(generator_func).parameters
+    params = {
+        key: value for key, value in data.items()
+        if key in accepted and key not in UNSUPPORTED_BATCH_PARAMS
+    }
+    output_format = QROutputFormats(serializer.validated_data.get('format', QROutputFormats.PNG))
+    params['output_format'] = output_format
+    return BatchItem(index, item_type, generator_func, params, output_format), None
+
+
+def build_batch_items(rows: Iterable, start: int = 0, defaults: Optional[dict] = None) -> Tuple[List[BatchItem], dict]:
+    """
+    여러 항목을 검증
+
+    Returns:
+        tuple: (BatchItem 목록, 항목 번호별 오류 dict)
+    """
+    items, errors = [], {}
+    for index, raw in enumerate(rows, start):
+        item, error = build_batch_item(index, raw, defaults)
+        if error is not None:
+            errors[index] = error
+        else:
+            items.append(item)
+    return items, errors
+
+
+def guess_input_format(filename: str) -> str:
+    """확장자로 입력 형식 추정 (.ndjson/.jsonl은 NDJSON, 그 외는 CSV)"""
+    return INPUT_FORMAT_NDJSON if filename.lower().endswith(('.ndjson', '.jsonl')) else INPUT_FORMAT_CSV
+
+
+def iter_input_rows(path: str, input_format: str) -> Iterator:
+    """
+    CSV(헤더 행 필요) 또는 NDJSON 파일의 행을 하나씩 읽음 (파일 전체를 메모리에 올리지 않음)
+
+    CSV의 빈 칸은 값이 없는 것으로 보고 제외한다. 잘못된 NDJSON 줄은 그대로 반환해 항목 오류로 기록되게 한다.
+    """
+    with open(path, encoding='utf-8-sig', newline='') as fp:
+        if input_format == INPUT_FORMAT_NDJSON:
+            for line in fp:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    yield line
+        else:
+            for row in csv.DictReader(fp):
+                yield {key: value for key, value in row.items() if key and value not in (None, '')}
+
+
+def _init_worker():
+    """spawn/forkserver로 시작한 워커에서도 Django 설정을 사용할 수 있도록 초기화"""
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+
+
+def render_batch_item(generator_func: Callable[..., bytes], params: dict) -> bytes:
+    """워커 프로세스에서 실행. 렌더링에 실패하면 ValueError"""
+    content = generator_func(**params)
+    if not content:
+        raise ValueError("Failed to generate QR code")
+    return content
+
+
+class _InlineExecutor(Executor):
+    """QR_BATCH_WORKERS가 0일 때 요청 스레드에서 바로 렌더링 (개발/테스트용)"""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+_batch_executor: Optional[Executor] = None
+_batch_executor_lock = threading.Lock()
+
+
+def get_batch_workers() -> int:
+    """배치 렌더링 워커 프로세스 수. None이면 CPU 수, 0이면 요청 스레드에서 렌더링"""
+    workers = getattr(settings, 'QR_BATCH_WORKERS', None)
+    if workers is None:
+        return os.cpu_count() or 1
+    return workers
+
+
+def make_batch_executor(workers: int) -> Executor:
+    """
+    워커 수만큼의 프로세스 풀. 0이면 호출한 스레드에서 바로 렌더링
+
+    풀은 요청 스레드가 도는 웹 워커 안에서 처음 사용할 때 만들어지므로, 다른 스레드가 잡은 락을
+    이어받을 수 있는 fork 대신 QR_BATCH_START_METHOD(기본 forkserver)로 워커를 시작한다.
+    """
+    if workers > 0:
+        context = multiprocessing.get_context(getattr(settings, 'QR_BATCH_START_METHOD', 'forkserver'))
+        return ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker)
+    return _InlineExecutor()
+
+
+def get_batch_executor() -> Executor:
+    """프로세스 전역 배치 렌더링 풀. 요청마다 풀을 만들지 않도록 처음 사용할 때 한 번 생성"""
+    global _batch_executor
+    if _batch_executor is None:
+        with _batch_executor_lock:
+            if _batch_executor is None:
+                _batch_executor = make_batch_executor(get_batch_workers())
+    return _batch_executor
+
+
+def shutdown_batch_executor(wait: bool = True) -> None:
+    """배치 렌더링 풀 종료. 다음 사용 시 설정값으로 다시 생성된다."""
+    global _batch_executor
+    with _batch_executor_lock:
+        executor, _batch_executor = _batch_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def iter_batch_results(
+    items: Iterable[BatchItem],
+    executor: Optional[Executor] = None,
+    window: Optional[int] = None,
+) -> Iterator[tuple]:
+    """
+    항목을 풀에 제출하고 요청 순서대로 (item, content, error)를 반환
+
+    한 번에 window개(기본: 워커 수 * 2)까지만 제출해 두고, 가장 앞의 결과를 꺼낸 뒤 다음 항목을 제출한다.
+    워커 프로세스가 죽어 풀을 더 쓸 수 없으면(BrokenExecutor) 항목 오류로 처리하지 않고 그대로 발생시킨다.
+    """
+    executor = executor or get_batch_executor()
+    window = window or max(1, get_batch_workers() * 2)
+    pending = deque()
+
+    def drain_one():
+        item, future = pending.popleft()
+        try:
+            return item, future.result(), None
+        except BrokenExecutor:
+            raise
+        except Exception as e:
+            logger.warning(f"Batch item {item.index} ({item.type}) failed: {e}")
+            return item, None, str(e)
+
+    for item in items:
+        pending.append((item, executor.submit(render_batch_item, item.generator_func, item.params)))
+        if len(pending) >= window:
+            yield drain_one()
+    while pending:
+        yield drain_one()
+
+
+def iter_batch_matrices(
+    items: Iterable[BatchItem],
+    executor: Optional[Executor] = None,
+    window: Optional[int] = None,
+) -> Iterator[Optional[QRMatrix]]:
+    """
+    항목들을 이미지로 렌더링하지 않고 모듈 행렬로만 인코딩 (라벨 시트 등 벡터 출력용)
+
+    요청 순서대로 반환하며, 실패한 항목은 None.
+    """
+    matrix_items = (
+        item._replace(params={**item.params, 'output_format': QROutputFormats.MATRIX}, output_format=QROutputFormats.MATRIX)
+        for item in items
+    )
+    for _, content, error in iter_batch_results(matrix_items, executor=executor, window=window):
+        yield QRMatrix.from_bytes(content) if error is None else None
+
+
+class _ZipStream:
+    """ZipFile이 기록한 바이트를 모아 두었다가 스트리밍 응답으로 넘기는 쓰기 전용 버퍼 (seek 불가)"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_batch_zip(
+    items: Iterable[BatchItem],
+    executor: Optional[Executor] = None,
+    window: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    배치 렌더링 결과를 ZIP 청크로 스트리밍
+
+    항목마다 파일 하나를 기록하고, 마지막에 항목별 파일명 또는 오류를 담은 manifest.json을 추가한다.
+    """
+    stream = _ZipStream()
+    manifest = []
+    with zipfile.ZipFile(stream, 'w') as archive:
+        for item, content, error in iter_batch_results(items, executor=executor, window=window):
+            entry = {'index': item.index, 'type': item.type}
+            if error is None:
+                compression = zipfile.ZIP_DEFLATED if item.output_format == QROutputFormats.SVG else zipfile.ZIP_STORED
+                archive.writestr(item.filename, content, compress_type=compression)
+                entry['filename'] = item.filename
+            else:
+                entry['error'] = error
+            manifest.append(entry)
+            yield stream.pop()
+
+        archive.writestr(
+            MANIFEST_FILENAME,
+            json.dumps({'items': manifest}, ensure_ascii=False, indent=2),
+            compress_type=zipfile.ZIP_DEFLATED,
+        )
+    yield stream.pop()
@@ -0,0 +1,77 @@
+# qr/utils/bundle.py
+"""
+한 요청에서 여러 해상도/포맷으로 렌더링한 QR 코드를 ZIP 또는 multipart 응답 본문으로 묶는다
+"""
+import logging
+import uuid
+import zipfile
+from io import BytesIO
+from typing import Callable, Iterable, List, NamedTuple, Optional
+
+from ..constants import QROutputFormats
+
+
+logger = logging.getLogger(__name__)
+
+ZIP_CONTENT_TYPE = 'application/zip'
+MULTIPART_CONTENT_TYPE = 'multipart/mixed'
+
+
+class QRVariant(NamedTuple):
+    """한 해상도/포맷으로 렌더링된 QR 코드"""
+    size: int
+    output_format: QROutputFormats
+    content: bytes
+
+    @property
+    def filename(self) -> str:
+        return f"qr-code-{self.size}.{self.output_format.extension}"
+
+
+def render_variants(
+    render: Callable[..., bytes],
+    sizes: Iterable[int],
+    output_formats: Iterable[QROutputFormats],
+) -> List[QRVariant]:
+    """
+    (size, output_format) 조합마다 render(size=..., output_format=...)를 호출
+
+    모듈 행렬, 스프라이트, 그라데이션 레이어는 각각의 캐시에서 공유되므로
+    인코딩은 첫 번째 조합에서 한 번만 일어난다. 중복된 크기/포맷은 한 번만 렌더링한다.
+    """
+    variants = []
+    for size in dict.fromkeys(sizes):
+        for output_format in dict.fromkeys(output_formats):
+            output_format = QROutputFormats(output_format)
+            variants.append(QRVariant(size, output_format, render(size=size, output_format=output_format)))
+    return variants
+
+
+def build_zip(variants: List[QRVariant]) -> bytes:
+    """변형들을 하나의 ZIP으로 묶음. PNG/WebP는 이미 압축되어 있으므로 SVG만 deflate한다."""
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for variant in variants:
+            compression = zipfile.ZIP_DEFLATED if variant.output_format == QROutputFormats.SVG else zipfile.ZIP_STORED
+            archive.writestr(variant.filename, variant.content, compress_type=compression)
+    return buffer.getvalue()
+
+
+def build_multipart(variants: List[QRVariant], boundary: Optional[str] = None) -> tuple:
+    """
+    변형들을 multipart/mixed 본문으로 묶음
+
+    Returns:
+        tuple: (본문 bytes, boundary가 포함된 Content-Type)
+    """
+    boundary = boundary or uuid.uuid4().hex
+    body = BytesIO()
+    for variant in variants:
+        body.write(f"--{boundary}\r\n".encode('ascii'))
+        body.write(f"Content-Type: {variant.output_format.content_type}\r\n".encode('ascii'))
+        body.write(f'Content-Disposition: inline; filename="{variant.filename}"\r\n'.encode('ascii'))
+        body.write(f"Content-Length: {len(variant.content)}\r\n\r\n".encode('ascii'))
+        body.write(variant.content)
+        body.write(b"\r\n")
+    body.write(f"--{boundary}--\r\n".encode('ascii'))
+    return body.getvalue(), f"{MULTIPART_CONTENT_TYPE}; boundary={boundary}"
@@ -0,0 +1,225 @@
+# qr/utils/cache.py
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from PIL import Image
+
+
+logger = logging.getLogger(__name__)
+
+# 렌더러 출력이 바뀌면 올려서 공유 캐시(2차 티어)에 남은 이전 결과를 무효화
+RENDER_CACHE_VERSION = 1
+
+DEFAULT_RENDER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class LRUByteCache:
+    """
+    저장된 값의 바이트 크기 합으로 용량을 제한하는 스레드 안전 LRU 캐시
+
+    Args:
+        max_bytes (int): 캐시 전체 용량(바이트). 초과하면 가장 오래 사용되지 않은 항목부터 제거.
+        max_item_bytes (int, optional): 단일 항목 최대 크기. 이보다 큰 값은 저장하지 않음.
+        sizeof (Callable): 값의 크기를 계산하는 함수. 기본값은 len.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_item_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = len,
+    ):
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes if max_item_bytes is not None else max_bytes
+        self.sizeof = sizeof
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> bool:
+        """값 저장. 단일 항목 크기 제한을 넘으면 저장하지 않고 False 반환"""
+        size = self.sizeof(value)
+        if size > self.max_item_bytes:
+            return False
+
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+            self._data[key] = (value, size)
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes and self._data:
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+        return True
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is not None:
+                self.current_bytes -= entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'entries': len(self._data),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RenderCache:
+    """
+    렌더링된 QR 코드 이미지(bytes) 캐시
+
+    1차 티어는 프로세스 내 LRUByteCache, 2차 티어는 선택적인 Django 캐시 백엔드.
+    2차 티어에서 찾은 값은 1차 티어로 승격된다.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_item_bytes: Optional[int] = None,
+        backend_alias: Optional[str] = None,
+        backend_timeout: Optional[int] = None,
+        key_prefix: str = 'qr-render',
+    ):
+        self.local = LRUByteCache(max_bytes, max_item_bytes=max_item_bytes)
+        self.backend_alias = backend_alias
+        self.backend_timeout = backend_timeout
+        self.key_prefix = key_prefix
+        self.backend_hits = 0
+
+    @property
+    def backend(self):
+        if not self.backend_alias:
+            return None
+        return caches[self.backend_alias]
+
+    def _backend_key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self.local.get(key)
+        if value is not None or self.backend is None:
+            return value
+
+        try:
+            value = self.backend.get(self._backend_key(key))
+        except Exception as e:
+            logger.warning(f"Render cache backend get failed: {e}")
+            return None
+        if value is not None:
+            self.backend_hits += 1
+            self.local.set(key, value)
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        self.local.set(key, value)
+        if self.backend is None:
+            return
+        try:
+            self.backend.set(self._backend_key(key), value, timeout=self.backend_timeout)
+        except Exception as e:
+            logger.warning(f"Render cache backend set failed: {e}")
+
+    def clear(self) -> None:
+        """프로세스 내 캐시만 비운다. 공유 백엔드는 다른 워커도 사용하므로 건드리지 않음"""
+        self.local.clear()
+        self.backend_hits = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.local.stats(),
+            'backend': self.backend_alias,
+            'backend_hits': self.backend_hits,
+        }
+
+
+def _normalize_key_part(value: Any) -> Any:
+    """Enum, 튜플 등을 JSON 직렬화 가능한 형태로 정규화"""
+    if hasattr(value, 'value'):  # QRStyles 등 Enum
+        return value.value
+    if isinstance(value, (tuple, list)):
+        return [_normalize_key_part(v) for v in value]
+    return value
+
+
+def make_render_key(**parts) -> str:
+    """
+    렌더링 입력값으로부터 정규화된 캐시 키(sha256 hex)를 생성
+
+    인자 순서와 관계없이 같은 입력이면 같은 키를 반환한다.
+    """
+    normalized = {name: _normalize_key_part(value) for name, value in parts.items()}
+    normalized['_v'] = RENDER_CACHE_VERSION
+    canonical = json.dumps(normalized, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def image_digest(image: Optional[Image.Image]) -> Optional[str]:
+    """임베드 이미지의 내용 기반 해시. 이미지가 없으면 None"""
+    if image is None:
+        return None
+    digest = hashlib.sha256()
+    digest.update(f"{image.mode}:{image.size[0]}x{image.size[1]}:".encode('ascii'))
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+_render_cache: Optional[RenderCache] = None
+_render_cache_lock = threading.Lock()
+
+
+def get_render_cache() -> RenderCache:
+    """settings 기반으로 생성된 프로세스 전역 렌더 캐시 반환"""
+    global _render_cache
+    if _render_cache is None:
+        with _render_cache_lock:
+            if _render_cache is None:
+                max_bytes = getattr(settings, 'QR_RENDER_CACHE_MAX_BYTES', DEFAULT_RENDER_CACHE_MAX_BYTES)
+                _render_cache = RenderCache(
+                    max_bytes=max_bytes,
+                    max_item_bytes=getattr(settings, 'QR_RENDER_CACHE_MAX_ITEM_BYTES', max_bytes // 8),
+                    backend_alias=getattr(settings, 'QR_RENDER_CACHE_BACKEND', None),
+                    backend_timeout=getattr(settings, 'QR_RENDER_CACHE_TIMEOUT', 60 * 60 * 24),
+                )
+    return _render_cache
@@ -0,0 +1,196 @@
+# qr/utils/colormasks.py
+"""
+qrcode.image.styles.colormasks의 컬러 마스크를 NumPy로 벡터화한 구현
+
+qrcode의 QRColorMask.apply_mask는 픽셀마다 get_fg_pixel을 호출하는 Python 루프라
+버전이 큰 QR 코드에서는 수 초가 걸린다. 여기의 마스크들은 생성자 인자와 결과 픽셀은
+그대로 두고, 그라데이션 색상 필드와 전경/배경 혼합을 배열 연산으로 한 번에 계산한다.
+"""
+import logging
+import threading
+from typing import List, Optional, Sequence
+
+import numpy as np
+from django.conf import settings
+from PIL import Image
+from qrcode.image.styles import colormasks
+
+from .cache import LRUByteCache
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GRADIENT_LAYER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+_layer_cache: Optional[LRUByteCache] = None
+_layer_cache_lock = threading.Lock()
+
+
+def get_gradient_layer_cache() -> LRUByteCache:
+    """
+    그라데이션 색상 레이어 캐시 반환
+
+    그라데이션 필드는 QR 데이터와 무관하게 (마스크 종류, 픽셀 크기, 색상)으로만 결정되므로
+    같은 브랜드 그라데이션을 쓰는 요청끼리 공유한다.
+    """
+    global _layer_cache
+    if _layer_cache is None:
+        with _layer_cache_lock:
+            if _layer_cache is None:
+                _layer_cache = LRUByteCache(
+                    getattr(settings, 'QR_GRADIENT_LAYER_CACHE_MAX_BYTES', DEFAULT_GRADIENT_LAYER_CACHE_MAX_BYTES),
+                    sizeof=lambda layer: layer.nbytes,
+                )
+    return _layer_cache
+
+
+def _interp_channels(color1: Sequence[int], color2: Sequence[int], norm: np.ndarray, channels: int) -> List[np.ndarray]:
+    """
+    QRColorMask.interp_color의 벡터화 버전: int(color2 * norm + color1 * (1 - norm))
+
+    color에 알파 채널이 없고 이미지가 RGBA인 경우 알파는 255(불투명)로 채운다.
+    """
+    result = []
+    for i in range(channels):
+        if i >= len(color1) or i >= len(color2):
+            result.append(np.full(norm.shape, 255.0))
+            continue
+        result.append(np.trunc(color2[i] * norm + color1[i] * (1 - norm)))
+    return result
+
+
+class VectorizedColorMaskMixin:
+    """
+    apply_mask를 배열 연산으로 대체하는 Mixin
+
+    하위 클래스는 get_fg_channels(width, height, channels)와 layer_colors()를 구현한다.
+    (위치와 무관한 마스크는 get_layer를 직접 구현해도 된다)
+    """
+
+    def get_fg_channels(self, width: int, height: int, channels: int) -> List[np.ndarray]:
+        """채널별 전경색 필드. 각 배열은 (height, width)로 브로드캐스트 가능해야 한다."""
+        raise NotImplementedError("VectorizedColorMaskMixin.get_fg_channels")
+
+    def layer_colors(self) -> tuple:
+        """그라데이션 필드를 결정하는 색상들 (레이어 캐시 키)"""
+        raise NotImplementedError("VectorizedColorMaskMixin.layer_colors")
+
+    def get_layer(self, width: int, height: int, channels: int) -> np.ndarray:
+        """
+        (height, width, channels) uint8 전경색 레이어 반환
+
+        레이어 캐시에 있으면 재사용한다. 반환된 배열은 읽기 전용.
+        """
+        cache = get_gradient_layer_cache()
+        key = (type(self).__name__, width, height, channels, self.layer_colors())
+        layer = cache.get(key)
+        if layer is None:
+            layer = np.empty((height, width, channels), dtype=np.uint8)
+            for i, channel in enumerate(self.get_fg_channels(width, height, channels)):
+                layer[..., i] = np.clip(channel, 0, 255)
+            layer.setflags(write=False)
+            cache.set(key, layer)
+        return layer
+
+    def apply_mask(self, image: Image.Image, use_cache: bool = False):
+        width, height = image.size
+        pixels = np.asarray(image)
+        channels = len(self.back_color)
+        back = [float(c) for c in self.back_color]
+        paint = [float(c) for c in self.paint_color[:channels]]
+
+        # 배경색 그대로인 픽셀은 건드리지 않음
+        untouched = np.all(pixels[..., :channels] == np.array(self.back_color, dtype=pixels.dtype), axis=-1)
+        result = np.array(pixels)
+
+        # extrap_color: 배경색 → paint_color 사이에서 현재 픽셀의 보간 계수 (채널 평균)
+        varying = [i for i in range(channels) if back[i] != paint[i]]
+        if not varying:
+            for i in range(channels):
+                result[..., i] = np.where(untouched, pixels[..., i], back[i])
+        else:
+            norm = np.zeros((height, width))
+            for i in varying:
+                norm += (pixels[..., i] - back[i]) / (paint[i] - back[i])
+            norm /= len(varying)
+            layer = self.get_layer(width, height, channels)
+
+            if np.all(untouched | (norm == 1)):
+                # 안티앨리어싱 픽셀이 없으면 모듈 마스크로 레이어를 그대로 합성
+                result[..., :channels] = np.where(untouched[..., None], pixels[..., :channels], layer)
+            else:
+                for i in range(channels):
+                    blended = np.trunc(layer[..., i] * norm + back[i] * (1 - norm))
+                    result[..., i] = np.where(untouched, pixels[..., i], np.clip(blended, 0, 255))
+
+        if result.shape[-1] > channels:
+            # 색상에 알파가 없는 경우 qrcode와 동일하게 불투명 처리
+            result[..., channels:] = np.where(untouched[..., None], pixels[..., channels:], 255)
+
+        image.paste(Image.fromarray(result))
+
+
+class RadialGradiantColorMask(VectorizedColorMaskMixin, colormasks.RadialGradiantColorMask):
+    """중심에서 가장자리로 퍼지는 원형 그라데이션 (벡터화)"""
+
+    def layer_colors(self):
+        return (tuple(self.center_color), tuple(self.edge_color))
+
+    def get_fg_channels(self, width, height, channels):
+        xs = np.arange(width, dtype=np.float64)[None, :]
+        ys = np.arange(height, dtype=np.float64)[:, None]
+        distance = np.sqrt((xs - width / 2) ** 2 + (ys - width / 2) ** 2) / (np.sqrt(2) * width / 2)
+        return _interp_channels(self.center_color, self.edge_color, distance, channels)
+
+
+class SquareGradiantColorMask(VectorizedColorMaskMixin, colormasks.SquareGradiantColorMask):
+    """중심에서 가장자리로 퍼지는 사각형 그라데이션 (벡터화)"""
+
+    def layer_colors(self):
+        return (tuple(self.center_color), tuple(self.edge_color))
+
+    def get_fg_channels(self, width, height, channels):
+        xs = np.arange(width, dtype=np.float64)[None, :]
+        ys = np.arange(height, dtype=np.float64)[:, None]
+        distance = np.maximum(np.abs(xs - width / 2), np.abs(ys - width / 2)) / (width / 2)
+        return _interp_channels(self.center_color, self.edge_color, distance, channels)
+
+
+class HorizontalGradiantColorMask(VectorizedColorMaskMixin, colormasks.HorizontalGradiantColorMask):
+    """왼쪽에서 오른쪽으로 변하는 그라데이션 (벡터화)"""
+
+    def layer_colors(self):
+        return (tuple(self.left_color), tuple(self.right_color))
+
+    def get_fg_channels(self, width, height, channels):
+        ratio = np.arange(width, dtype=np.float64)[None, :] / width
+        return _interp_channels(self.left_color, self.right_color, ratio, channels)
+
+
+class VerticalGradiantColorMask(VectorizedColorMaskMixin, colormasks.VerticalGradiantColorMask):
+    """위에서 아래로 변하는 그라데이션 (벡터화)"""
+
+    def layer_colors(self):
+        return (tuple(self.top_color), tuple(self.bottom_color))
+
+    def get_fg_channels(self, width, height, channels):
+        ratio = np.arange(height, dtype=np.float64)[:, None] / width
+        return _interp_channels(self.top_color, self.bottom_color, ratio, channels)
+
+
+class SolidFillColorMask(VectorizedColorMaskMixin, colormasks.SolidFillColorMask):
+    """단색 마스크 (벡터화). 안티앨리어싱된 가장자리도 qrcode와 같은 색으로 혼합한다."""
+
+    def layer_colors(self):
+        return (tuple(self.front_color),)
+
+    def get_layer(self, width, height, channels):
+        # 위치와 무관한 단색이므로 캐시하지 않고 브로드캐스트만 한다
+        color = list(self.front_color[:channels]) + [255] * (channels - len(self.front_color))
+        return np.broadcast_to(np.array(color, dtype=np.uint8), (height, width, channels))
+
+    def apply_mask(self, image, use_cache=False):
+        if self.back_color == (255, 255, 255) and self.front_color == (0, 0, 0):
+            # 모듈 드로어가 이미 흑백으로 그렸으므로 할 일이 없음
+            return
+        super().apply_mask(image)
@@ -0,0 +1,194 @@
+# qr/utils/cost.py
+"""
+QR 렌더링 비용 추정과 빠른/느린 레인
+
+렌더링 시간은 렌더링 전에 대부분 예측할 수 있다: 페이로드 길이로 QR 버전(모듈 수)이 정해지고,
+box_size로 픽셀 수가, 스타일/그라데이션/임베드 이미지로 픽셀당 비용이 정해진다.
+비용이 큰 요청은 동시 실행 수가 제한된 느린 레인에서 렌더링해, 단순한 SQUARE/SOLID_FILL 요청이 그 뒤에 밀리지 않게 한다.
+
+비용 단위는 CPU 코어 하나에서의 대략적인 렌더링 시간(ms)이다.
+"""
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Optional
+
+from django.conf import settings
+from qrcode.constants import ERROR_CORRECT_H, ERROR_CORRECT_L
+from qrcode.util import BIT_LIMIT_TABLE
+
+from ..constants import QRColorMasks, QREyeStyles, QROutputFormats, QRStyles
+from .pool import RenderPoolFull
+from .sizing import DEFAULT_BORDER, PixelBudgetExceeded, get_max_image_pixels, resolve_box_size
+
+
+logger = logging.getLogger(__name__)
+
+COST_HEADER = 'X-QR-Render-Cost'
+LANE_HEADER = 'X-QR-Render-Lane'
+FAST_LANE = 'fast'
+SLOW_LANE = 'slow'
+
+DEFAULT_SLOW_LANE_THRESHOLD = 100.0
+
+# 페이로드 길이 계산에서 제외할 렌더링 옵션 (요청 파라미터에서 바로 추정하는 경우의 format, sizes, 서명 포함)
+RENDER_OPTION_PARAMS = frozenset((
+    'style', 'eye_style', 'fill_color', 'back_color', 'color_mask', 'embedded_image',
+    'embedded_image_ratio', 'size', 'border', 'output_format',
+    'format', 'sizes', 'formats', 'sig', 'expires',
+))
+# 스킴/구분자(WIFI:, BEGIN:VCARD 등)를 고려한 페이로드 여유분
+PAYLOAD_OVERHEAD = 16
+
+# 측정값 기반 비용 계수 (ms)
+BASE_COST = 0.5
+SQUARE_COST_PER_MEGAPIXEL = 4.0      # NumPy 사각 모듈 렌더러 + PNG 인코딩
+STYLED_COST_PER_MEGAPIXEL = 16.0     # StyledPilImage 모듈 드로어
+EMBEDDED_IMAGE_COST_PER_MEGAPIXEL = 6.0
+GRADIENT_FACTOR = 8.0                # 그라데이션 색상 마스크 합성
+WEBP_COST_PER_MEGAPIXEL = 18.0       # 무손실 WebP 인코딩 추가 비용
+SVG_COST_PER_MODULE = 0.001
+STYLED_SVG_COST_PER_MODULE = 0.004
+
+
+def estimate_version(payload_length: int, error_correction: int = ERROR_CORRECT_L) -> int:
+    """바이트 모드 기준으로 페이로드가 들어가는 가장 작은 QR 버전 (숫자/영숫자 모드보다 크거나 같음)"""
+    for version in range(1, 41):
+        length_bits = 8 if version < 10 else 16
+        if 4 + length_bits + 8 * payload_length <= BIT_LIMIT_TABLE[error_correction][version]:
+            return version
+    return 40
+
+
+def payload_length(params: dict) -> int:
+    """생성 함수 파라미터 중 렌더링 옵션을 제외한 값들의 길이로 페이로드 길이를 추정"""
+    return PAYLOAD_OVERHEAD + sum(
+        len(str(value)) for key, value in params.items()
+        if key not in RENDER_OPTION_PARAMS and value is not None
+    )
+
+
+def estimate_render_cost(params: dict) -> float:
+    """
+    generate_*_qr 파라미터 하나의 예상 렌더링 비용(ms)
+
+    Args:
+        params (dict): 생성 함수에 넘길 파라미터 (output_format, size, style 등 포함)
+    """
+    output_format = QROutputFormats(params.get('output_format') or QROutputFormats.PNG)
+    if output_format in QROutputFormats.get_matrix_formats():
+        return BASE_COST
+
+    embedded_image = params.get('embedded_image') is not None
+    error_correction = ERROR_CORRECT_H if embedded_image else ERROR_CORRECT_L
+    modules = 17 + 4 * estimate_version(payload_length(params), error_correction)
+
+    style = params.get('style') or QRStyles.SQUARE_MODULE
+    eye_style = params.get('eye_style') or QREyeStyles.SQUARE
+    styled = style != QRStyles.SQUARE_MODULE or eye_style != QREyeStyles.SQUARE or embedded_image
+    gradient = (params.get('color_mask') or QRColorMasks.SOLID_FILL) != QRColorMasks.SOLID_FILL
+
+    if output_format == QROutputFormats.SVG:
+        per_module = STYLED_SVG_COST_PER_MODULE if styled else SVG_COST_PER_MODULE
+        return BASE_COST + per_module * modules * modules
+
+    border = int(params.get('border') if params.get('border') is not None else DEFAULT_BORDER)
+    size = int(params['size']) if params.get('size') else None
+    try:
+        side = (modules + 2 * border) * resolve_box_size(modules, border=border, size=size)
+    except PixelBudgetExceeded:
+        side = get_max_image_pixels()
+    megapixels = side * side / 1e6
+
+    per_megapixel = STYLED_COST_PER_MEGAPIXEL if styled else SQUARE_COST_PER_MEGAPIXEL
+    if gradient:
+        per_megapixel *= GRADIENT_FACTOR
+    if embedded_image:
+        per_megapixel += EMBEDDED_IMAGE_COST_PER_MEGAPIXEL
+    if output_format == QROutputFormats.WEBP:
+        per_megapixel += WEBP_COST_PER_MEGAPIXEL
+    return BASE_COST + per_megapixel * megapixels
+
+
+def estimate_request_cost(
+    params: dict,
+    sizes: Optional[Iterable[int]] = None,
+    output_formats: Optional[Iterable[QROutputFormats]] = None,
+) -> float:
+    """여러 해상도/포맷 요청(sizes, formats)은 렌더링할 조합의 비용 합"""
+    if not sizes:
+        return estimate_render_cost(params)
+    return sum(
+        estimate_render_cost({**params, 'size': size, 'output_format': output_format})
+        for size in dict.fromkeys(sizes)
+        for output_format in dict.fromkeys(output_formats or [params.get('output_format')])
+    )
+
+
+class RenderLaneFull(RenderPoolFull):
+    """느린 레인이 가득 차 제한 시간 안에 차례가 오지 않음"""
+
+
+class RenderLane:
+    """
+    동시 렌더링 수를 제한하는 레인
+
+    Args:
+        name (str): 레인 이름 (응답 헤더에 표시)
+        concurrency (int): 프로세스당 동시 렌더링 수 (0이면 제한 없음)
+        queue_timeout (float): 차례를 기다리는 최대 시간(초). 초과하면 RenderLaneFull
+    """
+
+    def __init__(self, name: str, concurrency: int = 0, queue_timeout: float = 0.0):
+        self.name = name
+        self.concurrency = concurrency
+        self.queue_timeout = queue_timeout
+        self._semaphore = threading.BoundedSemaphore(concurrency) if concurrency else None
+
+    @contextmanager
+    def slot(self):
+        if self._semaphore is None:
+            yield
+            return
+        if not self._semaphore.acquire(timeout=self.queue_timeout):
+            raise RenderLaneFull(f"Render lane '{self.name}' is full")
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+
+_lanes = {}
+_lanes_lock = threading.Lock()
+
+
+def get_render_lane(cost: float) -> RenderLane:
+    """
+    예상 비용이 QR_SLOW_LANE_THRESHOLD 이상이면 느린 레인, 아니면 빠른 레인
+
+    느린 레인의 동시 렌더링 수는 QR_SLOW_LANE_CONCURRENCY (렌더 풀을 쓰는 경우 풀 워커 수보다 작게 두어야
+    빠른 레인이 사용할 워커가 남는다). 빠른 레인은 제한하지 않는다.
+    """
+    threshold = getattr(settings, 'QR_SLOW_LANE_THRESHOLD', DEFAULT_SLOW_LANE_THRESHOLD)
+    name = SLOW_LANE if cost >= threshold else FAST_LANE
+    lane = _lanes.get(name)
+    if lane is None:
+        with _lanes_lock:
+            lane = _lanes.get(name)
+            if lane is None:
+                if name == SLOW_LANE:
+                    lane = RenderLane(
+                        name,
+                        concurrency=getattr(settings, 'QR_SLOW_LANE_CONCURRENCY', 1),
+                        queue_timeout=getattr(settings, 'QR_SLOW_LANE_QUEUE_TIMEOUT', 0.5),
+                    )
+                else:
+                    lane = RenderLane(name)
+                _lanes[name] = lane
+    return lane
+
+
+def reset_render_lanes() -> None:
+    """설정이 바뀌었을 때 레인을 다시 만들도록 초기화 (테스트용)"""
+    with _lanes_lock:
+        _lanes.clear()
@@ -0,0 +1,216 @@
+# qr/utils/matrix.py
+import base64
+import logging
+import threading
+from typing import List, Optional
+
+from django.conf import settings
+from qrcode.constants import ERROR_CORRECT_H, ERROR_CORRECT_L, ERROR_CORRECT_M, ERROR_CORRECT_Q
+from qrcode.main import QRCode
+
+from .cache import LRUByteCache
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MATRIX_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# 직렬화에 쓰는 오류 정정 레벨 순서 (qrcode 상수값이 아닌 L/M/Q/H 순서의 인덱스로 저장)
+ERROR_CORRECTION_LEVELS = (ERROR_CORRECT_L, ERROR_CORRECT_M, ERROR_CORRECT_Q, ERROR_CORRECT_H)
+ERROR_CORRECTION_NAMES = dict(zip(ERROR_CORRECTION_LEVELS, 'LMQH'))
+
+# to_bytes 헤더: size, version, 오류 정정 레벨 인덱스, mask_pattern (각 1바이트)
+MATRIX_HEADER_SIZE = 4
+
+
+def _pack_rows(modules: List[List[bool]]) -> bytes:
+    """모듈 행렬을 행 단위로 비트 패킹 (MSB 우선, 각 행은 바이트 경계까지 0으로 패딩)"""
+    packed = bytearray()
+    for row in modules:
+        value = 0
+        for module in row:
+            value = (value << 1) | (1 if module else 0)
+        padding = (-len(row)) % 8
+        packed += (value << padding).to_bytes((len(row) + padding) // 8, 'big')
+    return bytes(packed)
+
+
+class QRMatrix:
+    """
+    인코딩이 끝난 QR 모듈 행렬
+
+    스타일과 무관한 QR 코드의 결과물로, 렌더링 없이 재사용할 수 있도록
+    행 단위 비트 패킹된 bytes로 보관한다. (numpy.packbits(axis=1)과 같은 배치)
+
+    Attributes:
+        size (int): 한 변의 모듈 수 (version * 4 + 17)
+        version (int): QR 코드 버전 (1-40)
+        error_correction (int): 오류 정정 레벨 (qrcode.constants.ERROR_CORRECT_*)
+        mask_pattern (int): 적용된 마스크 패턴 (0-7)
+        packed (bytes): 비트 패킹된 모듈 데이터
+    """
+
+    __slots__ = ('size', 'version', 'error_correction', 'mask_pattern', 'packed')
+
+    def __init__(self, size: int, version: int, error_correction: int, mask_pattern: int, packed: bytes):
+        self.size = size
+        self.version = version
+        self.error_correction = error_correction
+        self.mask_pattern = mask_pattern
+        self.packed = packed
+
+    @classmethod
+    def from_qrcode(cls, qr: QRCode, mask_pattern: int) -> "QRMatrix":
+        return cls(
+            size=qr.modules_count,
+            version=qr.version,
+            error_correction=qr.error_correction,
+            mask_pattern=mask_pattern,
+            packed=_pack_rows(qr.modules),
+        )
+
+    @property
+    def row_bytes(self) -> int:
+        return (self.size + 7) // 8
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.packed)
+
+    def is_dark(self, row: int, col: int) -> bool:
+        byte = self.packed[row * self.row_bytes + col // 8]
+        return bool(byte & (0x80 >> (col % 8)))
+
+    def rows(self) -> List[List[bool]]:
+        """모듈 행렬을 bool 2차원 리스트로 펼쳐서 반환"""
+        row_bytes = self.row_bytes
+        last_bit = row_bytes * 8 - 1
+        result = []
+        for r in range(self.size):
+            value = int.from_bytes(self.packed[r * row_bytes:(r + 1) * row_bytes], 'big')
+            result.append([bool((value >> (last_bit - c)) & 1) for c in range(self.size)])
+        return result
+
+    def to_qrcode(self, box_size: int = 10, border: int = 4) -> QRCode:
+        """
+        qrcode 이미지 팩토리로 렌더링할 수 있도록 QRCode 객체를 복원
+
+        인코딩(버전 탐색, Reed-Solomon)은 다시 수행하지 않는다.
+        """
+        qr = QRCode(
+            version=self.version,
+            error_correction=self.error_correction,
+            box_size=box_size,
+            border=border,
+            mask_pattern=self.mask_pattern,
+        )
+        qr.modules = self.rows()
+        qr.modules_count = self.size
+        # make_image()는 data_cache가 None이면 make()를 다시 호출하므로 채워둔다
+        qr.data_cache = self.packed
+        return qr
+
+    def to_bytes(self) -> bytes:
+        """
+        바이너리 직렬화
+
+        4바이트 헤더(size, version, 오류 정정 레벨 0-3 = L/M/Q/H, mask_pattern) 뒤에
+        행 단위 비트 패킹 데이터(MSB 우선, 행마다 바이트 경계까지 패딩)가 이어진다.
+        """
+        header = bytes((
+            self.size,
+            self.version,
+            ERROR_CORRECTION_LEVELS.index(self.error_correction),
+            self.mask_pattern,
+        ))
+        return header + self.packed
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "QRMatrix":
+        size, version, level, mask_pattern = data[:MATRIX_HEADER_SIZE]
+        return cls(
+            size=size,
+            version=version,
+            error_correction=ERROR_CORRECTION_LEVELS[level],
+            mask_pattern=mask_pattern,
+            packed=bytes(data[MATRIX_HEADER_SIZE:]),
+        )
+
+    def to_dict(self) -> dict:
+        """JSON 응답용 메타데이터와 base64 인코딩된 비트 패킹 데이터"""
+        return {
+            'version': self.version,
+            'size': self.size,
+            'error_correction': ERROR_CORRECTION_NAMES[self.error_correction],
+            'mask_pattern': self.mask_pattern,
+            'row_bytes': self.row_bytes,
+            'data': base64.b64encode(self.packed).decode('ascii'),
+        }
+
+    def __eq__(self, other):
+        if not isinstance(other, QRMatrix):
+            return NotImplemented
+        return (
+            self.size == other.size
+            and self.version == other.version
+            and self.error_correction == other.error_correction
+            and self.mask_pattern == other.mask_pattern
+            and self.packed == other.packed
+        )
+
+    def __repr__(self):
+        return f"<QRMatrix version={self.version} size={self.size} ecc={self.error_correction} mask={self.mask_pattern}>"
+
+
+def encode_qr_matrix(data: str, error_correction: int = ERROR_CORRECT_L, version: Optional[int] = None) -> QRMatrix:
+    """
+    데이터를 QR 모듈 행렬로 인코딩 (캐시 사용 안 함)
+
+    qr.make(fit=True)와 같은 과정이지만, 선택된 마스크 패턴을 메타데이터로 남긴다.
+    """
+    qr = QRCode(version=version, error_correction=error_correction)
+    qr.add_data(data)
+    qr.best_fit(start=version)  # fit=True: QR code Version(size)를 자동으로 조절
+    mask_pattern = qr.best_mask_pattern()
+    qr.makeImpl(False, mask_pattern)
+    return QRMatrix.from_qrcode(qr, mask_pattern)
+
+
+_matrix_cache: Optional[LRUByteCache] = None
+_matrix_cache_lock = threading.Lock()
+
+
+def get_matrix_cache() -> LRUByteCache:
+    """렌더 캐시와 별도로 관리되는 프로세스 전역 모듈 행렬 캐시 반환"""
+    global _matrix_cache
+    if _matrix_cache is None:
+        with _matrix_cache_lock:
+            if _matrix_cache is None:
+                _matrix_cache = LRUByteCache(
+                    getattr(settings, 'QR_MATRIX_CACHE_MAX_BYTES', DEFAULT_MATRIX_CACHE_MAX_BYTES),
+                    sizeof=lambda matrix: matrix.nbytes,
+                )
+    return _matrix_cache
+
+
+def get_qr_matrix(data: str, error_correction: int = ERROR_CORRECT_L, version: Optional[int] = None) -> QRMatrix:
+    """
+    (data, error_correction, version)에 해당하는 QR 모듈 행렬 반환
+
+    스타일/색상만 바뀐 요청은 캐시된 행렬을 재사용하므로 인코딩을 건너뛴다.
+
+    Args:
+        data (str): QR 코드에 인코딩할 문자열
+        error_correction (int): 오류 정정 레벨
+        version (int, optional): 최소 버전. None이면 데이터에 맞춰 자동 결정
+
+    Returns:
+        QRMatrix: 비트 패킹된 모듈 행렬
+    """
+    cache = get_matrix_cache()
+    key = (data, int(error_correction), version)
+    matrix = cache.get(key)
+    if matrix is None:
+        matrix = encode_qr_matrix(data, error_correction=error_correction, version=version)
+        cache.set(key, matrix)
+    return matrix
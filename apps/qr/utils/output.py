@@ -0,0 +1,101 @@
+# qr/utils/output.py
+"""
+렌더링된 QR 이미지(또는 모듈 행렬)를 응답 포맷으로 인코딩하는 출력 단계
+
+QR 코드는 색 수가 적으므로, 가능한 경우 팔레트(인덱스) PNG로 비트 깊이를 줄여 저장하고
+클라이언트가 허용하면 무손실 WebP로 내보낸다.
+"""
+import json
+import logging
+from typing import BinaryIO
+
+import numpy as np
+from django.conf import settings
+from PIL import Image
+
+from ..constants import QROutputFormats
+from .matrix import QRMatrix
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PNG_COMPRESS_LEVEL = 6
+DEFAULT_WEBP_METHOD = 4
+
+# 팔레트 PNG로 바꿀 수 있는 최대 색 수
+MAX_PALETTE_COLORS = 256
+
+
+def _bits_for(colors: int) -> int:
+    for bits in (1, 2, 4):
+        if colors <= 1 << bits:
+            return bits
+    return 8
+
+
+def to_indexed(image: Image.Image) -> Image.Image:
+    """
+    사용된 색이 256개 이하인 RGB/L 이미지를 같은 색의 팔레트('P') 이미지로 변환
+
+    단색 QR과 안티앨리어싱된 스타일 QR은 대부분 여기에 해당한다. 색이 더 많거나
+    알파 채널이 있으면 원본을 그대로 반환한다.
+    """
+    if image.mode not in ('RGB', 'L'):
+        return image
+    colors = image.getcolors(MAX_PALETTE_COLORS)
+    if colors is None:
+        return image
+
+    # 실제로 쓰인 색을 그대로 팔레트로 쓰고 각 픽셀을 정확히 같은 색의 인덱스로 매핑하므로 픽셀 값은 바뀌지 않는다
+    # (quantize는 가까운 팔레트 색으로 매핑해 안티앨리어싱된 이미지의 색이 바뀔 수 있음)
+    pixels = np.asarray(image)
+    if image.mode == 'RGB':
+        pixels = pixels.astype(np.uint32)
+        pixels = (pixels[..., 0] << 16) | (pixels[..., 1] << 8) | pixels[..., 2]
+    values, indices = np.unique(pixels, return_inverse=True)
+
+    palette = []
+    for value in values.tolist():
+        palette.extend((value, value, value) if image.mode == 'L' else ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF))
+    indexed = Image.frombytes('P', image.size, indices.astype(np.uint8).tobytes())
+    indexed.putpalette(palette)
+    return indexed
+
+
+def png_save_options(image: Image.Image) -> dict:
+    """이미지 모드에 맞는 PNG 저장 옵션 (팔레트 이미지는 색 수에 맞는 비트 깊이로 저장)"""
+    options = {
+        'compress_level': getattr(settings, 'QR_PNG_COMPRESS_LEVEL', DEFAULT_PNG_COMPRESS_LEVEL),
+    }
+    if image.mode == 'P':
+        options['bits'] = _bits_for(len(image.getpalette() or []) // 3)
+    return options
+
+
+def write_image(image: Image.Image, fp: BinaryIO, output_format: QROutputFormats = QROutputFormats.PNG):
+    """
+    이미지를 output_format으로 인코딩해 fp에 바로 쓴다
+
+    Args:
+        image (PIL.Image): 렌더링된 QR 이미지
+        fp: write()를 지원하는 바이너리 파일 객체
+        output_format (QROutputFormats): PNG 또는 WEBP
+    """
+    if output_format == QROutputFormats.WEBP:
+        image.save(
+            fp,
+            format='WEBP',
+            lossless=True,
+            method=getattr(settings, 'QR_WEBP_METHOD', DEFAULT_WEBP_METHOD),
+        )
+        return
+
+    image = to_indexed(image)
+    image.save(fp, format='PNG', **png_save_options(image))
+
+
+def encode_matrix(matrix: QRMatrix, output_format: QROutputFormats = QROutputFormats.MATRIX) -> bytes:
+    """모듈 행렬을 바이너리(MATRIX) 또는 JSON(MATRIX_JSON)으로 직렬화"""
+    if output_format == QROutputFormats.MATRIX_JSON:
+        return json.dumps(matrix.to_dict(), separators=(',', ':')).encode('utf-8')
+    return matrix.to_bytes()
@@ -0,0 +1,219 @@
+# qr/utils/payloads.py
+"""
+QR 코드 종류별 인코딩 문자열(payload) 생성
+
+이미지 렌더링과 분리되어 있어 generate_*_qr 함수, 행렬(matrix) 응답, 배치 처리에서 함께 사용한다.
+"""
+import logging
+import urllib.parse
+
+
+logger = logging.getLogger(__name__)
+
+
+def build_url_payload(url: str) -> str:
+    return url
+
+
+def build_email_payload(email: str, subject: str = "", body: str = "") -> str:
+    """mailto: URI 생성"""
+    mailto = f"mailto:{email}"
+    params = []
+    if subject:
+        params.append(f"subject={subject}")
+    if body:
+        params.append(f"body={body}")
+    if params:
+        mailto += "?" + "&".join(params)
+    return mailto
+
+
+def build_text_payload(text: str) -> str:
+    if text is None:
+        raise ValueError("Text content is required")
+    return text
+
+
+def build_phone_payload(phone_number: str) -> str:
+    return f"tel:{phone_number}"
+
+
+def build_vcard_payload(
+    first_name: str,
+    last_name: str,
+    vcard_mobile: str = "",
+    vcard_email: str = "",
+    vcard_url: str = "",
+    organization: str = "",
+    job_title: str = "",
+    fax: str = "",
+    address: str = "",
+    zip: str = "",
+    country: str = "",
+    note: str = "",
+) -> str:
+    """VCard 3.0 문자열 생성"""
+    vcard_data = {
+        "first_name": first_name,
+        "last_name": last_name,
+        "vcard_mobile": vcard_mobile,
+        "vcard_email": vcard_email,
+        "vcard_url": vcard_url,
+        "organization": organization,
+        "job_title": job_title,
+        "fax": fax,
+        "address": address,
+        "zip": zip,
+        "country": country,
+        "note": note,
+    }
+    vcard = "BEGIN:VCARD\nVERSION:3.0\n"
+    vcard += (
+        f"N:{vcard_data.get('last_name', '')};{vcard_data.get('first_name', '')}\n"
+    )
+    vcard += (
+        f"FN:{vcard_data.get('first_name', '')} {vcard_data.get('last_name', '')}\n"
+    )
+    if vcard_data.get("birthday"):
+        vcard += f"BDAY:{vcard_data.get('birthday')}\n"
+    if vcard_data.get("vcard_email"):
+        vcard += f"EMAIL:{vcard_data.get('vcard_email')}\n"
+    if vcard_data.get("vcard_phone"):
+        vcard += f"TEL;TYPE=VOICE:{vcard_data.get('vcard_phone')}\n"
+    if vcard_data.get("vcard_mobile"):
+        vcard += f"TEL;TYPE=CELL:{vcard_data.get('vcard_mobile')}\n"
+    if vcard_data.get("organization"):
+        vcard += f"ORG:{vcard_data.get('organization')}\n"
+    if vcard_data.get("job_title"):
+        vcard += f"TITLE:{vcard_data.get('job_title')}\n"
+    if vcard_data.get("address"):
+        vcard += f"ADR;TYPE=HOME:;;{vcard_data.get('address')};;;;\n"
+    if vcard_data.get("label"):
+        vcard += f"LABEL;TYPE=HOME:{vcard_data.get('label')}\n"
+    if vcard_data.get("vcard_url"):
+        vcard += f"URL:{vcard_data.get('vcard_url')}\n"
+    if vcard_data.get("note"):
+        vcard += f"NOTE:{vcard_data.get('note')}\n"
+    vcard += "END:VCARD"
+    return vcard
+
+
+def build_wifi_payload(ssid: str, password: str = "", encryption: str = "WPA", hidden: bool = False) -> str:
+    """WIFI: 설정 문자열 생성"""
+    wifi_string = "WIFI:"
+
+    # 암호화 설정
+    if encryption.lower() == "none":
+        wifi_string += "T:nopass;"
+    else:
+        wifi_string += f"T:{encryption};"
+
+    # SSID 추가
+    wifi_string += f"S:{ssid};"
+
+    # 비밀번호가 있는 경우에만 추가
+    if password:
+        wifi_string += f"P:{password};"
+
+    # 숨겨진 네트워크 설정
+    if hidden:
+        wifi_string += "H:true;"
+
+    # 마지막 세미콜론 추가
+    wifi_string += ";"
+
+    logger.debug(f"Generated WiFi string: {wifi_string}")  # 디버깅용 로그
+    return wifi_string
+
+
+def build_sms_payload(phone_number: str, message: str = "") -> str:
+    """SMSTO: 문자열 생성"""
+    sms = f"SMSTO:{phone_number}"
+    if message:  # 메시지가 있는 경우에만 추가
+        sms += f":{message}"
+
+    logger.debug(f"Generated SMS string: {sms}")  # 디버깅용 로그
+    return sms
+
+
+def build_geo_payload(latitude: str, longitude: str, query: str = "", zoom: str = "0") -> str:
+    """geo: URI 생성"""
+    latitude = float(latitude)
+    longitude = float(longitude)
+    zoom = int(zoom)
+    geo_uri = f"geo:{latitude},{longitude}"
+    params = []
+    if zoom > 0:
+        params.append(f"z={zoom}")
+    if query:
+        params.append(f"q={query}")
+    if params:
+        geo_uri += "?" + "&".join(params)
+    return geo_uri
+
+
+def build_event_payload(title: str, start: str, end: str, location: str, description: str) -> str:
+    """VCALENDAR 이벤트 문자열 생성"""
+    vcal = "BEGIN:VCALENDAR\nVERSION:2.0\nBEGIN:VEVENT\n"
+    vcal += f"SUMMARY:{title}\n"
+    vcal += f"DTSTART:{start}\n"
+    vcal += f"DTEND:{end}\n"
+    if location:
+        vcal += f"LOCATION:{location}\n"
+    if description:
+        vcal += f"DESCRIPTION:{description}\n"
+    vcal += "END:VEVENT\nEND:VCALENDAR"
+    return vcal
+
+
+def build_mecard_payload(
+    name: str, reading: str, tel: str, email: str, memo: str = "", birthday: str = "",
+    address: str = "", url: str = "", nickname: str = "",
+) -> str:
+    """MECARD 문자열 생성"""
+    mecard = "MECARD:"
+    if name:
+        mecard += f"N:{name};"
+    if reading:
+        mecard += f"SOUND:{reading};"
+    if tel:
+        mecard += f"TEL:{tel};"
+    if email:
+        mecard += f"EMAIL:{email};"
+    if memo:
+        mecard += f"NOTE:{memo};"
+    if birthday:
+        mecard += f"BDAY:{birthday};"
+    if address:
+        mecard += f"ADR:{address};"
+    if url:
+        mecard += f"URL:{url};"
+    if nickname:
+        mecard += f"NICKNAME:{nickname};"
+    mecard += ";"
+    return mecard
+
+
+def build_whatsapp_payload(phone_number: str, message: str = "") -> str:
+    """wa.me 링크 생성"""
+    whatsapp_uri = f"https://wa.me/{phone_number}"
+    if message:
+        query_params = {"text": message}
+        encoded_params = urllib.parse.urlencode(query_params)
+        whatsapp_uri += f"?{encoded_params}"
+    return whatsapp_uri
+
+
+def build_bitcoin_payload(address: str, amount: float = None, label: str = "", message: str = "") -> str:
+    """bitcoin: URI 생성"""
+    bitcoin_uri = f"bitcoin:{address}"
+    params = []
+    if amount is not None:
+        params.append(f"amount={amount}")
+    if label:
+        params.append(f"label={label}")
+    if message:
+        params.append(f"message={message}")
+    if params:
+        bitcoin_uri += "?" + "&".join(params)
+    return bitcoin_uri
@@ -0,0 +1,254 @@
+# qr/utils/pdf.py
+"""
+인쇄용 라벨 시트 PDF
+
+모듈 행렬을 병합된 사각형(re) 벡터 경로로 그리므로 비트맵을 넣지 않고, 라벨 수가 많아도 파일이 작다.
+PDF 객체를 페이지 단위로 바로 내보내고(Pages 객체와 xref는 마지막에 기록), 메모리에는 한 페이지만 둔다.
+"""
+import logging
+import zlib
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .matrix import QRMatrix
+from .renderers import matrix_to_array
+from .sizing import DEFAULT_BORDER
+from .svg import merged_rects
+
+
+logger = logging.getLogger(__name__)
+
+PDF_CONTENT_TYPE = 'application/pdf'
+DEFAULT_SHEET_MAX_ITEMS = 10000
+
+# PDF 단위(pt) 변환
+INCH = 72.0
+MM = INCH / 25.4
+
+PAGE_SIZES: Dict[str, Tuple[float, float]] = {
+    'letter': (8.5 * INCH, 11 * INCH),
+    'a4': (210 * MM, 297 * MM),
+}
+
+
+class SheetLayout(NamedTuple):
+    """
+    라벨 시트 격자 (단위: pt, 원점은 페이지 왼쪽 위)
+
+    pitch_x/pitch_y는 이웃한 라벨 왼쪽 위 모서리 사이의 거리(라벨 크기 + 간격)이다.
+    """
+    page_width: float
+    page_height: float
+    columns: int
+    rows: int
+    label_width: float
+    label_height: float
+    margin_left: float
+    margin_top: float
+    pitch_x: float
+    pitch_y: float
+    padding: float = 2 * MM
+
+    @property
+    def per_page(self) -> int:
+        return self.columns * self.rows
+
+    def label_box(self, slot: int) -> Tuple[float, float]:
+        """페이지 내 slot번째 라벨의 왼쪽 위 모서리 (PDF 좌표: 원점 왼쪽 아래)"""
+        row, column = divmod(slot, self.columns)
+        x = self.margin_left + column * self.pitch_x
+        top = self.page_height - self.margin_top - row * self.pitch_y
+        return x, top
+
+
+# 많이 쓰는 Avery 규격
+LABEL_LAYOUTS: Dict[str, SheetLayout] = {
+    # US Letter, 30장 (1" x 2-5/8")
+    'avery-5160': SheetLayout(
+        *PAGE_SIZES['letter'], columns=3, rows=10,
+        label_width=2.625 * INCH, label_height=1 * INCH,
+        margin_left=0.1875 * INCH, margin_top=0.5 * INCH,
+        pitch_x=2.75 * INCH, pitch_y=1 * INCH,
+    ),
+    # US Letter, 80장 (1/2" x 1-3/4")
+    'avery-5167': SheetLayout(
+        *PAGE_SIZES['letter'], columns=4, rows=20,
+        label_width=1.75 * INCH, label_height=0.5 * INCH,
+        margin_left=0.3 * INCH, margin_top=0.5 * INCH,
+        pitch_x=2.05 * INCH, pitch_y=0.5 * INCH, padding=0.5 * MM,
+    ),
+    # A4, 21장 (63.5 x 38.1 mm)
+    'avery-l7160': SheetLayout(
+        *PAGE_SIZES['a4'], columns=3, rows=7,
+        label_width=63.5 * MM, label_height=38.1 * MM,
+        margin_left=7.2 * MM, margin_top=15.15 * MM,
+        pitch_x=66.0 * MM, pitch_y=38.1 * MM,
+    ),
+    # A4, 65장 (38.1 x 21.2 mm)
+    'avery-l7651': SheetLayout(
+        *PAGE_SIZES['a4'], columns=5, rows=13,
+        label_width=38.1 * MM, label_height=21.2 * MM,
+        margin_left=4.7 * MM, margin_top=10.7 * MM,
+        pitch_x=40.6 * MM, pitch_y=21.2 * MM, padding=1 * MM,
+    ),
+}
+
+
+def custom_layout(
+    page_size: str,
+    columns: int,
+    rows: int,
+    label_width_mm: float,
+    label_height_mm: float,
+    margin_left_mm: float = 0.0,
+    margin_top_mm: float = 0.0,
+    gap_x_mm: float = 0.0,
+    gap_y_mm: float = 0.0,
+    padding_mm: float = 2.0,
+) -> SheetLayout:
+    """mm 단위 값으로 격자 생성. 격자가 페이지를 벗어나면 ValueError"""
+    page_width, page_height = PAGE_SIZES[page_size]
+    layout = SheetLayout(
+        page_width, page_height, columns, rows,
+        label_width=label_width_mm * MM, label_height=label_height_mm * MM,
+        margin_left=margin_left_mm * MM, margin_top=margin_top_mm * MM,
+        pitch_x=(label_width_mm + gap_x_mm) * MM, pitch_y=(label_height_mm + gap_y_mm) * MM,
+        padding=padding_mm * MM,
+    )
+    right = layout.margin_left + (columns - 1) * layout.pitch_x + layout.label_width
+    bottom = layout.margin_top + (rows - 1) * layout.pitch_y + layout.label_height
+    if right > page_width + 0.01 or bottom > page_height + 0.01:
+        raise ValueError("Label grid does not fit on the page")
+    return layout
+
+
+def _num(value: float) -> str:
+    """PDF 숫자 (소수 셋째 자리까지, 불필요한 0 제거)"""
+    return f"{round(value, 3):g}"
+
+
+def _rgb_operator(rgb: Sequence[int], operator: str) -> str:
+    return ' '.join(_num(channel / 255) for channel in rgb[:3]) + f" {operator}"
+
+
+def label_operators(
+    matrix: QRMatrix,
+    x: float,
+    top: float,
+    layout: SheetLayout,
+    border: int = DEFAULT_BORDER,
+    back_rgb: Optional[Sequence[int]] = None,
+) -> List[str]:
+    """
+    라벨 하나에 QR 코드를 그리는 PDF 연산자
+
+    QR 코드는 라벨 안쪽(padding 제외)에 맞는 가장 큰 정사각형으로 가운데 정렬한다.
+    좌표계를 모듈 단위(y축 아래 방향)로 바꾼 뒤 병합된 사각형을 하나의 경로로 채운다.
+    """
+    side = min(layout.label_width, layout.label_height) - 2 * layout.padding
+    module = side / (matrix.size + 2 * border)
+    left = x + (layout.label_width - side) / 2
+    square_top = top - (layout.label_height - side) / 2
+
+    ops = ['q']
+    if back_rgb is not None:
+        ops.append(_rgb_operator(back_rgb, 'rg'))
+        ops.append(f"{_num(left)} {_num(square_top - side)} {_num(side)} {_num(side)} re f")
+        ops.append('Q q')
+    origin_x = left + border * module
+    origin_y = square_top - border * module
+    ops.append(f"{_num(module)} 0 0 {_num(-module)} {_num(origin_x)} {_num(origin_y)} cm")
+    ops.extend(f"{rx} {ry} {rw} {rh} re" for rx, ry, rw, rh in merged_rects(matrix_to_array(matrix)))
+    ops.append('f Q')
+    return ops
+
+
+class _PDFStream:
+    """객체를 기록한 순서대로 바이트 오프셋을 기억했다가 마지막에 xref를 만든다"""
+
+    def __init__(self):
+        self.offset = 0
+        self.offsets: Dict[int, int] = {}
+
+    def emit(self, data: bytes) -> bytes:
+        self.offset += len(data)
+        return data
+
+    def obj(self, number: int, body: bytes) -> bytes:
+        self.offsets[number] = self.offset
+        return self.emit(f"{number} 0 obj\n".encode('ascii') + body + b"\nendobj\n")
+
+    def stream_obj(self, number: int, content: bytes) -> bytes:
+        data = zlib.compress(content)
+        header = f"<< /Length {len(data)} /Filter /FlateDecode >>\nstream\n".encode('ascii')
+        return self.obj(number, header + data + b"\nendstream")
+
+    def xref(self, root: int) -> bytes:
+        count = max(self.offsets) + 1
+        lines = [f"xref\n0 {count}\n", "0000000000 65535 f \n"]
+        lines.extend(f"{self.offsets[number]:010d} 00000 n \n" for number in range(1, count))
+        lines.append(f"trailer\n<< /Size {count} /Root {root} 0 R >>\nstartxref\n{self.offset}\n%%EOF\n")
+        return ''.join(lines).encode('ascii')
+
+
+# 고정 객체 번호: 1 = Catalog, 2 = Pages. 페이지마다 (내용 스트림, Page) 두 개씩 3번부터
+CATALOG_OBJ = 1
+PAGES_OBJ = 2
+FIRST_PAGE_OBJ = 3
+
+
+def stream_label_sheet_pdf(
+    matrices: Iterable[Optional[QRMatrix]],
+    layout: SheetLayout,
+    border: int = DEFAULT_BORDER,
+    fill_rgb: Sequence[int] = (0, 0, 0),
+    back_rgb: Optional[Sequence[int]] = None,
+) -> Iterator[bytes]:
+    """
+    모듈 행렬들을 라벨 시트에 차례로 배치한 PDF를 페이지 단위로 스트리밍
+
+    None인 항목은 빈 라벨로 남긴다 (실패한 항목 때문에 이후 라벨 위치가 밀리지 않도록).
+    back_rgb가 흰색이 아니면 QR 코드 영역을 배경색으로 먼저 칠한다.
+    """
+    pdf = _PDFStream()
+    if back_rgb is not None and tuple(back_rgb[:3]) == (255, 255, 255):
+        back_rgb = None
+
+    yield pdf.emit(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    media_box = f"[0 0 {_num(layout.page_width)} {_num(layout.page_height)}]"
+    page_objs = []
+    iterator = iter(matrices)
+    while True:
+        page = list(islice(iterator, layout.per_page))
+        if not page:
+            break
+        ops = [_rgb_operator(fill_rgb, 'rg')]
+        for slot, matrix in enumerate(page):
+            if matrix is None:
+                continue
+            x, top = layout.label_box(slot)
+            ops.extend(label_operators(matrix, x, top, layout, border=border, back_rgb=back_rgb))
+
+        content_obj = FIRST_PAGE_OBJ + len(page_objs) * 2
+        page_obj = content_obj + 1
+        page_objs.append(page_obj)
+        chunk = pdf.stream_obj(content_obj, '\n'.join(ops).encode('ascii'))
+        chunk += pdf.obj(page_obj, (
+            f"<< /Type /Page /Parent {PAGES_OBJ} 0 R /MediaBox {media_box} "
+            f"/Resources << >> /Contents {content_obj} 0 R >>"
+        ).encode('ascii'))
+        yield chunk
+
+    if not page_objs:
+        # 항목이 없어도 올바른 PDF가 되도록 빈 페이지 하나
+        page_objs.append(FIRST_PAGE_OBJ)
+        yield pdf.obj(FIRST_PAGE_OBJ, (
+            f"<< /Type /Page /Parent {PAGES_OBJ} 0 R /MediaBox {media_box} /Resources << >> >>"
+        ).encode('ascii'))
+
+    kids = ' '.join(f"{number} 0 R" for number in page_objs)
+    tail = pdf.obj(PAGES_OBJ, f"<< /Type /Pages /Kids [{kids}] /Count {len(page_objs)} >>".encode('ascii'))
+    tail += pdf.obj(CATALOG_OBJ, f"<< /Type /Catalog /Pages {PAGES_OBJ} 0 R >>".encode('ascii'))
+    tail += pdf.xref(CATALOG_OBJ)
+    yield tail
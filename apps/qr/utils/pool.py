@@ -0,0 +1,465 @@
+# qr/utils/pool.py
+"""
+요청 처리용 상주 렌더링 프로세스 풀
+
+웹 워커(gunicorn)마다 미리 띄워 워밍업한 렌더링 프로세스를 두고, 뷰는 렌더링을 풀에 맡긴 뒤 결과만 기다린다.
+대기열은 부모 프로세스에 있어 길이를 제한할 수 있고(가득 차면 즉시 거절), 작업마다 실행 시간을 제한한다
+(초과하면 해당 워커를 종료하고 새로 띄움). 워커는 N개의 작업을 처리했거나 메모리 한도를 넘으면 교체된다.
+
+워커와는 각자의 파이프로만 통신하므로, 한 워커를 강제로 종료해도 다른 워커의 통신에 영향이 없다.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import partial
+from multiprocessing.connection import wait
+from typing import Callable, Deque, List, Optional
+
+from django.conf import settings
+
+from .batch import _init_worker
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RENDER_POOL_MAX_QUEUE = 64
+DEFAULT_RENDER_POOL_TIMEOUT = 10.0
+DEFAULT_RENDER_POOL_QUEUE_TIMEOUT = 10.0
+# 요청 스레드가 도는 웹 워커 안에서 워커를 (재)시작하므로 fork 대신 forkserver를 기본으로 사용
+DEFAULT_RENDER_POOL_START_METHOD = 'forkserver'
+
+# 워커가 시작 직후 죽으면 다시 띄우기 전에 기다리는 시간(초) (시작 실패가 반복될 때 CPU를 소모하지 않도록)
+RESPAWN_BACKOFF = 1.0
+POLL_INTERVAL = 0.05
+
+
+class RenderPoolError(RuntimeError):
+    """렌더 풀이 작업을 처리하지 못함"""
+
+
+class RenderPoolFull(RenderPoolError):
+    """대기열이 가득 차 작업을 받지 않음"""
+
+
+class RenderTimeout(RenderPoolError):
+    """작업이 제한 시간 안에 끝나지 않음"""
+
+
+class RenderWorkerLost(RenderPoolError):
+    """작업을 처리하던 워커 프로세스가 비정상 종료됨"""
+
+
+def _peak_rss_bytes() -> int:
+    """현재 프로세스의 최대 RSS (Linux는 KB, macOS는 바이트 단위로 보고됨)"""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _warm_up():
+    """PIL 플러그인, NumPy, qrcode 모듈을 미리 불러와 첫 요청이 느려지지 않게 함"""
+    from ..constants import QROutputFormats
+    from .qr_utils import generate_text_qr
+
+    for output_format in (QROutputFormats.PNG, QROutputFormats.SVG):
+        generate_text_qr('warm-up', output_format=output_format)
+
+
+def _worker_main(conn, max_jobs: int, max_memory_bytes: int, warm_up: bool):
+    """
+    렌더링 워커 프로세스
+
+    (func, args, kwargs)를 받아 실행하고 ((성공 여부, 결과 또는 예외), 교체 여부)를 돌려준다.
+    None을 받거나 파이프가 닫히면 종료한다.
+    """
+    _init_worker()
+    if warm_up:
+        try:
+            _warm_up()
+        except Exception as e:
+            logger.warning(f"Render pool warm-up failed: {e}")
+    conn.send('ready')
+
+    jobs = 0
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if task is None:
+            break
+
+        func, args, kwargs = task
+        try:
+            outcome = (True, func(*args, **kwargs))
+        except Exception as e:
+            outcome = (False, e)
+
+        jobs += 1
+        retire = bool(
+            (max_jobs and jobs >= max_jobs)
+            or (max_memory_bytes and _peak_rss_bytes() >= max_memory_bytes)
+        )
+        try:
+            conn.send((outcome, retire))
+        except Exception as e:
+            # 결과나 예외를 pickle할 수 없으면 메시지만 전달
+            conn.send(((False, RenderPoolError(f"Unpicklable render result: {e!r}")), retire))
+        if retire:
+            break
+    conn.close()
+
+
+class _Job:
+    __slots__ = ('future', 'func', 'args', 'kwargs', 'timeout')
+
+    def __init__(self, future: Future, func: Callable, args: tuple, kwargs: dict, timeout: Optional[float]):
+        self.future = future
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.timeout = timeout
+
+
+class _Worker:
+    __slots__ = ('process', 'conn', 'ready', 'job', 'deadline')
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.ready = False
+        self.job: Optional[_Job] = None
+        self.deadline: Optional[float] = None
+
+
+class RenderPool:
+    """
+    상주 렌더링 프로세스 풀
+
+    Args:
+        workers (int): 워커 프로세스 수
+        max_queue (int): 워커에 배정되지 않고 기다릴 수 있는 최대 작업 수. 초과하면 RenderPoolFull
+        timeout (float, optional): 작업 하나의 최대 실행 시간(초). 초과하면 워커를 종료하고 RenderTimeout
+        queue_timeout (float, optional): run()에서 작업이 워커에 배정되기까지 기다리는 최대 시간(초)
+        max_jobs_per_worker (int): 워커 하나가 처리할 작업 수. 도달하면 새 워커로 교체 (0이면 제한 없음)
+        max_memory_mb (int): 워커의 최대 RSS(MB). 작업 후 넘으면 새 워커로 교체 (0이면 제한 없음)
+        start_method (str, optional): multiprocessing 시작 방식 (기본 forkserver, None이면 플랫폼 기본값)
+        warm_up (bool): 워커 시작 시 샘플 QR 코드를 렌더링해 모듈과 캐시를 미리 불러옴
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_queue: int = DEFAULT_RENDER_POOL_MAX_QUEUE,
+        timeout: Optional[float] = DEFAULT_RENDER_POOL_TIMEOUT,
+        queue_timeout: Optional[float] = DEFAULT_RENDER_POOL_QUEUE_TIMEOUT,
+        max_jobs_per_worker: int = 0,
+        max_memory_mb: int = 0,
+        start_method: Optional[str] = DEFAULT_RENDER_POOL_START_METHOD,
+        warm_up: bool = True,
+    ):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.max_memory_bytes = max_memory_mb * 1024 * 1024
+        self.warm_up = warm_up
+        self.pid = os.getpid()
+
+        self._context = multiprocessing.get_context(start_method)
+        self._lock = threading.Lock()
+        self._queue: Deque[_Job] = deque()
+        self._workers: List[_Worker] = []
+        self._closed = False
+        self._respawn_after = 0.0
+        self._counters = dict.fromkeys(
+            ('submitted', 'completed', 'failed', 'rejected', 'timeouts', 'recycled', 'lost'), 0
+        )
+
+        with self._lock:
+            self._spawn_workers()
+        self._thread = threading.Thread(target=self._run, name='qr-render-pool', daemon=True)
+        self._thread.start()
+
+    def submit(self, func: Callable, args: tuple = (), kwargs: Optional[dict] = None, timeout: Optional[float] = None) -> Future:
+        """
+        작업을 제출하고 Future를 반환
+
+        쉬는 워커가 있으면 바로 넘기고, 없으면 대기열에 넣는다. 대기열이 가득 차면 RenderPoolFull.
+        """
+        job = _Job(Future(), func, args, kwargs or {}, timeout if timeout is not None else self.timeout)
+        with self._lock:
+            if self._closed:
+                raise RenderPoolError("Render pool is shut down")
+            if len(self._queue) >= self.max_queue and not self._idle_worker():
+                self._counters['rejected'] += 1
+                raise RenderPoolFull(f"Render queue is full ({self.max_queue} jobs waiting)")
+            self._counters['submitted'] += 1
+            self._queue.append(job)
+            self._dispatch()
+        return job.future
+
+    def run(self, func: Callable, args: tuple = (), kwargs: Optional[dict] = None, timeout: Optional[float] = None):
+        """
+        작업을 실행하고 결과를 반환 (작업에서 발생한 예외는 그대로 다시 발생)
+
+        queue_timeout 안에 워커에 배정되지 않으면 작업을 취소하고 RenderTimeout.
+        이미 실행 중이면 실행 시간 제한(timeout)이 끝날 때까지 기다린다.
+        """
+        future = self.submit(func, args, kwargs, timeout)
+        try:
+            return future.result(timeout=self.queue_timeout)
+        except FutureTimeoutError:
+            if future.cancel():
+                with self._lock:
+                    self._counters['timeouts'] += 1
+                raise RenderTimeout(f"Render job waited more than {self.queue_timeout}s in the queue")
+        return future.result()
+
+    def stats(self) -> dict:
+        """풀 상태와 누적 카운터 (대기열 길이, 실행 중인 작업 수 등)"""
+        with self._lock:
+            return {
+                'workers': len(self._workers),
+                'ready_workers': sum(1 for worker in self._workers if worker.ready),
+                'busy_workers': sum(1 for worker in self._workers if worker.job is not None),
+                'queue_depth': len(self._queue),
+                'max_queue': self.max_queue,
+                **self._counters,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """대기 중인 작업을 실패 처리하고 워커를 종료"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            while self._queue:
+                self._queue.popleft().future.set_exception(RenderPoolError("Render pool is shut down"))
+            workers, self._workers = self._workers, []
+        # 관리 스레드가 끝난 뒤에 파이프를 닫음
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in workers:
+            worker.process.join(timeout=5 if wait else 0)
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join()
+            if worker.job is not None and not worker.job.future.done():
+                worker.job.future.set_exception(RenderPoolError("Render pool is shut down"))
+            worker.conn.close()
+
+    # 아래 메서드는 _lock을 잡은 상태에서 호출
+
+    def _idle_worker(self) -> Optional[_Worker]:
+        for worker in self._workers:
+            if worker.ready and worker.job is None:
+                return worker
+        return None
+
+    def _spawn_workers(self):
+        if self._closed or time.monotonic() < self._respawn_after:
+            return
+        while len(self._workers) < self.workers:
+            parent_conn, child_conn = self._context.Pipe()
+            process = self._context.Process(
+                target=_worker_main,
+                args=(child_conn, self.max_jobs_per_worker, self.max_memory_bytes, self.warm_up),
+                name='qr-render-worker',
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._workers.append(_Worker(process, parent_conn))
+
+    def _dispatch(self):
+        """대기열의 작업을 쉬는 워커에 배정 (취소된 작업은 건너뜀)"""
+        while self._queue:
+            worker = self._idle_worker()
+            if worker is None:
+                return
+            job = self._queue.popleft()
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            try:
+                worker.conn.send((job.func, job.args, job.kwargs))
+            except Exception as e:
+                # 인자를 pickle할 수 없는 경우 (워커 쪽으로는 아무것도 전송되지 않음)
+                self._counters['failed'] += 1
+                job.future.set_exception(e)
+                continue
+            worker.job = job
+            worker.deadline = time.monotonic() + job.timeout if job.timeout else None
+
+    def _remove_worker(self, worker: _Worker, kill: bool = False):
+        self._workers.remove(worker)
+        if kill and worker.process.is_alive():
+            worker.process.kill()
+        worker.process.join(timeout=5)
+        worker.conn.close()
+
+    def _receive(self, worker: _Worker):
+        try:
+            message = worker.conn.recv()
+        except (EOFError, OSError):
+            self._lost(worker)
+            return
+        if message == 'ready':
+            worker.ready = True
+            return
+
+        (ok, value), retire = message
+        job, worker.job, worker.deadline = worker.job, None, None
+        if job is not None:
+            if ok:
+                self._counters['completed'] += 1
+                job.future.set_result(value)
+            else:
+                self._counters['failed'] += 1
+                job.future.set_exception(value)
+        if retire:
+            self._counters['recycled'] += 1
+            self._remove_worker(worker)
+
+    def _lost(self, worker: _Worker):
+        logger.error(f"Render worker {worker.process.pid} exited unexpectedly (exit code {worker.process.exitcode})")
+        self._counters['lost'] += 1
+        if not worker.ready:
+            self._respawn_after = time.monotonic() + RESPAWN_BACKOFF
+        if worker.job is not None:
+            self._counters['failed'] += 1
+            worker.job.future.set_exception(RenderWorkerLost("Render worker exited while rendering"))
+        self._remove_worker(worker)
+
+    def _expire(self, now: float):
+        for worker in list(self._workers):
+            if worker.deadline is not None and now >= worker.deadline:
+                logger.warning(f"Render job exceeded {worker.job.timeout}s, killing worker {worker.process.pid}")
+                self._counters['timeouts'] += 1
+                worker.job.future.set_exception(RenderTimeout(f"Render job exceeded {worker.job.timeout}s"))
+                self._remove_worker(worker, kill=True)
+
+    def _run(self):
+        """워커 응답 수신, 실행 시간 초과 처리, 종료된 워커 교체, 대기열 배정"""
+        while True:
+            with self._lock:
+                if self._closed:
+                    return
+                workers = list(self._workers)
+            by_handle = {}
+            for worker in workers:
+                by_handle[worker.conn] = worker
+                by_handle[worker.process.sentinel] = worker
+            if by_handle:
+                ready = wait(list(by_handle), timeout=POLL_INTERVAL)
+            else:
+                ready = []
+                time.sleep(POLL_INTERVAL)
+
+            with self._lock:
+                if self._closed:
+                    return
+                handled = set()
+                # 파이프를 프로세스 종료(sentinel)보다 먼저 처리해 종료 직전에 보낸 결과를 놓치지 않음
+                for handle in sorted(ready, key=lambda handle: isinstance(handle, int)):
+                    worker = by_handle[handle]
+                    if id(worker) in handled or worker not in self._workers:
+                        continue
+                    handled.add(id(worker))
+                    if handle is worker.conn:
+                        self._receive(worker)
+                    elif not worker.conn.poll():
+                        self._lost(worker)
+                self._expire(time.monotonic())
+                self._spawn_workers()
+                self._dispatch()
+
+
+_render_pool: Optional[RenderPool] = None
+_render_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> Optional[RenderPool]:
+    """
+    프로세스 전역 렌더 풀. QR_RENDER_POOL_WORKERS가 0이면 None (요청 스레드에서 렌더링)
+
+    fork로 복제된 프로세스(gunicorn --preload 등)에서는 부모의 풀을 쓸 수 없으므로 새로 만든다.
+    """
+    global _render_pool
+    workers = getattr(settings, 'QR_RENDER_POOL_WORKERS', 0)
+    if not workers:
+        return None
+    if _render_pool is None or _render_pool.pid != os.getpid():
+        with _render_pool_lock:
+            if _render_pool is None or _render_pool.pid != os.getpid():
+                _render_pool = RenderPool(
+                    workers,
+                    max_queue=getattr(settings, 'QR_RENDER_POOL_MAX_QUEUE', DEFAULT_RENDER_POOL_MAX_QUEUE),
+                    timeout=getattr(settings, 'QR_RENDER_POOL_TIMEOUT', DEFAULT_RENDER_POOL_TIMEOUT),
+                    queue_timeout=getattr(settings, 'QR_RENDER_POOL_QUEUE_TIMEOUT', DEFAULT_RENDER_POOL_QUEUE_TIMEOUT),
+                    max_jobs_per_worker=getattr(settings, 'QR_RENDER_POOL_MAX_JOBS_PER_WORKER', 0),
+                    max_memory_mb=getattr(settings, 'QR_RENDER_POOL_MAX_MEMORY_MB', 0),
+                    start_method=getattr(settings, 'QR_RENDER_POOL_START_METHOD', DEFAULT_RENDER_POOL_START_METHOD),
+                )
+    return _render_pool
+
+
+def shutdown_render_pool(wait: bool = True) -> None:
+    """렌더 풀 종료. 다음 사용 시 설정값으로 다시 생성된다."""
+    global _render_pool
+    with _render_pool_lock:
+        pool, _render_pool = _render_pool, None
+    if pool is not None and pool.pid == os.getpid():
+        pool.shutdown(wait=wait)
+
+
+def run_render(func: Callable, *args, **kwargs):
+    """렌더 풀이 설정되어 있으면 풀 프로세스에서, 아니면 호출한 스레드에서 func(*args, **kwargs) 실행"""
+    pool = get_render_pool()
+    if pool is None:
+        return func(*args, **kwargs)
+    return pool.run(func, args, kwargs)
+
+
+_render_threads: Optional[ThreadPoolExecutor] = None
+
+
+def get_render_thread_executor() -> ThreadPoolExecutor:
+    """
+    비동기(ASGI) 뷰가 렌더링을 넘기는 스레드 풀
+
+    스레드 수(QR_ASYNC_RENDER_CONCURRENCY, None이면 CPU 수)가 동시에 렌더링하는 요청 수의 상한이 되고,
+    나머지 요청은 이벤트 루프에서 차례를 기다린다. 렌더 풀이 설정되어 있으면 스레드는 풀의 결과만 기다린다.
+    """
+    global _render_threads
+    if _render_threads is None:
+        with _render_pool_lock:
+            if _render_threads is None:
+                workers = getattr(settings, 'QR_ASYNC_RENDER_CONCURRENCY', None) or os.cpu_count() or 1
+                _render_threads = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='qr-render')
+    return _render_threads
+
+
+async def arun_in_render_thread(func: Callable, *args, **kwargs):
+    """이벤트 루프를 막지 않도록 func(*args, **kwargs)를 렌더링 스레드 풀에서 실행하고 결과를 기다림"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_render_thread_executor(), partial(func, *args, **kwargs))
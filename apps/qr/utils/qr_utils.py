@@ -3,14 +3,12 @@ from enum import Enum
 from io import BytesIO
 import logging
 import traceback
-import urllib.parse
 from PIL import Image, ImageColor
 
 from typing import Dict, Type
 
 import qrcode
 from qrcode.constants import ERROR_CORRECT_L, ERROR_CORRECT_H
-from qrcode.main import QRCode
 from qrcode.image.styledpil import StyledPilImage
 
 # QR Code Styles
@@ -22,41 +20,64 @@ from qrcode.image.styles.moduledrawers.pil import (
     HorizontalBarsDrawer,
     VerticalBarsDrawer,
 )
-from qrcode.image.styles.colormasks import (
+from qrcode.image.styles.colormasks import ImageColorMask
+from apps.qr.serializers import BaseQRSerializer
+
+from ..constants import QRStyles, QRColorMasks, QREyeStyles, QROutputFormats
+from .colormasks import (
     SolidFillColorMask,
     RadialGradiantColorMask,
     SquareGradiantColorMask,
     HorizontalGradiantColorMask,
     VerticalGradiantColorMask,
-    ImageColorMask,
 )
-from apps.qr.serializers import BaseQRSerializer
-
-from ..constants import QRStyles, QRColorMasks, QREyeStyles
+from .cache import get_render_cache, image_digest, make_render_key
+from .matrix import QRMatrix, get_qr_matrix
+from .output import encode_matrix, write_image
+from .payloads import (
+    build_url_payload,
+    build_email_payload,
+    build_text_payload,
+    build_phone_payload,
+    build_vcard_payload,
+    build_wifi_payload,
+    build_sms_payload,
+    build_geo_payload,
+    build_event_payload,
+    build_mecard_payload,
+    build_whatsapp_payload,
+    build_bitcoin_payload,
+)
+from .renderers import render_square_image
+from .sizing import DEFAULT_BORDER, PixelBudgetExceeded, resolve_box_size
+from .sprites import SpriteStyledPilImage, supports_sprites
+from .svg import render_svg
 
 
 logger = logging.getLogger(__name__)
 
 def _get_eye_style(style: Type[QREyeStyles]):
+    # SQUARE는 None (StyledPilImage 기본 eye 드로어와 동일)
     style_map = {
         QREyeStyles.SQUARE: None,
-        QREyeStyles.CIRCLE: CircleModuleDrawer(),
-        QREyeStyles.ROUNDED: RoundedModuleDrawer(),
+        QREyeStyles.CIRCLE: CircleModuleDrawer,
+        QREyeStyles.ROUNDED: RoundedModuleDrawer,
     }
-    result = style_map.get(style, None)
-    return result
+    drawer_class = style_map.get(style, None)
+    return drawer_class() if drawer_class else None
 
 
 def _get_module_drawer(style: Type[QRStyles]):
+    # 요청된 스타일의 드로어만 생성
     style_map = {
-        QRStyles.SQUARE_MODULE: SquareModuleDrawer(),
-        QRStyles.GAPPED_SQUARE_MODULE: GappedSquareModuleDrawer(),
-        QRStyles.CIRCLE_MODULE: CircleModuleDrawer(),
-        QRStyles.ROUNDED_MODULE: RoundedModuleDrawer(),
-        QRStyles.HORIZONTAL_BARS: HorizontalBarsDrawer(),
-        QRStyles.VERTICAL_BARS: VerticalBarsDrawer(),
+        QRStyles.SQUARE_MODULE: SquareModuleDrawer,
+        QRStyles.GAPPED_SQUARE_MODULE: GappedSquareModuleDrawer,
+        QRStyles.CIRCLE_MODULE: CircleModuleDrawer,
+        QRStyles.ROUNDED_MODULE: RoundedModuleDrawer,
+        QRStyles.HORIZONTAL_BARS: HorizontalBarsDrawer,
+        QRStyles.VERTICAL_BARS: VerticalBarsDrawer,
     }
-    result = style_map.get(style, SquareModuleDrawer())
+    result = style_map.get(style, SquareModuleDrawer)()
     return result
 
 
@@ -81,6 +102,77 @@ def _convert_color_to_rgb(color: str) -> tuple:
     return ImageColor.getrgb(color)
 
 
+def _build_color_mask(color_mask: Type[QRColorMasks], fill_rgb: tuple, back_rgb: tuple):
+    """QRColorMasks 값에 맞는 컬러 마스크 인스턴스 생성"""
+    mask_class = _get_color_mask(color_mask)
+
+    # Color Mask 인스턴스 생성 로직 수정
+    if color_mask == QRColorMasks.SOLID_FILL:
+        return SolidFillColorMask(
+            front_color=fill_rgb,
+            back_color=back_rgb
+        )
+    elif color_mask ==QRColorMasks.HORIZONTAL_GRADIANT:
+        return mask_class(
+            back_color=back_rgb,
+            left_color=fill_rgb,
+            right_color=back_rgb
+        )
+    elif color_mask == QRColorMasks.VERTICAL_GRADIANT:
+        return mask_class(
+            back_color=back_rgb,
+            bottom_color=fill_rgb,
+            top_color=back_rgb
+        )
+    else:  # RADIAL_GRADIANT, SQUARE_GRADIANT
+        mask_class = RadialGradiantColorMask if color_mask == QRColorMasks.RADIAL_GRADIANT else SquareGradiantColorMask
+        return mask_class(
+            back_color=back_rgb,
+            center_color=fill_rgb,
+            edge_color=back_rgb
+        )
+
+
+def _can_use_square_renderer(style, eye_style, embeded_image, fill_rgb: tuple, back_rgb: tuple) -> bool:
+    """NumPy 사각 모듈 렌더러로 StyledPilImage와 같은 결과를 낼 수 있는 조합인지 확인"""
+    return (
+        style == QRStyles.SQUARE_MODULE
+        and eye_style in (None, QREyeStyles.SQUARE)
+        and embeded_image is None
+        and len(fill_rgb) == 3
+        and len(back_rgb) == 3
+    )
+
+
+def _render_styled_image(
+    matrix: QRMatrix,
+    fill_rgb: tuple,
+    back_rgb: tuple,
+    style: Type[QRStyles],
+    color_mask: Type[QRColorMasks],
+    eye_style: Type[QREyeStyles],
+    embeded_image: Image,
+    embeded_image_ratio: float,
+    box_size: int,
+    border: int,
+) -> StyledPilImage:
+    """qrcode의 StyledPilImage로 모듈 스타일, 컬러 마스크, 임베드 이미지를 적용해 렌더링"""
+    qr = matrix.to_qrcode(box_size=box_size, border=border)
+    color_mask_instance = _build_color_mask(color_mask, fill_rgb, back_rgb)
+
+    # QR 코드 이미지 생성 (기본 드로어는 미리 렌더링한 스프라이트를 찍어서 생성)
+    module_drawer = _get_module_drawer(style)
+    eye_drawer = _get_eye_style(eye_style) or SquareModuleDrawer()
+    return qr.make_image(
+        image_factory=SpriteStyledPilImage if supports_sprites(module_drawer, eye_drawer) else StyledPilImage,
+        module_drawer=module_drawer,
+        eye_drawer=eye_drawer,
+        color_mask=color_mask_instance,
+        embeded_image=embeded_image,
+        embeded_image_ratio=float(embeded_image_ratio) if embeded_image else 0,
+    )
+
+
 def create_qr_code(
     data: str, version: int = None,
     error_correction: int = ERROR_CORRECT_L,
@@ -90,65 +182,119 @@ def create_qr_code(
     style: Type[QRStyles] = QRStyles.SQUARE_MODULE,
     color_mask: Type[QRColorMasks] = QRColorMasks.SOLID_FILL,
     embeded_image: Image = None,
-    embeded_image_ratio: float = 0.25
+    embeded_image_ratio: float = 0.25,
+    size: int = None,
+    border: int = DEFAULT_BORDER,
+    output_format: Type[QROutputFormats] = QROutputFormats.PNG,
 ) -> bytes:
+    """
+    QR 코드 생성 (PNG, WebP, SVG 또는 모듈 행렬 바이트 반환)
+
+    output_format이 SVG이면 픽셀 렌더링 없이 모듈 행렬에서 바로 SVG를 만들고,
+    MATRIX/MATRIX_JSON이면 렌더링 없이 인코딩된 모듈 행렬만 반환한다.
+    size가 주어지면 이미지 한 변이 size 픽셀을 넘지 않도록 box_size를 고른다.
+
+    Raises:
+        PixelBudgetExceeded: 결과 이미지가 QR_MAX_IMAGE_PIXELS를 넘고 줄일 수 없는 경우
+    """
     try:
-        qr = QRCode(
-            version=version,
-            error_correction=ERROR_CORRECT_H if embeded_image else error_correction,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(data)
-        qr.make(fit=True)  # fit=True: QR code Version(size)를 자동으로 조절
+        error_correction = ERROR_CORRECT_H if embeded_image else error_correction
+        eye_style = eye_style or QREyeStyles.SQUARE
+        size = int(size) if size else None
+        border = int(border) if border is not None else DEFAULT_BORDER
+
+        if output_format in QROutputFormats.get_matrix_formats():
+            # 클라이언트가 직접 렌더링하는 경우: 스타일/색상과 무관하게 모듈 행렬만 반환
+            matrix = get_qr_matrix(data, error_correction=error_correction, version=version)
+            return encode_matrix(matrix, output_format)
 
         # 색상을 RGB 튜플로 변환
         fill_rgb = _convert_color_to_rgb(fill_color)
         back_rgb = _convert_color_to_rgb(back_color)
 
-        mask_class = _get_color_mask(color_mask)
-
-        # Color Mask 인스턴스 생성 로직 수정
-        if color_mask == QRColorMasks.SOLID_FILL:
-            color_mask_instance = SolidFillColorMask(
-                front_color=fill_rgb,
-                back_color=back_rgb
-            )
-        elif color_mask ==QRColorMasks.HORIZONTAL_GRADIANT:
-            color_mask_instance = mask_class(
+        # 같은 입력이면 렌더 캐시에서 바로 반환
+        render_cache = get_render_cache()
+        cache_key = make_render_key(
+            data=data,
+            version=version,
+            error_correction=error_correction,
+            eye_style=eye_style,
+            fill_color=fill_rgb,
+            back_color=back_rgb,
+            style=style,
+            color_mask=color_mask,
+            embedded_image=image_digest(embeded_image),
+            embedded_image_ratio=float(embeded_image_ratio) if embeded_image else None,
+            size=size,
+            border=border,
+            output_format=output_format,
+        )
+        cached = render_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"QR render cache hit: {cache_key}")
+            return cached
+
+        # 인코딩된 모듈 행렬은 스타일과 무관하므로 별도 캐시에서 재사용
+        matrix = get_qr_matrix(data, error_correction=error_correction, version=version)
+
+        # 렌더링 전에 목표 크기와 최대 픽셀 제한으로 box_size 결정
+        box_size = resolve_box_size(matrix.size, border=border, size=size)
+
+        if output_format == QROutputFormats.SVG:
+            color_mask_instance = None
+            if color_mask != QRColorMasks.SOLID_FILL:
+                color_mask_instance = _build_color_mask(color_mask, fill_rgb, back_rgb)
+            qr_image = render_svg(
+                matrix,
+                box_size=box_size,
+                border=border,
+                style=style,
+                eye_style=eye_style,
+                fill_color=fill_rgb,
                 back_color=back_rgb,
-                left_color=fill_rgb,
-                right_color=back_rgb
+                color_mask=color_mask_instance,
+                embedded_image=embeded_image,
+                embedded_image_ratio=float(embeded_image_ratio),
             )
-        elif color_mask == QRColorMasks.VERTICAL_GRADIANT:
-            color_mask_instance = mask_class(
+            render_cache.set(cache_key, qr_image)
+            return qr_image
+
+        if _can_use_square_renderer(style, eye_style, embeded_image, fill_rgb, back_rgb):
+            # 사각 모듈은 NumPy 전용 렌더러로 처리 (그라데이션은 캐시된 레이어와 합성)
+            gradient_mask = None
+            if color_mask != QRColorMasks.SOLID_FILL:
+                gradient_mask = _build_color_mask(color_mask, fill_rgb, back_rgb)
+            img = render_square_image(
+                matrix,
+                box_size=box_size,
+                border=border,
+                fill_color=fill_rgb,
                 back_color=back_rgb,
-                bottom_color=fill_rgb,
-                top_color=back_rgb
+                gradient_mask=gradient_mask,
             )
-        else:  # RADIAL_GRADIANT, SQUARE_GRADIANT
-            mask_class = RadialGradiantColorMask if color_mask == QRColorMasks.RADIAL_GRADIANT else SquareGradiantColorMask
-            color_mask_instance = mask_class(
-                back_color=back_rgb,
-                center_color=fill_rgb,
-                edge_color=back_rgb
+        else:
+            img = _render_styled_image(
+                matrix,
+                fill_rgb=fill_rgb,
+                back_rgb=back_rgb,
+                style=style,
+                color_mask=color_mask,
+                eye_style=eye_style,
+                embeded_image=embeded_image,
+                embeded_image_ratio=embeded_image_ratio,
+                box_size=box_size,
+                border=border,
             )
-        # QR 코드 이미지 생성
-        module_drawer = _get_module_drawer(style)
-        eye_style = _get_eye_style(eye_style)
-        img = qr.make_image(
-            image_factory=StyledPilImage,
-            module_drawer=module_drawer,
-            color_mask=color_mask_instance,
-            embeded_image=embeded_image,
-            embeded_image_ratio=float(embeded_image_ratio) if embeded_image else 0,
-        )
 
-        # 이미지를 바이트로 변환
+        # 이미지를 바이트로 변환 (색 수에 맞는 팔레트 PNG 또는 무손실 WebP)
         buffer = BytesIO()
-        img.save(buffer, format="PNG")
-        return buffer.getvalue()
+        write_image(img, buffer, output_format)
+        qr_image = buffer.getvalue()
+        render_cache.set(cache_key, qr_image)
+        return qr_image
 
+    except PixelBudgetExceeded:
+        raise
     except Exception as e:
         traceback.print_exc()
         logger.error(f"Error creating QR Code: {e}")
@@ -158,11 +304,15 @@ def create_qr_code(
 def generate_url_qr(
     url: str,
     style: Type[QRStyles] = QRStyles.SQUARE_MODULE,
+    eye_style: Type[QREyeStyles] = QREyeStyles.SQUARE,
     fill_color: str = "black",
     back_color: str = "white",
     color_mask: Type[QRColorMasks] = QRColorMasks.SOLID_FILL,
     embedded_image: Image = None,
-    embedded_image_ratio: float = 0.25
+    embedded_image_ratio: float = 0.25,
+    size: int = None,
+    border: int = DEFAULT_BORDER,
+    output_format: Type[QROutputFormats] = QROutputFormats.PNG,
 ) -> bytes:
     """
     URL QR Code 생성
@@ -174,24 +324,32 @@ def generate_url_qr(
         bytes: 생성된 QR 코드 이미지(PNG 포맷).
     """
     return create_qr_code(
-        url,
+        build_url_payload(url),
         style=style,
+        eye_style=eye_style,
         fill_color=fill_color,
         back_color=back_color,
         color_mask=color_mask,
         embeded_image=embedded_image,
-        embeded_image_ratio=embedded_image_ratio
+        embeded_image_ratio=embedded_image_ratio,
+        size=size,
+        border=border,
+        output_format=output_format
     )
 
 
 def generate_email_qr(
     email: str, subject: str = "", body: str = "",
     style: Type[QRStyles] = QRStyles.SQUARE_MODULE,
+    eye_style: Type[QREyeStyles] = QREyeStyles.SQUARE,
     fill_color: str = "black",
     back_color: str = "white",
     color_mask: Type[QRColorMasks] = QRColorMasks.SOLID_FILL,
     embedded_image: Image = None,
-    embedded_image_ratio: float = 0.25
+    embedded_image_ratio: float = 0.25,
+    size: int = None,
+    border: int = DEFAULT_BORDER,
+    output_format: Type[QROutputFormats] = QROutputFormats.PNG,
 ) -> bytes:
     """
     Email QR Code 생성
@@ -204,34 +362,33 @@ def generate_email_qr(
     Returns:
         bytes: 생성된 QR 코드 이미지(PNG 포맷).
     """
-    mailto = f"mailto:{email}"
-    params = []
-    if subject:
-        params.append(f"subject={subject}")
-    if body:
-        params.append(f"body={body}")
-    if params:
-        mailto += "?" + "&".join(params)
-
     return create_qr_code(
-        mailto,
+        build_email_payload(email, subject=subject, body=body),
         style=style,
+        eye_style=eye_style,
         fill_color=fill_color,
         back_color=back_color,
         color_mask=color_mask,
         embeded_image=embedded_image,
-        embeded_image_ratio=embedded_image_ratio
+        embeded_image_ratio=embedded_image_ratio,
+        size=size,
+        border=border,
+        output_format=output_format
     )
 
 
 def generate_text_qr(
     text: str,  # text를 필수 매개변수로 변경
     style: Type[QRStyles] = QRStyles.SQUARE_MODULE,
+    eye_style: Type[QREyeStyles] = QREyeStyles.SQUARE,
     fill_color: str = "black",
     back_color: str = "white",
     color_mask: Type[QRColorMasks] = QRColorMasks.SOLID_FILL,
     embedded_image: Image = None,
     embedded_image_ratio: float = 0.25,
+    size: int = None,
+    border: int = DEFAULT_BORDER,
+    output_format: Type[QROutputFormats] = QROutputFormats.PNG,
 ) -> bytes:
     """
     Plain Text QR Code 생성
@@ -248,29 +405,34 @@ def generate_text_qr(
     Returns:
         bytes: 생성된 QR 코드 이미지(PNG 포맷).
     """
-    if text is None:
-        raise ValueError("Text content is required")
-
     return create_qr_code(
-        text,
+        build_text_payload(text),
         style=style,
+        eye_style=eye_style,
         fill_color=fill_color,
         back_color=back_color,
         color_mask=color_mask,
         error_correction=ERROR_CORRECT_H if embedded_image else ERROR_CORRECT_L,
         embeded_image=embedded_image,
-        embeded_image_ratio=embedded_image_ratio
+        embeded_image_ratio=embedded_image_ratio,
+        size=size,
+        border=border,
+        output_format=output_format
     )
 
 
 def generate_phone_qr(
     phone_number: str,
     style: Type[QRStyles] = QRStyles.SQUARE_MODULE,
+    eye_style: Type[QREyeStyles] = QREyeStyles.SQUARE,
     fill_color: str = "black",
     back_color: str = "white",
     color_mask: Type[QRColorMasks] = QRColorMasks.SOLID_FILL,
     embedded_image: Image = None,
-    embedded_image_ratio: float = 0.25
+    embedded_image_ratio: float = 0.25,
+    size: int = None,
+    border: int = DEFAULT_BORDER,
+    output_format: Type[QROutputFormats] = QROutputFormats.PNG,
 ) -> bytes:
     """
     Phone Number QR Code 생성
@@ -281,14 +443,17 @@ def generate_phone_qr(
     Returns:
         bytes: The generated QR code image in PNG format.
     """
-    tel = f"tel:{phone_number}"
-    return create_qr_code(tel,
+    return create_qr_code(build_phone_payload(phone_number),
         style=style,
+        eye_style=eye_style,
         fill_color=fill_color,
         back_color=back_color,
         color_mask=color_mask,
         embeded_image=embedded_image,
-        embeded_image_ratio=embedded_image_ratio
+        embeded_image_ratio=embedded_image_ratio,
+        size=size,
+        border=border,
+        output_format=output_format
     )
 
 
@@ -306,64 +471,42 @@ def generate_vcard_qr(
     country: str = "",
     note: str = "",
     style: Type[QRStyles] = QRStyles.SQUARE_MODULE,
+    eye_style: Type[QREyeStyles] = QREyeStyles.SQUARE,
     fill_color: str = "black",
     back_color: str = "white",
     color_mask: Type[QRColorMasks] = QRColorMasks.SOLID_FILL,
     embedded_image: Image = None,
-    embedded_image_ratio: float = 0.25) -> bytes:
-    # VCard 생성 로직
-    vcard_data = {
-        "first_name": first_name,
-        "last_name": last_name,
-        "vcard_mobile": vcard_mobile,
-        "vcard_email": vcard_email,
-        "vcard_url": vcard_url,
-        "organization": organization,
-        "job_title": job_title,
-        "fax": fax,
-        "address": address,
-        "zip": zip,
-        "country": country,
-        "note": note,
-    }
+    embedded_image_ratio: float = 0.25,
+    size: int = None,
+    border: int = DEFAULT_BORDER,
+    output_format: Type[QROutputFormats] = QROutputFormats.PNG) -> bytes:
     try:
-        vcard = "BEGIN:VCARD\nVERSION:3.0\n"
-        vcard += (
-            f"N:{vcard_data.get('last_name', '')};{vcard_data.get('first_name', '')}\n"
-        )
-        vcard += (
-            f"FN:{vcard_data.get('first_name', '')} {vcard_data.get('last_name', '')}\n"
+        vcard = build_vcard_payload(
+            first_name, last_name,
+            vcard_mobile=vcard_mobile,
+            vcard_email=vcard_email,
+            vcard_url=vcard_url,
+            organization=organization,
+            job_title=job_title,
+            fax=fax,
+            address=address,
+            zip=zip,
+            country=country,
+            note=note,
         )
-        if vcard_data.get("birthday"):
-            vcard += f"BDAY:{vcard_data.get('birthday')}\n"
-        if vcard_data.get("vcard_email"):
-            vcard += f"EMAIL:{vcard_data.get('vcard_email')}\n"
-        if vcard_data.get("vcard_phone"):
-            vcard += f"TEL;TYPE=VOICE:{vcard_data.get('vcard_phone')}\n"
-        if vcard_data.get("vcard_mobile"):
-            vcard += f"TEL;TYPE=CELL:{vcard_data.get('vcard_mobile')}\n"
-        if vcard_data.get("organization"):
-            vcard += f"ORG:{vcard_data.get('organization')}\n"
-        if vcard_data.get("job_title"):
-            vcard += f"TITLE:{vcard_data.get('job_title')}\n"
-        if vcard_data.get("address"):
-            vcard += f"ADR;TYPE=HOME:;;{vcard_data.get('address')};;;;\n"
-        if vcard_data.get("label"):
-            vcard += f"LABEL;TYPE=HOME:{vcard_data.get('label')}\n"
-        if vcard_data.get("vcard_url"):
-            vcard += f"URL:{vcard_data.get('vcard_url')}\n"
-        if vcard_data.get("note"):
-            vcard += f"NOTE:{vcard_data.get('note')}\n"
-        vcard += "END:VCARD"
 
         return create_qr_code(
             vcard,
             style=style,
+            eye_style=eye_style,
             fill_color=fill_color,
             back_color=back_color,
             color_mask=color_mask,
             embeded_image=embedded_image,
-            embeded_image_ratio=embedded_image_ratio
+            embeded_image_ratio=embedded_image_ratio,
+            size=size,
+            border=border,
+            output_format=output_format
         )
     except Exception as e:
         logger.error(f"Error creating VCard QR Code: {e}")
@@ -376,11 +519,15 @@ def generate_wifi_qr(
     encryption: str = "WPA",
     hidden: bool = False,
     style: Type[QRStyles] = QRStyles.SQUARE_MODULE,
+    eye_style: Type[QREyeStyles] = QREyeStyles.SQUARE,
     fill_color: str = "black",
     back_color: str = "white",
     color_mask: Type[QRColorMasks] = QRColorMasks.SOLID_FILL,
     embedded_image: Image = None,
-    embedded_image_ratio: float = 0.25
+    embedded_image_ratio: float = 0.25,
+    size: int = None,
+    border: int = DEFAULT_BORDER,
+    output_format: Type[QROutputFormats] = QROutputFormats.PNG,
 ) -> bytes:
     """
     WiFi 설정을 위한 QR 코드 생성
@@ -401,40 +548,21 @@ def generate_wifi_qr(
         bytes: 생성된 QR 코드 이미지(PNG 포맷)
     """
     try:
-        # WiFi 문자열 생성
-        wifi_string = "WIFI:"
-
-        # 암호화 설정
-        if encryption.lower() == "none":
-            wifi_string += "T:nopass;"
-        else:
-            wifi_string += f"T:{encryption};"
-
-        # SSID 추가
-        wifi_string += f"S:{ssid};"
-
-        # 비밀번호가 있는 경우에만 추가
-        if password:
-            wifi_string += f"P:{password};"
-
-        # 숨겨진 네트워크 설정
-        if hidden:
-            wifi_string += "H:true;"
-
-        # 마지막 세미콜론 추가
-        wifi_string += ";"
-
-        logger.debug(f"Generated WiFi string: {wifi_string}")  # 디버깅용 로그
+        wifi_string = build_wifi_payload(ssid, password=password, encryption=encryption, hidden=hidden)
 
         return create_qr_code(
             wifi_string,
             version=2,
             style=style,
+            eye_style=eye_style,
             fill_color=fill_color,
             back_color=back_color,
             color_mask=color_mask,
             embeded_image=embedded_image,
-            embeded_image_ratio=embedded_image_ratio
+            embeded_image_ratio=embedded_image_ratio,
+            size=size,
+            border=border,
+            output_format=output_format
         )
     except Exception as e:
         logger.error(f"Error creating WiFi QR Code: {e}")
@@ -445,11 +573,15 @@ def generate_sms_qr(
     phone_number: str,
     message: str = "",  # message를 선택적 매개변수로 변경
     style: Type[QRStyles] = QRStyles.SQUARE_MODULE,
+    eye_style: Type[QREyeStyles] = QREyeStyles.SQUARE,
     fill_color: str = "black",
     back_color: str = "white",
     color_mask: Type[QRColorMasks] = QRColorMasks.SOLID_FILL,
     embedded_image: Image = None,
-    embedded_image_ratio: float = 0.25
+    embedded_image_ratio: float = 0.25,
+    size: int = None,
+    border: int = DEFAULT_BORDER,
+    output_format: Type[QROutputFormats] = QROutputFormats.PNG,
 ) -> bytes:
     """
     Generate a QR code for an SMS message.
@@ -468,21 +600,20 @@ def generate_sms_qr(
         bytes: 생성된 QR 코드 이미지(PNG 포맷)
     """
     try:
-        # SMS 문자열 생성
-        sms = f"SMSTO:{phone_number}"
-        if message:  # 메시지가 있는 경우에만 추가
-            sms += f":{message}"
-
-        logger.debug(f"Generated SMS string: {sms}")  # 디버깅용 로그
+        sms = build_sms_payload(phone_number, message=message)
 
         return create_qr_code(
             sms,
             style=style,
+            eye_style=eye_style,
             fill_color=fill_color,
             back_color=back_color,
             color_mask=color_mask,
             embeded_image=embedded_image,
-            embeded_image_ratio=embedded_image_ratio
+            embeded_image_ratio=embedded_image_ratio,
+            size=size,
+            border=border,
+            output_format=output_format
         )
     except Exception as e:
         logger.error(f"Error creating SMS QR Code: {e}")
@@ -492,11 +623,15 @@ def generate_sms_qr(
 def generate_geo_qr(
     latitude: str, longitude: str, query: str = "", zoom: str = "0",
     style: Type[QRStyles] = QRStyles.SQUARE_MODULE,
+    eye_style: Type[QREyeStyles] = QREyeStyles.SQUARE,
     fill_color: str = "black",
     back_color: str = "white",
     color_mask: Type[QRColorMasks] = QRColorMasks.SOLID_FILL,
     embedded_image: Image = None,
-    embedded_image_ratio: float = 0.25
+    embedded_image_ratio: float = 0.25,
+    size: int = None,
+    border: int = DEFAULT_BORDER,
+    output_format: Type[QROutputFormats] = QROutputFormats.PNG,
 ) -> bytes:
     """
     Geographic QR Code 생성
@@ -511,24 +646,18 @@ def generate_geo_qr(
         bytes: The generated QR code image in PNG format.
     """
     try:
-        latitude = float(latitude)
-        longitude = float(longitude)
-        zoom = int(zoom)
-        geo_uri = f"geo:{latitude},{longitude}"
-        params = []
-        if zoom > 0:
-            params.append(f"z={zoom}")
-        if query:
-            params.append(f"q={query}")
-        if params:
-            geo_uri += "?" + "&".join(params)
+        geo_uri = build_geo_payload(latitude, longitude, query=query, zoom=zoom)
         return create_qr_code(geo_uri,
             style=style,
+            eye_style=eye_style,
             fill_color=fill_color,
             back_color=back_color,
             color_mask=color_mask,
             embeded_image=embedded_image,
-            embeded_image_ratio=embedded_image_ratio
+            embeded_image_ratio=embedded_image_ratio,
+            size=size,
+            border=border,
+            output_format=output_format
         )
     except Exception as e:
         logger.error(f"Error creating Geo QR Code: {e}")
@@ -542,11 +671,15 @@ def generate_event_qr(
     location: str,
     description: str,
     style: Type[QRStyles] = QRStyles.SQUARE_MODULE,
+    eye_style: Type[QREyeStyles] = QREyeStyles.SQUARE,
     fill_color: str = "black",
     back_color: str = "white",
     color_mask: Type[QRColorMasks] = QRColorMasks.SOLID_FILL,
     embedded_image: Image = None,
-    embedded_image_ratio: float = 0.25
+    embedded_image_ratio: float = 0.25,
+    size: int = None,
+    border: int = DEFAULT_BORDER,
+    output_format: Type[QROutputFormats] = QROutputFormats.PNG,
 ) -> bytes:
     """
     Calendar Event QR Code 생성
@@ -559,22 +692,18 @@ def generate_event_qr(
         bytes: 생성된 QR 코드 이미지(PNG 포맷)
     """
     try:
-        vcal = "BEGIN:VCALENDAR\nVERSION:2.0\nBEGIN:VEVENT\n"
-        vcal += f"SUMMARY:{title}\n"
-        vcal += f"DTSTART:{start}\n"
-        vcal += f"DTEND:{end}\n"
-        if location:
-            vcal += f"LOCATION:{location}\n"
-        if description:
-            vcal += f"DESCRIPTION:{description}\n"
-        vcal += "END:VEVENT\nEND:VCALENDAR"
+        vcal = build_event_payload(title, start, end, location, description)
         return create_qr_code(vcal,
             style=style,
+            eye_style=eye_style,
             fill_color=fill_color,
             back_color=back_color,
             color_mask=color_mask,
             embeded_image=embedded_image,
-            embeded_image_ratio=embedded_image_ratio
+            embeded_image_ratio=embedded_image_ratio,
+            size=size,
+            border=border,
+            output_format=output_format
         )
     except Exception as e:
         logger.error(f"Error creating Event QR Code: {e}")
@@ -584,11 +713,15 @@ def generate_event_qr(
 def generate_mecard_qr(
     name: str, reading: str, tel: str, email: str, memo: str = "", birthday: str = "", address: str = "", url: str = "", nickname: str = "",
     style: Type[QRStyles] = QRStyles.SQUARE_MODULE,
+    eye_style: Type[QREyeStyles] = QREyeStyles.SQUARE,
     fill_color: str = "black",
     back_color: str = "white",
     color_mask: Type[QRColorMasks] = QRColorMasks.SOLID_FILL,
     embedded_image: Image = None,
-    embedded_image_ratio: float = 0.25
+    embedded_image_ratio: float = 0.25,
+    size: int = None,
+    border: int = DEFAULT_BORDER,
+    output_format: Type[QROutputFormats] = QROutputFormats.PNG,
 ) -> bytes:
     """
     MECARD QR Code 생성
@@ -601,33 +734,21 @@ def generate_mecard_qr(
         bytes: 생성된 QR 코드 이미지(PNG 포맷)
     """
     try:
-        mecard = "MECARD:"
-        if name:
-            mecard += f"N:{name};"
-        if reading:
-            mecard += f"SOUND:{reading};"
-        if tel:
-            mecard += f"TEL:{tel};"
-        if email:
-            mecard += f"EMAIL:{email};"
-        if memo:
-            mecard += f"NOTE:{memo};"
-        if birthday:
-            mecard += f"BDAY:{birthday};"
-        if address:
-            mecard += f"ADR:{address};"
-        if url:
-            mecard += f"URL:{url};"
-        if nickname:
-            mecard += f"NICKNAME:{nickname};"
-        mecard += ";"
+        mecard = build_mecard_payload(
+            name, reading, tel, email,
+            memo=memo, birthday=birthday, address=address, url=url, nickname=nickname,
+        )
         return create_qr_code(mecard,
             style=style,
+            eye_style=eye_style,
             fill_color=fill_color,
             back_color=back_color,
             color_mask=color_mask,
             embeded_image=embedded_image,
-            embeded_image_ratio=embedded_image_ratio
+            embeded_image_ratio=embedded_image_ratio,
+            size=size,
+            border=border,
+            output_format=output_format
         )
     except Exception as e:
         logger.error(f"Error creating MECARD QR Code: {e}")
@@ -636,11 +757,15 @@ def generate_mecard_qr(
 
 def generate_whatsapp_qr(phone_number: str, message: str = "",
     style: Type[QRStyles] = QRStyles.SQUARE_MODULE,
+    eye_style: Type[QREyeStyles] = QREyeStyles.SQUARE,
     fill_color: str = "black",
     back_color: str = "white",
     color_mask: Type[QRColorMasks] = QRColorMasks.SOLID_FILL,
     embedded_image: Image = None,
-    embedded_image_ratio: float = 0.25
+    embedded_image_ratio: float = 0.25,
+    size: int = None,
+    border: int = DEFAULT_BORDER,
+    output_format: Type[QROutputFormats] = QROutputFormats.PNG,
 ) -> bytes:
     """
     WhatsApp QR Code 생성
@@ -653,18 +778,18 @@ def generate_whatsapp_qr(phone_number: str, message: str = "",
         bytes: 생성된 QR 코드 이미지(PNG 포맷)
     """
     try:
-        whatsapp_uri = f"https://wa.me/{phone_number}"
-        if message:
-            query_params = {"text": message}
-            encoded_params = urllib.parse.urlencode(query_params)
-            whatsapp_uri += f"?{encoded_params}"
+        whatsapp_uri = build_whatsapp_payload(phone_number, message=message)
         return create_qr_code(whatsapp_uri,
             style=style,
+            eye_style=eye_style,
             fill_color=fill_color,
             back_color=back_color,
             color_mask=color_mask,
             embeded_image=embedded_image,
-            embeded_image_ratio=embedded_image_ratio
+            embeded_image_ratio=embedded_image_ratio,
+            size=size,
+            border=border,
+            output_format=output_format
         )
     except Exception as e:
         logger.error(f"Error creating WhatsApp QR Code: {e}")
@@ -674,11 +799,15 @@ def generate_whatsapp_qr(phone_number: str, message: str = "",
 def generate_bitcoin_qr(
     address: str, amount: float = None, label: str = "", message: str = "",
     style: Type[QRStyles] = QRStyles.SQUARE_MODULE,
+    eye_style: Type[QREyeStyles] = QREyeStyles.SQUARE,
     fill_color: str = "black",
     back_color: str = "white",
     color_mask: Type[QRColorMasks] = QRColorMasks.SOLID_FILL,
     embedded_image: Image = None,
-    embedded_image_ratio: float = 0.25
+    embedded_image_ratio: float = 0.25,
+    size: int = None,
+    border: int = DEFAULT_BORDER,
+    output_format: Type[QROutputFormats] = QROutputFormats.PNG,
 ) -> bytes:
     """
     Bitcoin QR Code 생성
@@ -693,23 +822,18 @@ def generate_bitcoin_qr(
         bytes: 생성된 QR 코드 이미지(PNG 포맷)
     """
     try:
-        bitcoin_uri = f"bitcoin:{address}"
-        params = []
-        if amount is not None:
-            params.append(f"amount={amount}")
-        if label:
-            params.append(f"label={label}")
-        if message:
-            params.append(f"message={message}")
-        if params:
-            bitcoin_uri += "?" + "&".join(params)
+        bitcoin_uri = build_bitcoin_payload(address, amount=amount, label=label, message=message)
         return create_qr_code(bitcoin_uri,
             style=style,
+            eye_style=eye_style,
             fill_color=fill_color,
             back_color=back_color,
             color_mask=color_mask,
             embeded_image=embedded_image,
-            embeded_image_ratio=embedded_image_ratio
+            embeded_image_ratio=embedded_image_ratio,
+            size=size,
+            border=border,
+            output_format=output_format
         )
     except Exception as e:
         logger.error(f"Error creating Bitcoin QR Code: {e}")
@@ -0,0 +1,91 @@
+# qr/utils/signing.py
+"""
+GET 렌더링 URL의 정규화와 HMAC 서명
+
+QR_URL_SIGNING_KEY가 설정되어 있으면 GET 렌더링 요청은 유효한 sig 파라미터가 있어야 한다.
+(서명된 URL만 CDN/브라우저 캐시에 올라가도록 해서 임의 파라미터로 렌더링을 유발하는 것을 막는다)
+"""
+import hashlib
+import hmac
+import logging
+import time
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.utils.crypto import constant_time_compare
+
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_PARAM = 'sig'
+EXPIRES_PARAM = 'expires'
+
+
+def get_signing_key() -> Optional[str]:
+    return getattr(settings, 'QR_URL_SIGNING_KEY', None)
+
+
+def _items(params) -> Iterable[Tuple[str, str]]:
+    """QueryDict와 일반 dict 모두에서 (key, value) 목록을 꺼냄. 리스트 값은 순서를 유지한다."""
+    if hasattr(params, 'lists'):
+        pairs = params.lists()
+    else:
+        pairs = ((key, value if isinstance(value, (list, tuple)) else [value]) for key, value in params.items())
+    for key, values in pairs:
+        for value in values:
+            yield key, str(value)
+
+
+def canonical_params(params, exclude: Iterable[str] = (SIGNATURE_PARAM,)) -> List[Tuple[str, str]]:
+    """키 순으로 정렬한 (key, value) 목록. 같은 키의 여러 값은 원래 순서를 유지한다."""
+    excluded = set(exclude)
+    items = [(key, value) for key, value in _items(params) if key not in excluded]
+    return sorted(items, key=lambda item: item[0])
+
+
+def canonical_query(params, exclude: Iterable[str] = (SIGNATURE_PARAM,)) -> str:
+    return urlencode(canonical_params(params, exclude))
+
+
+def compute_signature(path: str, params, key: Optional[str] = None) -> str:
+    """경로와 정규화된 쿼리에 대한 HMAC-SHA256 서명 (hex)"""
+    key = key or get_signing_key()
+    message = f"{path}?{canonical_query(params)}".encode('utf-8')
+    return hmac.new(key.encode('utf-8'), message, hashlib.sha256).hexdigest()
+
+
+def sign_url(path: str, params: dict, key: Optional[str] = None, expires_in: Optional[int] = None) -> str:
+    """
+    서명된 GET 렌더링 URL 생성
+
+    Args:
+        path (str): 렌더링 엔드포인트 경로 (예: /api/v1/qr/url)
+        params (dict): 렌더링 파라미터
+        expires_in (int, optional): 만료까지 남은 초. None이면 만료 없음
+    """
+    params = dict(params)
+    if expires_in is not None:
+        params[EXPIRES_PARAM] = int(time.time()) + expires_in
+    query = canonical_params(params)
+    query.append((SIGNATURE_PARAM, compute_signature(path, params, key=key)))
+    return f"{path}?{urlencode(query)}"
+
+
+def verify_signature(path: str, params, key: Optional[str] = None, now: Optional[float] = None) -> bool:
+    """서명과 만료 시간을 확인. 서명 키가 설정되지 않았으면 항상 True"""
+    key = key or get_signing_key()
+    if not key:
+        return True
+
+    signature = params.get(SIGNATURE_PARAM)
+    if not signature or not constant_time_compare(signature, compute_signature(path, params, key=key)):
+        return False
+
+    expires = params.get(EXPIRES_PARAM)
+    if expires is not None:
+        try:
+            return int(expires) >= (now if now is not None else time.time())
+        except ValueError:
+            return False
+    return True
@@ -0,0 +1,68 @@
+# qr/utils/sizing.py
+"""
+요청한 픽셀 크기에 맞는 box_size 계산과 서버 측 최대 픽셀 제한
+"""
+import logging
+from typing import Optional
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BOX_SIZE = 10
+DEFAULT_BORDER = 4
+DEFAULT_MAX_IMAGE_PIXELS = 2048
+
+# 최대 픽셀을 넘는 요청 처리 방식: 'clamp'는 box_size를 줄이고, 'reject'는 렌더링 전에 거절
+PIXEL_BUDGET_CLAMP = 'clamp'
+PIXEL_BUDGET_REJECT = 'reject'
+
+
+class PixelBudgetExceeded(ValueError):
+    """요청된 QR 이미지가 QR_MAX_IMAGE_PIXELS를 넘을 때 발생"""
+
+    def __init__(self, pixels: int, max_pixels: int):
+        self.pixels = pixels
+        self.max_pixels = max_pixels
+        super().__init__(f"QR image of {pixels}px exceeds the maximum of {max_pixels}px")
+
+    def __reduce__(self):
+        # 렌더 풀 워커에서 발생한 예외를 부모 프로세스로 전달할 수 있도록
+        return type(self), (self.pixels, self.max_pixels)
+
+
+def get_max_image_pixels() -> int:
+    return getattr(settings, 'QR_MAX_IMAGE_PIXELS', DEFAULT_MAX_IMAGE_PIXELS)
+
+
+def resolve_box_size(modules_count: int, border: int = DEFAULT_BORDER, size: Optional[int] = None) -> int:
+    """
+    모듈 수와 요청 크기로 box_size(모듈 한 칸의 픽셀 수)를 결정
+
+    size가 주어지면 (모듈 수 + 테두리) * box_size가 size를 넘지 않는 가장 큰 box_size를 고른다.
+    결과 이미지가 QR_MAX_IMAGE_PIXELS를 넘으면 QR_PIXEL_BUDGET_POLICY에 따라 box_size를 줄이거나
+    PixelBudgetExceeded를 발생시킨다. (렌더링 전에 호출)
+
+    Args:
+        modules_count (int): QR 코드 한 변의 모듈 수
+        border (int): 테두리 모듈 수
+        size (int, optional): 목표 이미지 한 변의 픽셀 수. None이면 기본 box_size 사용
+
+    Returns:
+        int: 1 이상의 box_size
+    """
+    extent = modules_count + border * 2
+    box_size = max(1, size // extent) if size else DEFAULT_BOX_SIZE
+
+    max_pixels = get_max_image_pixels()
+    if extent * box_size <= max_pixels:
+        return box_size
+
+    policy = getattr(settings, 'QR_PIXEL_BUDGET_POLICY', PIXEL_BUDGET_CLAMP)
+    clamped = max_pixels // extent
+    if policy == PIXEL_BUDGET_REJECT or clamped < 1:
+        raise PixelBudgetExceeded(extent * box_size, max_pixels)
+
+    logger.debug(f"Clamping QR box size {box_size} -> {clamped} ({extent} modules, max {max_pixels}px)")
+    return clamped
@@ -0,0 +1,223 @@
+# qr/utils/sprites.py
+"""
+모듈 스프라이트 스탬핑 렌더러
+
+qrcode의 StyledPilImage는 모듈마다 드로어의 drawrect를 호출하고, 원형/라운드/바 드로어는
+그때마다 PIL 그리기와 슈퍼샘플링을 거친다. 하지만 한 모듈 칸의 픽셀은
+(드로어 종류, box_size, 상하좌우 이웃 여부, 색상)만으로 결정되므로, 가능한 경우의 수를
+스프라이트로 한 번만 렌더링해 두고 NumPy 인덱싱으로 격자에 찍어낸다.
+"""
+import logging
+import threading
+from types import SimpleNamespace
+from typing import Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+from PIL import Image
+from qrcode.image.styledpil import StyledPilImage
+from qrcode.image.styles.moduledrawers.pil import (
+    SquareModuleDrawer,
+    CircleModuleDrawer,
+    RoundedModuleDrawer,
+    HorizontalBarsDrawer,
+    VerticalBarsDrawer,
+)
+from qrcode.main import ActiveWithNeighbors
+
+from .cache import LRUByteCache
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPRITE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# 스프라이트로 대체해도 결과가 같은 드로어와 생성자 파라미터 이름
+# (이 드로어들은 자기 칸 안에만 그리고, 이웃은 상하좌우만 참조한다)
+# GappedSquareModuleDrawer는 실수 좌표 사각형이라 칸 위치에 따라 반올림이 달라지므로 제외
+SPRITE_DRAWER_PARAMS = {
+    SquareModuleDrawer: (),
+    CircleModuleDrawer: (),
+    RoundedModuleDrawer: ('radius_ratio',),
+    HorizontalBarsDrawer: ('vertical_shrink',),
+    VerticalBarsDrawer: ('horizontal_shrink',),
+}
+
+# 스프라이트 인덱스: 0 = 빈 칸, 1..16 = 활성 모듈(1 + N|E<<1|S<<2|W<<3)
+BLANK_SPRITE = 0
+SPRITE_COUNT = 17
+
+# 파인더 패턴(eye) 한 변의 모듈 수와 모양. 바깥쪽은 항상 밝은 구분선이라 이웃 판정이 패턴 안에서 끝난다
+FINDER_SIZE = 7
+FINDER_PATTERN = np.zeros((FINDER_SIZE, FINDER_SIZE), dtype=bool)
+FINDER_PATTERN[[0, -1], :] = True
+FINDER_PATTERN[:, [0, -1]] = True
+FINDER_PATTERN[2:5, 2:5] = True
+
+_sprite_registry: Optional[LRUByteCache] = None
+_sprite_registry_lock = threading.Lock()
+
+
+def get_sprite_registry() -> LRUByteCache:
+    """프로세스 전역 스프라이트 레지스트리 반환"""
+    global _sprite_registry
+    if _sprite_registry is None:
+        with _sprite_registry_lock:
+            if _sprite_registry is None:
+                _sprite_registry = LRUByteCache(
+                    getattr(settings, 'QR_SPRITE_CACHE_MAX_BYTES', DEFAULT_SPRITE_CACHE_MAX_BYTES),
+                    sizeof=lambda sprites: sprites.nbytes,
+                )
+    return _sprite_registry
+
+
+def supports_sprites(*drawers) -> bool:
+    return all(type(drawer) in SPRITE_DRAWER_PARAMS for drawer in drawers)
+
+
+def _drawer_params(drawer) -> Tuple:
+    return tuple((name, getattr(drawer, name)) for name in SPRITE_DRAWER_PARAMS[type(drawer)])
+
+
+def _draw_sprite(drawer, canvas, box_size: int, back_color, context: Optional[ActiveWithNeighbors]) -> np.ndarray:
+    canvas._img.paste(back_color, (0, 0, box_size, box_size))
+    box = ((0, 0), (box_size - 1, box_size - 1))
+    drawer.drawrect(box, context if drawer.needs_neighbors else True)
+    return np.asarray(canvas._img)
+
+
+def _render_sprites(drawer_class, params: Tuple, box_size: int, mode: str, back_color, paint_color) -> np.ndarray:
+    """드로어로 가능한 모든 이웃 조합의 모듈을 그려 (SPRITE_COUNT, box, box, C) 배열로 반환"""
+    # 드로어의 initialize가 참조하는 StyledPilImage 속성만 갖춘 한 칸짜리 캔버스
+    canvas = SimpleNamespace(
+        box_size=box_size,
+        mode=mode,
+        paint_color=paint_color,
+        color_mask=SimpleNamespace(back_color=back_color),
+        _img=Image.new(mode, (box_size, box_size), back_color),
+    )
+    drawer = drawer_class(**dict(params))
+    drawer.initialize(img=canvas)
+
+    sprites = [np.array(canvas._img)]  # BLANK_SPRITE
+    for code in range(16):
+        context = ActiveWithNeighbors(
+            NW=False, N=bool(code & 1), NE=False,
+            W=bool(code & 8), me=True, E=bool(code & 2),
+            SW=False, S=bool(code & 4), SE=False,
+        )
+        sprites.append(_draw_sprite(drawer, canvas, box_size, back_color, context).copy())
+
+    result = np.stack(sprites)
+    result.setflags(write=False)
+    return result
+
+
+def get_module_sprites(drawer, box_size: int, mode: str, back_color, paint_color) -> np.ndarray:
+    """(드로어, box_size, 모드, 색상)별 스프라이트 세트를 레지스트리에서 조회하거나 새로 렌더링"""
+    key = (type(drawer).__name__, _drawer_params(drawer), box_size, mode, tuple(back_color), tuple(paint_color))
+    registry = get_sprite_registry()
+    sprites = registry.get(key)
+    if sprites is None:
+        sprites = _render_sprites(type(drawer), _drawer_params(drawer), box_size, mode, back_color, paint_color)
+        registry.set(key, sprites)
+    return sprites
+
+
+def get_finder_sprite(eye_drawer, box_size: int, mode: str, back_color, paint_color) -> np.ndarray:
+    """
+    eye 드로어로 그린 파인더 패턴 한 개를 (7 * box, 7 * box, C) 배열로 반환
+
+    (eye 드로어, box_size, 모드, 색상)별로 한 번만 만들어 레지스트리에 보관하고,
+    QR 코드의 세 모서리에는 이 스프라이트를 그대로 붙인다.
+    """
+    key = ('finder', type(eye_drawer).__name__, _drawer_params(eye_drawer), box_size, mode,
+           tuple(back_color), tuple(paint_color))
+    registry = get_sprite_registry()
+    finder = registry.get(key)
+    if finder is None:
+        sprites = get_module_sprites(eye_drawer, box_size, mode, back_color, paint_color)
+        finder = stamp_sprites(sprites, neighbour_codes(FINDER_PATTERN, eye_drawer.needs_neighbors))
+        finder.setflags(write=False)
+        registry.set(key, finder)
+    return finder
+
+
+def eye_region(size: int) -> np.ndarray:
+    """파인더 패턴(eye) 영역 bool 마스크. BaseImage.is_eye와 같은 영역"""
+    region = np.zeros((size, size), dtype=bool)
+    for row, col in finder_origins(size):
+        region[row:row + FINDER_SIZE, col:col + FINDER_SIZE] = True
+    return region
+
+
+def finder_origins(size: int) -> Tuple[Tuple[int, int], ...]:
+    """세 파인더 패턴의 왼쪽 위 모듈 좌표 (row, col)"""
+    return ((0, 0), (0, size - FINDER_SIZE), (size - FINDER_SIZE, 0))
+
+
+def neighbour_codes(modules: np.ndarray, needs_neighbors: bool) -> np.ndarray:
+    """모듈 행렬을 상하좌우 이웃 조합에 따른 스프라이트 인덱스 행렬로 변환"""
+    if needs_neighbors:
+        padded = np.pad(modules, 1, mode='constant', constant_values=False)
+        north = padded[:-2, 1:-1]
+        south = padded[2:, 1:-1]
+        west = padded[1:-1, :-2]
+        east = padded[1:-1, 2:]
+        codes = 1 + (north * 1 + east * 2 + south * 4 + west * 8)
+    else:
+        codes = np.full(modules.shape, 1)
+    return np.where(modules, codes, BLANK_SPRITE)
+
+
+def module_sprite_codes(modules: np.ndarray, needs_neighbors: bool) -> np.ndarray:
+    """모듈 행렬을 스프라이트 인덱스 행렬로 변환. 파인더 패턴 영역은 비워 두고 따로 붙인다"""
+    codes = neighbour_codes(modules, needs_neighbors)
+    return np.where(eye_region(modules.shape[0]), BLANK_SPRITE, codes)
+
+
+def stamp_sprites(sprites: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """스프라이트 인덱스 행렬로부터 (n * box, n * box, C) 픽셀 배열 생성"""
+    n = codes.shape[0]
+    _, box_size, _, channels = sprites.shape
+    tiles = sprites[codes]  # (n, n, box, box, C)
+    return tiles.transpose(0, 2, 1, 3, 4).reshape(n * box_size, n * box_size, channels)
+
+
+class SpriteStyledPilImage(StyledPilImage):
+    """
+    모듈을 하나씩 그리는 대신 스프라이트를 격자에 찍는 StyledPilImage
+
+    파인더 패턴은 eye 드로어로 미리 그린 스프라이트를 세 모서리에 붙인다.
+    컬러 마스크와 임베드 이미지 처리는 StyledPilImage와 동일하다.
+    모듈 드로어와 eye 드로어 모두 SPRITE_DRAWER_PARAMS에 있어야 한다.
+    """
+
+    needs_drawrect = False
+
+    def process(self):
+        self.stamp_modules()
+        super().process()
+
+    def stamp_modules(self):
+        sprites = get_module_sprites(
+            self.module_drawer,
+            self.box_size,
+            self._img.mode,
+            self.color_mask.back_color,
+            self.paint_color,
+        )
+        finder = get_finder_sprite(
+            self.eye_drawer,
+            self.box_size,
+            self._img.mode,
+            self.color_mask.back_color,
+            self.paint_color,
+        )
+        modules = np.array(self.modules, dtype=bool)
+        pixels = stamp_sprites(sprites, module_sprite_codes(modules, self.module_drawer.needs_neighbors))
+        for row, col in finder_origins(self.width):
+            y, x = row * self.box_size, col * self.box_size
+            pixels[y:y + finder.shape[0], x:x + finder.shape[1]] = finder
+        offset = self.border * self.box_size
+        self._img.paste(Image.fromarray(pixels), (offset, offset))
@@ -0,0 +1,196 @@
+# qr/utils/store.py
+"""
+디스크 기반 렌더 저장소
+
+렌더링 결과를 렌더 키(make_render_key) 경로에 한 번만 기록하고, 같은 요청은 파일을 그대로 내보낸다.
+MEDIA_ROOT 아래 파일이므로 워커 재시작/배포 후에도 남고, 한 호스트의 모든 gunicorn 워커가 공유한다.
+
+경로: <root>/<key[0:2]>/<key[2:4]>/<key>.<ext>
+"""
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+from django.conf import settings
+
+from ..constants import QROutputFormats
+
+try:
+    import fcntl
+except ImportError:  # Windows: 정리 작업 간 잠금 없이 동작
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RENDER_STORE_MAX_BYTES = 1024 * 1024 * 1024
+SHARD_WIDTH = 2
+SHARD_DEPTH = 2
+
+# 정리 후 남길 용량 비율 (매 기록마다 정리하지 않도록 여유를 둔다)
+EVICTION_LOW_WATER = 0.9
+EVICTION_LOCK_NAME = '.evict.lock'
+
+
+class RenderStore:
+    """
+    렌더 키로 주소가 정해지는 디스크 저장소
+
+    Args:
+        root (str): 저장소 루트 디렉터리
+        max_bytes (int): 전체 용량. 넘으면 가장 오래 사용되지 않은(mtime) 파일부터 삭제
+        sweep_interval_bytes (int, optional): 이 프로세스에서 이만큼 기록할 때마다 용량을 확인.
+            기본값은 max_bytes의 1/16
+    """
+
+    def __init__(self, root: str, max_bytes: int, sweep_interval_bytes: Optional[int] = None):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.sweep_interval_bytes = sweep_interval_bytes or max(1, max_bytes // 16)
+        self._written_since_sweep = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def relative_path(self, key: str, output_format: QROutputFormats) -> str:
+        shards = [key[i * SHARD_WIDTH:(i + 1) * SHARD_WIDTH] for i in range(SHARD_DEPTH)]
+        return '/'.join([*shards, f"{key}.{QROutputFormats(output_format).extension}"])
+
+    def path_for(self, key: str, output_format: QROutputFormats) -> Path:
+        return self.root / self.relative_path(key, output_format)
+
+    def get(self, key: str, output_format: QROutputFormats) -> Optional[Path]:
+        """저장된 파일 경로. 없으면 None. 찾으면 mtime을 갱신해 정리 대상에서 뒤로 미룬다."""
+        path = self.path_for(key, output_format)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except OSError as e:
+            logger.warning(f"Render store get failed: {e}")
+            return None
+        self.hits += 1
+        return path
+
+    def put(self, key: str, output_format: QROutputFormats, content: bytes) -> Optional[Path]:
+        """
+        원자적으로 기록 (임시 파일 작성 후 os.replace)
+
+        여러 워커가 같은 키를 동시에 기록해도 내용이 같으므로 마지막 replace가 이기면 된다.
+        """
+        path = self.path_for(key, output_format)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+            try:
+                with os.fdopen(fd, 'wb') as fp:
+                    fp.write(content)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Render store put failed: {e}")
+            return None
+
+        with self._lock:
+            self._written_since_sweep += len(content)
+            should_sweep = self._written_since_sweep >= self.sweep_interval_bytes
+            if should_sweep:
+                self._written_since_sweep = 0
+        if should_sweep:
+            self.evict()
+        return path
+
+    def evict(self) -> int:
+        """
+        용량을 넘으면 mtime이 오래된 파일부터 EVICTION_LOW_WATER까지 삭제
+
+        다른 워커가 이미 정리 중이면 건너뛴다.
+
+        Returns:
+            int: 삭제한 파일 수
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / EVICTION_LOCK_NAME, 'a') as lock_file:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return 0
+            return self._evict_locked()
+
+    def _evict_locked(self) -> int:
+        entries = []
+        total = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.startswith('.'):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return 0
+
+        target = int(self.max_bytes * EVICTION_LOW_WATER)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+
+        self.evictions += removed
+        logger.info(f"Render store evicted {removed} files ({total} bytes remaining)")
+        return removed
+
+    def stats(self) -> dict:
+        return {
+            'root': str(self.root),
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+_render_store: Optional[RenderStore] = None
+_render_store_lock = threading.Lock()
+
+
+def get_render_store() -> Optional[RenderStore]:
+    """settings 기반 프로세스 전역 렌더 저장소. QR_RENDER_STORE_ENABLED가 아니면 None"""
+    global _render_store
+    if not getattr(settings, 'QR_RENDER_STORE_ENABLED', False):
+        return None
+    if _render_store is None:
+        with _render_store_lock:
+            if _render_store is None:
+                root = getattr(settings, 'QR_RENDER_STORE_ROOT', None) or os.path.join(settings.MEDIA_ROOT, 'qr-renders')
+                _render_store = RenderStore(
+                    root=root,
+                    max_bytes=getattr(settings, 'QR_RENDER_STORE_MAX_BYTES', DEFAULT_RENDER_STORE_MAX_BYTES),
+                )
+    return _render_store
+
+
+def reset_render_store() -> None:
+    """설정 변경 후 저장소를 다시 만들도록 전역 인스턴스를 비움 (테스트용)"""
+    global _render_store
+    with _render_store_lock:
+        _render_store = None
@@ -0,0 +1,281 @@
+# qr/utils/svg.py
+"""
+모듈 행렬에서 바로 SVG를 만드는 렌더러
+
+픽셀을 그리지 않고, 인접한 모듈을 사각형/막대로 병합해 하나의 path로 내보낸다.
+좌표는 모듈 단위(viewBox)이므로 인쇄용으로 크기를 바꿔도 깨지지 않는다.
+"""
+import base64
+import logging
+import math
+from io import BytesIO
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+from qrcode.image.styles import colormasks
+
+from ..constants import QRStyles, QREyeStyles
+from .matrix import QRMatrix
+from .renderers import matrix_to_array
+from .sprites import eye_region
+
+
+logger = logging.getLogger(__name__)
+
+FILL_GRADIENT_ID = 'qr-fill'
+
+# qrcode PIL 드로어의 기본 비율과 맞춘 값
+GAPPED_SQUARE_RATIO = 0.8
+BAR_SHRINK = 0.8
+
+
+def _num(value: float) -> str:
+    """SVG 좌표 문자열 (불필요한 0 제거)"""
+    return f"{round(value, 4):g}"
+
+
+def _color(rgb: Sequence[int]) -> Tuple[str, Optional[str]]:
+    """RGB(A) 튜플을 ('#rrggbb', opacity) 로 변환. 불투명이면 opacity는 None"""
+    hex_color = '#{:02x}{:02x}{:02x}'.format(*rgb[:3])
+    if len(rgb) > 3 and rgb[3] != 255:
+        return hex_color, _num(rgb[3] / 255)
+    return hex_color, None
+
+
+def _paint_attrs(attr: str, rgb: Sequence[int]) -> str:
+    hex_color, opacity = _color(rgb)
+    result = f'{attr}="{hex_color}"'
+    if opacity is not None:
+        result += f' {attr}-opacity="{opacity}"'
+    return result
+
+
+def _runs(line: np.ndarray) -> List[Tuple[int, int]]:
+    """bool 1차원 배열에서 연속된 True 구간 [start, end) 목록"""
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], line.astype(np.int8), [0]))))
+    return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
+
+def merged_rects(modules: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    """
+    어두운 모듈을 (x, y, width, height) 사각형으로 병합
+
+    행마다 가로 구간을 구하고, 바로 윗줄과 같은 구간이면 세로로 이어 붙인다.
+    """
+    rects = []
+    open_runs: Dict[Tuple[int, int], int] = {}  # (start, end) -> 시작 행
+    for y, row in enumerate(modules):
+        runs = set(_runs(row))
+        for run in list(open_runs):
+            if run not in runs:
+                top = open_runs.pop(run)
+                rects.append((run[0], top, run[1] - run[0], y - top))
+        for run in runs:
+            open_runs.setdefault(run, y)
+    height = len(modules)
+    for run, top in open_runs.items():
+        rects.append((run[0], top, run[1] - run[0], height - top))
+    return sorted(rects, key=lambda rect: (rect[1], rect[0]))
+
+
+def _square_path(modules: np.ndarray, offset: int) -> List[str]:
+    return [
+        f"M{x + offset} {y + offset}h{w}v{h}h-{w}z"
+        for x, y, w, h in merged_rects(modules)
+    ]
+
+
+def _gapped_square_path(modules: np.ndarray, offset: int) -> List[str]:
+    gap = (1 - GAPPED_SQUARE_RATIO) / 2
+    size = _num(GAPPED_SQUARE_RATIO)
+    return [
+        f"M{_num(x + offset + gap)} {_num(y + offset + gap)}h{size}v{size}h-{size}z"
+        for y, x in zip(*np.nonzero(modules))
+    ]
+
+
+def _circle_path(modules: np.ndarray, offset: int) -> List[str]:
+    return [
+        f"M{x + offset} {_num(y + offset + 0.5)}a.5 .5 0 1 0 1 0a.5 .5 0 1 0 -1 0z"
+        for y, x in zip(*np.nonzero(modules))
+    ]
+
+
+def _rounded_path(modules: np.ndarray, offset: int) -> List[str]:
+    """RoundedModuleDrawer와 같은 규칙: 맞닿은 두 변에 이웃이 없는 모서리만 둥글게"""
+    padded = np.pad(modules, 1, mode='constant', constant_values=False)
+    paths = []
+    for y, x in zip(*np.nonzero(modules)):
+        north, south = padded[y, x + 1], padded[y + 2, x + 1]
+        west, east = padded[y + 1, x], padded[y + 1, x + 2]
+        nw = not (north or west)
+        ne = not (north or east)
+        se = not (south or east)
+        sw = not (south or west)
+        left, top = x + offset, y + offset
+        path = f"M{_num(left + 0.5 * nw)} {top}H{_num(left + 1 - 0.5 * ne)}"
+        path += "a.5 .5 0 0 1 .5 .5" if ne else ""
+        path += f"V{_num(top + 1 - 0.5 * se)}"
+        path += "a.5 .5 0 0 1 -.5 .5" if se else ""
+        path += f"H{_num(left + 0.5 * sw)}"
+        path += "a.5 .5 0 0 1 -.5 -.5" if sw else ""
+        path += f"V{_num(top + 0.5 * nw)}"
+        path += "a.5 .5 0 0 1 .5 -.5" if nw else ""
+        paths.append(path + "z")
+    return paths
+
+
+def _vertical_bars_path(modules: np.ndarray, offset: int) -> List[str]:
+    """세로로 이어진 모듈을 양 끝이 둥근 막대 하나로 병합"""
+    gap = (1 - BAR_SHRINK) / 2
+    radius = _num(BAR_SHRINK / 2)
+    width = _num(BAR_SHRINK)
+    paths = []
+    for x, column in enumerate(modules.T):
+        for start, end in _runs(column):
+            paths.append(
+                f"M{_num(x + offset + gap)} {_num(start + offset + 0.5)}"
+                f"a{radius} .5 0 0 1 {width} 0V{_num(end + offset - 0.5)}"
+                f"a{radius} .5 0 0 1 -{width} 0z"
+            )
+    return paths
+
+
+def _horizontal_bars_path(modules: np.ndarray, offset: int) -> List[str]:
+    """가로로 이어진 모듈을 양 끝이 둥근 막대 하나로 병합"""
+    gap = (1 - BAR_SHRINK) / 2
+    radius = _num(BAR_SHRINK / 2)
+    height = _num(BAR_SHRINK)
+    paths = []
+    for y, row in enumerate(modules):
+        for start, end in _runs(row):
+            paths.append(
+                f"M{_num(start + offset + 0.5)} {_num(y + offset + gap)}"
+                f"H{_num(end + offset - 0.5)}a.5 {radius} 0 0 1 0 {height}"
+                f"H{_num(start + offset + 0.5)}a.5 {radius} 0 0 1 0 -{height}z"
+            )
+    return paths
+
+
+MODULE_PATHS: Dict[QRStyles, Callable[[np.ndarray, int], List[str]]] = {
+    QRStyles.SQUARE_MODULE: _square_path,
+    QRStyles.GAPPED_SQUARE_MODULE: _gapped_square_path,
+    QRStyles.CIRCLE_MODULE: _circle_path,
+    QRStyles.ROUNDED_MODULE: _rounded_path,
+    QRStyles.HORIZONTAL_BARS: _horizontal_bars_path,
+    QRStyles.VERTICAL_BARS: _vertical_bars_path,
+}
+
+# 축에 평행한 사각형만 그리는 스타일 (이음새가 보이지 않도록 crispEdges 사용)
+RECTILINEAR_PATHS = (_square_path, _gapped_square_path)
+
+EYE_PATHS: Dict[QREyeStyles, Callable[[np.ndarray, int], List[str]]] = {
+    QREyeStyles.SQUARE: _square_path,
+    QREyeStyles.CIRCLE: _circle_path,
+    QREyeStyles.ROUNDED: _rounded_path,
+}
+
+
+def _gradient_def(color_mask, extent: int) -> Optional[str]:
+    """
+    그라데이션 마스크를 SVG gradient 정의로 변환 (단색이면 None)
+
+    좌표는 qrcode 마스크와 같은 기준(전체 이미지 폭)을 쓴다. SVG에는 사각형 그라데이션이 없어
+    SquareGradiantColorMask는 같은 중심/반경의 원형 그라데이션으로 근사한다.
+    """
+    def stops(start, end):
+        return ''.join(
+            f'<stop offset="{offset}" {_paint_attrs("stop-color", color)}/>'
+            for offset, color in ((0, start), (1, end))
+        )
+
+    half = _num(extent / 2)
+    if isinstance(color_mask, colormasks.HorizontalGradiantColorMask):
+        return (
+            f'<linearGradient id="{FILL_GRADIENT_ID}" gradientUnits="userSpaceOnUse" '
+            f'x1="0" y1="0" x2="{extent}" y2="0">{stops(color_mask.left_color, color_mask.right_color)}</linearGradient>'
+        )
+    if isinstance(color_mask, colormasks.VerticalGradiantColorMask):
+        return (
+            f'<linearGradient id="{FILL_GRADIENT_ID}" gradientUnits="userSpaceOnUse" '
+            f'x1="0" y1="0" x2="0" y2="{extent}">{stops(color_mask.top_color, color_mask.bottom_color)}</linearGradient>'
+        )
+    if isinstance(color_mask, colormasks.RadialGradiantColorMask):
+        radius = _num(extent / 2 * math.sqrt(2))
+    elif isinstance(color_mask, colormasks.SquareGradiantColorMask):
+        radius = half
+    else:
+        return None
+    return (
+        f'<radialGradient id="{FILL_GRADIENT_ID}" gradientUnits="userSpaceOnUse" '
+        f'cx="{half}" cy="{half}" r="{radius}">{stops(color_mask.center_color, color_mask.edge_color)}</radialGradient>'
+    )
+
+
+def _embedded_image_element(image: Image.Image, ratio: float, extent: int, box_size: int) -> str:
+    """StyledPilImage.draw_embedded_image와 같은 위치(모듈 경계에 맞춘 중앙)에 이미지를 넣는다"""
+    total_width = extent * box_size
+    logo_width_ish = int(total_width * ratio)
+    offset = int((int(total_width / 2) - int(logo_width_ish / 2)) / box_size)
+    size = extent - offset * 2
+
+    buffer = BytesIO()
+    image.resize((size * box_size, size * box_size), Image.Resampling.LANCZOS).save(buffer, format='PNG')
+    encoded = base64.b64encode(buffer.getvalue()).decode('ascii')
+    return (
+        f'<image x="{offset}" y="{offset}" width="{size}" height="{size}" '
+        f'preserveAspectRatio="none" href="data:image/png;base64,{encoded}"/>'
+    )
+
+
+def render_svg(
+    matrix: QRMatrix,
+    box_size: int = 10,
+    border: int = 4,
+    style: QRStyles = QRStyles.SQUARE_MODULE,
+    eye_style: QREyeStyles = QREyeStyles.SQUARE,
+    fill_color: Tuple[int, ...] = (0, 0, 0),
+    back_color: Tuple[int, ...] = (255, 255, 255),
+    color_mask=None,
+    embedded_image: Optional[Image.Image] = None,
+    embedded_image_ratio: float = 0.25,
+) -> bytes:
+    """
+    QR 모듈 행렬을 SVG 문서로 렌더링
+
+    Args:
+        box_size (int): 모듈 한 칸의 픽셀 크기. SVG의 width/height에만 쓰인다.
+        border (int): 테두리 모듈 수
+        color_mask: _build_color_mask로 만든 컬러 마스크. 그라데이션이면 SVG gradient로 채운다.
+
+    Returns:
+        bytes: UTF-8로 인코딩된 SVG 문서
+    """
+    modules = matrix_to_array(matrix)
+    eyes = eye_region(matrix.size)
+    extent = matrix.size + border * 2
+
+    module_path = MODULE_PATHS.get(style, _square_path)
+    eye_path = EYE_PATHS.get(eye_style, _square_path)
+    path = ''.join(module_path(modules & ~eyes, border) + eye_path(modules & eyes, border))
+
+    gradient = _gradient_def(color_mask, extent)
+    fill = f'fill="url(#{FILL_GRADIENT_ID})"' if gradient else _paint_attrs('fill', fill_color)
+
+    pixels = extent * box_size
+    rendering = ''
+    if module_path in RECTILINEAR_PATHS and eye_path in RECTILINEAR_PATHS:
+        rendering = ' shape-rendering="crispEdges"'
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" version="1.1" width="{pixels}" height="{pixels}" '
+        f'viewBox="0 0 {extent} {extent}"{rendering}>'
+    ]
+    if gradient:
+        parts.append(f'<defs>{gradient}</defs>')
+    parts.append(f'<rect width="{extent}" height="{extent}" {_paint_attrs("fill", back_color)}/>')
+    parts.append(f'<path {fill} d="{path}"/>')
+    if embedded_image is not None:
+        parts.append(_embedded_image_element(embedded_image, embedded_image_ratio, extent, box_size))
+    parts.append('</svg>')
+    return ''.join(parts).encode('utf-8')
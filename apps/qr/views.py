@@ -1,8 +1,20 @@
 # qr/views.py
+import csv
+import inspect
+import time
 import traceback
-from typing import Callable, List
-from django.http import HttpResponse, JsonResponse
-from PIL import Image
+from functools import partial
+from typing import Callable, List, NamedTuple, Optional
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, JsonResponse, StreamingHttpResponse
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags
+from django.core.files.storage import default_storage
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.views import View
+from PIL import Image, ImageColor
+from asgiref.sync import sync_to_async
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from django.views.decorators.csrf import csrf_exempt
@@ -13,8 +25,10 @@ from rest_framework.request import Request
 from rest_framework.views import APIView
 from rest_framework.generics import GenericAPIView, CreateAPIView
 from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 
-from apps.qr.constants import QRStyles, QRColorMasks, QREyeStyles
+from apps.accounts.permissions import APIKeyScopePermission
+from apps.qr.constants import QRStyles, QRColorMasks, QREyeStyles, QROutputFormats
 
 from apps.qr.constants.error_codes import QRErrorCodes, QRErrorMessages
 from apps.qr.decorators import qr_swagger_decorator
@@ -33,15 +47,70 @@ from apps.qr.utils.qr_utils import (
     generate_geo_qr,
     list_of_properties_of_serializer,
 )
+from apps.qr.utils.batch import (
+    BATCH_ITEM_TYPES,
+    DEFAULT_BATCH_MAX_ITEMS,
+    build_batch_items,
+    guess_input_format,
+    iter_batch_matrices,
+    stream_batch_zip,
+)
+from apps.qr.utils.pdf import DEFAULT_SHEET_MAX_ITEMS, LABEL_LAYOUTS, PDF_CONTENT_TYPE, stream_label_sheet_pdf
+from apps.qr.utils.bundle import (
+    MULTIPART_CONTENT_TYPE,
+    ZIP_CONTENT_TYPE,
+    build_multipart,
+    build_zip,
+    render_variants,
+)
+from apps.qr.utils.cache import make_render_key
+from apps.qr.utils.cost import COST_HEADER, LANE_HEADER, RenderLane, estimate_render_cost, estimate_request_cost, get_render_lane
+from apps.qr.utils.pool import RenderPoolFull, RenderTimeout, arun_in_render_thread, get_render_pool, run_render
+from apps.qr.utils.signing import EXPIRES_PARAM, canonical_params, verify_signature
+from apps.qr.utils.sizing import PixelBudgetExceeded
+from apps.qr.utils.store import get_render_store
+from apps.qr.jobs import DEFAULT_JOB_CHUNK_SIZE, DEFAULT_JOB_MAX_ITEMS, iter_job_rows
+from apps.qr.models import QRJob
+from apps.usage.meter import record_usage
+from apps.usage.models import UsageRecord
 from apps.qr.serializers import *
 
 logger = logging.getLogger(__name__)
 
+
+class QRRenderPlan(NamedTuple):
+    """검증이 끝난 단일 QR 요청의 렌더링 입력"""
+    generator_params: dict
+    output_format: QROutputFormats
+    sizes: Optional[List[int]]
+    output_formats: List[QROutputFormats]
+
+
 @method_decorator(csrf_exempt, name='dispatch')
 class BaseQrView(CreateAPIView):
     # GenericAPIView의 기능을 활용하기 위한 속성 설정
     serializer_class = None  # 각 하위 클래스에서 정의
+    generator_func = None  # 각 하위 클래스에서 정의 (GET 렌더링에서 사용)
     required_params = []
+    throttle_scope = 'qr'
+    heavy_throttle_scope = 'qr_heavy'
+    api_key_scope = 'qr'
+
+    def get_throttle_scope(self, request: Request) -> str:
+        """예상 렌더링 비용이 느린 레인 기준 이상인 요청(스타일, 그라데이션, 큰 이미지 등)은 별도 범위로 더 엄격하게 제한"""
+        try:
+            params = {
+                key: value[0] if isinstance(value, list) and value else value
+                for key, value in self.get_request_data(request).items()
+            }
+            params['output_format'] = self.get_output_format(request)
+            params['embedded_image'] = request.FILES.get('embedded_image')
+            cost = estimate_render_cost(params)
+        except Exception:
+            # 잘못된 파라미터는 검증 단계에서 400으로 처리
+            return self.throttle_scope
+        threshold = getattr(settings, 'QR_SLOW_LANE_THRESHOLD', 100)
+        return self.heavy_throttle_scope if cost >= threshold else self.throttle_scope
 
     def process_embedded_image(self, request: Request):
         embedded_image = None
@@ -59,6 +128,193 @@ class BaseQrView(CreateAPIView):
                 )
         return embedded_image
 
+    def perform_content_negotiation(self, request: Request, force=False):
+        # 이미지 Accept 헤더는 get_output_format에서 처리하므로 406 대신 기본 렌더러(JSON 에러 응답용) 사용
+        return super().perform_content_negotiation(request, force=True)
+
+    def get_output_format(self, request: Request) -> QROutputFormats:
+        """
+        format 파라미터를 우선하고, 없으면 Accept 헤더에서 q 값이 가장 높은 이미지 타입으로 결정
+
+        q 값이 같으면 먼저 나온 타입을 사용하고, 지원하는 타입이 없으면 PNG를 반환한다.
+        """
+        requested = self.get_request_data(request).get('format')
+        if requested:
+            return QROutputFormats(requested)
+
+        content_types = {output_format.content_type: output_format for output_format in QROutputFormats.get_image_formats()}
+        best_format, best_quality = QROutputFormats.PNG, 0.0
+        for media_range in request.META.get('HTTP_ACCEPT', '').split(','):
+            media_type, *params = [part.strip() for part in media_range.split(';')]
+            output_format = content_types.get(media_type)
+            if output_format is None:
+                continue
+            quality = 1.0
+            for param in params:
+                key, _, value = param.partition('=')
+                if key.strip() == 'q':
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            if quality > best_quality:
+                best_format, best_quality = output_format, quality
+        return best_format
+
+    def build_bundle_response(
+        self,
+        request: Request,
+        generator_func: Callable,
+        generator_params: dict,
+        sizes: List[int],
+        output_formats: List[QROutputFormats],
+    ) -> HttpResponse:
+        """
+        sizes 요청: 같은 QR 코드를 여러 해상도(와 포맷)로 렌더링해 한 응답으로 반환
+
+        Accept 헤더에 multipart/mixed가 있으면 multipart, 아니면 ZIP으로 묶는다.
+        """
+        params = {key: value for key, value in generator_params.items() if key not in ('size', 'output_format')}
+        variants = run_render(render_variants, partial(generator_func, **params), sizes, output_formats)
+
+        if MULTIPART_CONTENT_TYPE in request.META.get('HTTP_ACCEPT', ''):
+            body, content_type = build_multipart(variants)
+            response = HttpResponse(body, content_type=content_type)
+        else:
+            body = build_zip(variants)
+            response = HttpResponse(body, content_type=ZIP_CONTENT_TYPE)
+            response['Content-Disposition'] = 'attachment; filename="qr-codes.zip"'
+        response['Content-Length'] = len(body)
+        patch_vary_headers(response, ('Accept',))
+
+        logger.info(f"Successfully generated {len(variants)} QR code variants: {len(body)} bytes")
+        return response
+
+    def get_request_data(self, request: Request):
+        """렌더링 파라미터: GET은 쿼리 파라미터, POST는 요청 본문"""
+        return request.query_params if request.method == 'GET' else request.data
+
+    def get_render_param_names(self) -> set:
+        """렌더링에 쓰이는 요청 파라미터 이름 (생성 함수의 인자와 format, sizes, formats). 그 외 파라미터(utm_source 등)는 무시"""
+        names = set(inspect.signature(self.generator_func).parameters) | {'format', 'sizes', 'formats'}
+        return names - {'embedded_image', 'output_format'}
+
+    def get_render_key(self, request: Request, output_format: QROutputFormats) -> str:
+        """요청 단위 렌더 키 (엔드포인트, 정규화된 파라미터, 출력 포맷). ETag와 디스크 저장소 경로에 사용"""
+        data = self.get_request_data(request)
+        names = self.get_render_param_names()
+        params = canonical_params(data, exclude=[key for key in data.keys() if key not in names])
+        return make_render_key(view=type(self).__name__, params=params, output_format=output_format)
+
+    def get_render_etag(self, request: Request, output_format: QROutputFormats) -> str:
+        """렌더링 입력으로 만든 strong ETag"""
+        return f'"{self.get_render_key(request, output_format)[:32]}"'
+
+    def build_stored_response(self, store, key: str, output_format: QROutputFormats) -> Optional[HttpResponse]:
+        """
+        디스크 저장소의 파일을 응답으로 반환
+
+        QR_RENDER_STORE_SENDFILE이 'x-sendfile'이면 X-Sendfile, 'x-accel-redirect'이면
+        QR_RENDER_STORE_ACCEL_PREFIX 아래 내부 경로로 X-Accel-Redirect를 보내 웹 서버가 파일을 전송하게 한다.
+        그 외에는 FileResponse로 스트리밍한다. 조회 후 다른 워커의 정리로 파일이 지워져 열 수 없으면 None (저장소 미스로 처리)
+        """
+        path = store.path_for(key, output_format)
+        filename = f"qr-code.{output_format.extension}"
+        sendfile = getattr(settings, 'QR_RENDER_STORE_SENDFILE', None)
+
+        if sendfile == 'x-sendfile':
+            response = HttpResponse(content_type=output_format.content_type)
+            response['X-Sendfile'] = str(path)
+        elif sendfile == 'x-accel-redirect':
+            prefix = getattr(settings, 'QR_RENDER_STORE_ACCEL_PREFIX', '/protected/qr-renders/')
+            response = HttpResponse(content_type=output_format.content_type)
+            response['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + store.relative_path(key, output_format)
+        else:
+            try:
+                fp = open(path, 'rb')
+            except OSError as e:
+                logger.debug(f"Render store file disappeared, rendering instead: {e}")
+                return None
+            response = FileResponse(fp, content_type=output_format.content_type)
+        response['Content-Disposition'] = f'inline; filename="{filename}"'
+        patch_vary_headers(response, ('Accept',))
+        return response
+
+    def patch_render_cache_headers(self, request: Request, response: HttpResponse, etag: str):
+        """
+        ETag와 Cache-Control 설정
+
+        만료 시간이 있는 서명 URL은 만료 후 CDN/브라우저 캐시에서 계속 제공되지 않도록 max-age를 남은 시간으로 줄인다.
+        """
+        max_age = getattr(settings, 'QR_GET_CACHE_MAX_AGE', 60 * 60 * 24 * 365)
+        expires = request.query_params.get(EXPIRES_PARAM)
+        capped = False
+        if expires is not None:
+            try:
+                remaining = max(0, int(expires) - int(time.time()))
+            except ValueError:
+                remaining = 0
+            capped = remaining < max_age
+            max_age = min(max_age, remaining)
+
+        response['ETag'] = etag
+        if capped:
+            patch_cache_control(response, public=True, max_age=max_age)
+        else:
+            patch_cache_control(response, public=True, max_age=max_age, immutable=True)
+        patch_vary_headers(response, ('Accept',))
+        return response
+
+    def check_get_preconditions(self, request: Request):
+        """
+        GET 렌더링 전 확인: 서명 검증(실패 시 403)과 If-None-Match 비교(일치 시 304)
+
+        Returns:
+            tuple: (바로 반환할 응답 또는 None, 렌더링 결과에 붙일 ETag)
+        """
+        if not verify_signature(request.path, request.query_params):
+            return Response(
+                {
+                    'detail': QRErrorMessages.get_message(QRErrorCodes.INVALID_SIGNATURE),
+                    'error_code': QRErrorCodes.INVALID_SIGNATURE
+                },
+                status=403
+            ), None
+
+        # 렌더 키에 출력 포맷이 필요하므로 format 파라미터는 요청 검증 전에 확인
+        try:
+            output_format = self.get_output_format(request)
+        except ValueError:
+            return Response(
+                {
+                    'detail': {'format': [f'"{request.query_params.get("format")}" is not a valid choice.']},
+                    'error_code': QRErrorCodes.INVALID_PARAMETERS
+                },
+                status=400
+            ), None
+
+        etag = self.get_render_etag(request, output_format)
+        if_none_match = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+        if '*' in if_none_match or etag in if_none_match or f'W/{etag}' in if_none_match:
+            return self.patch_render_cache_headers(request, HttpResponseNotModified(), etag), etag
+        return None, etag
+
+    def get(self, request: Request, *args, **kwargs):
+        """
+        QR 코드 생성을 위한 GET 메서드 (쿼리 파라미터 사용)
+
+        같은 입력이면 결과가 같으므로 ETag와 Cache-Control: immutable을 붙여 CDN/브라우저가 캐시하게 하고,
+        If-None-Match가 일치하면 렌더링 없이 304를 반환한다.
+        """
+        response, etag = self.check_get_preconditions(request)
+        if response is not None:
+            return response
+
+        response = self.handle_qr_generation(request, self.generator_func, self.required_params)
+        if response.status_code == 200:
+            self.patch_render_cache_headers(request, response, etag)
+        return response
+
     def post(self, request: Request, *args, **kwargs):
         """QR 코드 생성을 위한 POST 메서드"""
         serializer = self.get_serializer(data=request.data)
@@ -80,78 +336,190 @@ class BaseQrView(CreateAPIView):
     def handle_qr_generation(self, request: Request, generator_func: Callable, required_params: List[str]):
         """QR 코드 생성 템플릿 메서드"""
         try:
-            # 요청 데이터 로깅
-            logger.debug(f"Request data: {request.data}")
-            serializer = self.get_serializer(data=request.data)
-            if not serializer.is_valid():
-                return Response(
-                    {
-                        'detail': serializer.errors,
-                        'error_code': QRErrorCodes.INVALID_PARAMETERS
-                    },
-                    status=400
-                )
+            plan = self.prepare_qr_generation(request)
+            if isinstance(plan, Response):
+                return plan
+            response = self.render_qr_response(request, generator_func, plan)
+            self.record_render_usage(request, plan, response)
+            return response
+        except Exception as e:
+            return self.internal_error_response(e)
 
-            # 임베드 이미지 검증
-            try:
-                embedded_image = self.process_embedded_image(request)
-            except ValueError as e:
-                return Response(
-                    {
-                        'detail': str(e),
-                        'error_code': QRErrorCodes.INVALID_IMAGE
-                    },
-                    status=400
-                )
+    def record_render_usage(self, request: Request, plan: QRRenderPlan, response: HttpResponse) -> None:
+        """성공한 렌더링의 사용량 기록 (여러 해상도/포맷 요청은 렌더링한 조합 수)"""
+        if response.status_code != 200:
+            return
+        count = len(set(plan.sizes)) * len(set(plan.output_formats)) if plan.sizes else 1
+        record_usage(request, UsageRecord.Metric.QR_RENDER, count)
 
-            # 요청 파라미터 준비
-            generator_params = {}
-            for key, value in request.data.items():
-                # QueryDict에서 각 값의 첫 번째 항목만 사용
-                generator_params[key] = value[0] if isinstance(value, list) else value
-            
-            generator_params['embedded_image'] = embedded_image
+    def internal_error_response(self, error: Exception) -> Response:
+        logger.error(f"Unexpected error generating QR Code: {str(error)}")
+        traceback.print_exc()
+        return Response(
+            {
+                'detail': QRErrorMessages.get_message(QRErrorCodes.INTERNAL_ERROR),
+                'error_code': QRErrorCodes.INTERNAL_ERROR
+            },
+            status=500
+        )
 
-            # 파라미터 로깅
-            logger.debug(f"Generator parameters: {generator_params}")
+    def prepare_qr_generation(self, request: Request):
+        """
+        요청 검증과 생성 파라미터 준비 (렌더링 없이 빠르게 끝나는 단계)
 
-            # QR 코드 생성
-            qr_image = generator_func(**generator_params)
+        Returns:
+            QRRenderPlan 또는 400 응답
+        """
+        # 요청 데이터 로깅
+        data = self.get_request_data(request)
+        logger.debug(f"Request data: {data}")
+        serializer = self.get_serializer(data=data)
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'detail': serializer.errors,
+                    'error_code': QRErrorCodes.INVALID_PARAMETERS
+                },
+                status=400
+            )
 
-            if not qr_image:
-                return Response(
-                    {
-                        'detail': QRErrorMessages.get_message(QRErrorCodes.GENERATION_FAILED),
-                        'error_code': QRErrorCodes.GENERATION_FAILED
-                    },
-                    status=500
-                )
+        # 임베드 이미지 검증
+        try:
+            embedded_image = self.process_embedded_image(request)
+        except ValueError as e:
+            return Response(
+                {
+                    'detail': str(e),
+                    'error_code': QRErrorCodes.INVALID_IMAGE
+                },
+                status=400
+            )
+
+        # 요청 파라미터 준비 (생성 함수가 받는 파라미터만 사용)
+        accepted = self.get_render_param_names()
+        generator_params = {}
+        for key, value in data.items():
+            if key not in accepted:
+                continue
+            # QueryDict에서 각 값의 첫 번째 항목만 사용
+            generator_params[key] = value[0] if isinstance(value, list) else value
+        
+        generator_params['embedded_image'] = embedded_image
+
+        # 출력 포맷 (format 파라미터 또는 Accept 헤더)
+        output_format = self.get_output_format(request)
+        generator_params.pop('format', None)
+        generator_params['output_format'] = output_format
+
+        # 여러 해상도/포맷 요청 (sizes, formats)은 리스트 값이므로 검증된 데이터를 사용
+        sizes = serializer.validated_data.get('sizes')
+        output_formats = serializer.validated_data.get('formats') or [output_format]
+        generator_params.pop('sizes', None)
+        generator_params.pop('formats', None)
+
+        # 파라미터 로깅
+        logger.debug(f"Generator parameters: {generator_params}")
+        return QRRenderPlan(generator_params, output_format, sizes, output_formats)
+
+    def render_qr_response(self, request: Request, generator_func: Callable, plan: QRRenderPlan):
+        """준비된 파라미터로 QR 코드를 렌더링해 응답 생성 (CPU와 디스크를 사용하는 단계)"""
+        generator_params, output_format, sizes, output_formats = plan
 
-            # 응답 생성
-            response = HttpResponse(qr_image, content_type="image/png")
-            response['Content-Length'] = len(qr_image)
-            response['Content-Disposition'] = 'inline; filename="qr-code.png"'
+        # 디스크 렌더 저장소: 같은 요청이 이미 렌더링되었으면 파일을 그대로 전송
+        # (업로드 이미지는 요청 데이터로 키를 만들 수 없고, 묶음 응답은 저장하지 않음)
+        store = get_render_store() if not sizes and generator_params['embedded_image'] is None else None
+        store_key = self.get_render_key(request, output_format) if store else None
+        if store and store.get(store_key, output_format):
+            logger.debug(f"Serving QR code from render store: {store_key}")
+            response = self.build_stored_response(store, store_key, output_format)
+            if response is not None:
+                return response
 
-            # 성공 로깅
-            logger.info(f"Successfully generated QR code: {len(qr_image)} bytes")
+        # 예상 비용이 큰 렌더링은 동시 실행 수가 제한된 느린 레인에서 처리
+        cost = estimate_request_cost(generator_params, sizes, output_formats)
+        lane = get_render_lane(cost)
+        response = self.generate_qr_response(request, generator_func, plan, lane, store, store_key)
+        response[COST_HEADER] = str(round(cost))
+        response[LANE_HEADER] = lane.name
+        return response
 
+    def generate_qr_response(
+        self,
+        request: Request,
+        generator_func: Callable,
+        plan: QRRenderPlan,
+        lane: RenderLane,
+        store,
+        store_key: Optional[str],
+    ):
+        """레인의 차례를 받아 렌더링 (느린 레인이 가득 차면 503)"""
+        generator_params, output_format, sizes, output_formats = plan
+
+        # QR 코드 생성 (최대 픽셀 제한을 넘으면 렌더링 전에 거절)
+        try:
+            with lane.slot():
+                if sizes:
+                    return self.build_bundle_response(request, generator_func, generator_params, sizes, output_formats)
+                # 렌더 풀이 설정되어 있으면 풀 프로세스에서 렌더링 (요청 스레드는 결과만 기다림)
+                qr_image = run_render(generator_func, **generator_params)
+        except RenderPoolFull:
+            response = Response(
+                {
+                    'detail': QRErrorMessages.get_message(QRErrorCodes.RENDER_BUSY),
+                    'error_code': QRErrorCodes.RENDER_BUSY
+                },
+                status=503
+            )
+            response['Retry-After'] = '1'
             return response
+        except RenderTimeout:
+            response = Response(
+                {
+                    'detail': QRErrorMessages.get_message(QRErrorCodes.RENDER_TIMEOUT),
+                    'error_code': QRErrorCodes.RENDER_TIMEOUT
+                },
+                status=503
+            )
+            response['Retry-After'] = '1'
+            return response
+        except PixelBudgetExceeded as e:
+            return Response(
+                {
+                    'detail': QRErrorMessages.get_message(QRErrorCodes.IMAGE_TOO_LARGE),
+                    'error_code': QRErrorCodes.IMAGE_TOO_LARGE,
+                    'max_pixels': e.max_pixels,
+                },
+                status=400
+            )
 
-        except Exception as e:
-            logger.error(f"Unexpected error generating QR Code: {str(e)}")
-            traceback.print_exc()
+        if not qr_image:
             return Response(
                 {
-                    'detail': QRErrorMessages.get_message(QRErrorCodes.INTERNAL_ERROR),
-                    'error_code': QRErrorCodes.INTERNAL_ERROR
+                    'detail': QRErrorMessages.get_message(QRErrorCodes.GENERATION_FAILED),
+                    'error_code': QRErrorCodes.GENERATION_FAILED
                 },
                 status=500
             )
 
+        if store:
+            store.put(store_key, output_format, qr_image)
+
+        # 응답 생성
+        response = HttpResponse(qr_image, content_type=output_format.content_type)
+        response['Content-Length'] = len(qr_image)
+        response['Content-Disposition'] = f'inline; filename="qr-code.{output_format.extension}"'
+        patch_vary_headers(response, ('Accept',))
+
+        # 성공 로깅
+        logger.info(f"Successfully generated QR code: {len(qr_image)} bytes")
+
+        return response
+
 
 
 class QrUrlView(BaseQrView):
     serializer_class = UrlQRSerializer
+    generator_func = staticmethod(generate_url_qr)
     required_params = list_of_properties_of_serializer(UrlQRSerializer)
     
     @qr_swagger_decorator(
@@ -164,6 +532,7 @@ class QrUrlView(BaseQrView):
 
 class QrVcardView(BaseQrView): # TODO: URL 제외 모든 QR코드 생성에 대한 테스트 코드 작성
     serializer_class = VCardQRSerializer
+    generator_func = staticmethod(generate_vcard_qr)
     required_params = list_of_properties_of_serializer(VCardQRSerializer)
     
     @qr_swagger_decorator(
@@ -176,6 +545,7 @@ class QrVcardView(BaseQrView): # TODO: URL 제외 모든 QR코드 생성에 대
 
 class QrEmailView(BaseQrView):
     serializer_class = EmailQRSerializer
+    generator_func = staticmethod(generate_email_qr)
     required_params = list_of_properties_of_serializer(EmailQRSerializer)
     
     @qr_swagger_decorator(
@@ -189,6 +559,7 @@ class QrEmailView(BaseQrView):
 
 class QrTextView(BaseQrView):
     serializer_class = TextQRSerializer
+    generator_func = staticmethod(generate_text_qr)
     required_params = list_of_properties_of_serializer(TextQRSerializer)
     
     @qr_swagger_decorator(
@@ -202,6 +573,7 @@ class QrTextView(BaseQrView):
 
 class QrPhoneNumberView(BaseQrView):
     serializer_class = PhoneQRSerializer
+    generator_func = staticmethod(generate_phone_qr)
     required_params = list_of_properties_of_serializer(PhoneQRSerializer)
     
     @qr_swagger_decorator(
@@ -215,6 +587,7 @@ class QrPhoneNumberView(BaseQrView):
 
 class QrWifiView(BaseQrView):
     serializer_class = WiFiQRSerializer
+    generator_func = staticmethod(generate_wifi_qr)
     required_params = list_of_properties_of_serializer(WiFiQRSerializer)
     
     @qr_swagger_decorator(
@@ -228,6 +601,7 @@ class QrWifiView(BaseQrView):
 
 class QrSmsView(BaseQrView):
     serializer_class = SMSQRSerializer
+    generator_func = staticmethod(generate_sms_qr)
     required_params = list_of_properties_of_serializer(SMSQRSerializer)
     
     @qr_swagger_decorator(
@@ -241,6 +615,7 @@ class QrSmsView(BaseQrView):
 
 class QrGeoView(BaseQrView):
     serializer_class = GeoQRSerializer
+    generator_func = staticmethod(generate_geo_qr)
     required_params = list_of_properties_of_serializer(GeoQRSerializer)
     
     @qr_swagger_decorator(
@@ -254,6 +629,7 @@ class QrGeoView(BaseQrView):
 
 class QrEventView(BaseQrView):
     serializer_class = EventQRSerializer
+    generator_func = staticmethod(generate_event_qr)
     required_params = list_of_properties_of_serializer(EventQRSerializer)
     
     @qr_swagger_decorator(
@@ -267,6 +643,7 @@ class QrEventView(BaseQrView):
 
 class QrMeCardView(BaseQrView):
     serializer_class = MeCardQRSerializer
+    generator_func = staticmethod(generate_mecard_qr)
     required_params = list_of_properties_of_serializer(MeCardQRSerializer)
     
     @qr_swagger_decorator(
@@ -280,6 +657,7 @@ class QrMeCardView(BaseQrView):
 
 class QrWhatsAppView(BaseQrView):
     serializer_class = WhatsAppQRSerializer
+    generator_func = staticmethod(generate_whatsapp_qr)
     required_params = list_of_properties_of_serializer(WhatsAppQRSerializer)
     
     @qr_swagger_decorator(
@@ -293,6 +671,7 @@ class QrWhatsAppView(BaseQrView):
 
 class QrBitcoinView(BaseQrView):
     serializer_class = BitcoinQRSerializer
+    generator_func = staticmethod(generate_bitcoin_qr)
     required_params = list_of_properties_of_serializer(BitcoinQRSerializer)
     
     @qr_swagger_decorator(
@@ -302,3 +681,391 @@ class QrBitcoinView(BaseQrView):
     )
     def post(self, request):
         return self.handle_qr_generation(request, generate_bitcoin_qr, self.required_params)
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class QrBatchView(GenericAPIView):
+    """
+    여러 QR 코드를 한 요청으로 생성
+
+    요청 본문은 `type`과 해당 단일 엔드포인트의 파라미터를 담은 객체의 JSON 배열.
+    모든 항목을 먼저 검증한 뒤 프로세스 풀에서 렌더링하며, 결과는 렌더링되는 대로 ZIP으로 스트리밍된다.
+    """
+    throttle_scope = 'qr_batch'
+    api_key_scope = 'qr'
+
+    def perform_content_negotiation(self, request: Request, force=False):
+        return super().perform_content_negotiation(request, force=True)
+
+    @swagger_auto_schema(
+        operation_id="Batch QR Code",
+        operation_description=f"""
+    Generate many QR codes in one request. The body is a JSON array of items, each with a `type`
+    ({', '.join(BATCH_ITEM_TYPES)}) and the parameters of the matching single endpoint.
+    All items are validated before rendering; results are streamed back as a ZIP
+    with one file per item plus `manifest.json` (filename or error per item).
+    """,
+        request_body=openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    'type': openapi.Schema(type=openapi.TYPE_STRING, enum=list(BATCH_ITEM_TYPES)),
+                },
+                required=['type'],
+            ),
+        ),
+        tags=["QR Code"],
+        responses={
+            200: openapi.Response("ZIP archive"),
+            400: openapi.Response("Bad Request"),
+        },
+    )
+    def post(self, request: Request):
+        data = request.data
+        max_items = getattr(settings, 'QR_BATCH_MAX_ITEMS', DEFAULT_BATCH_MAX_ITEMS)
+        if not isinstance(data, list) or not data:
+            return Response(
+                {
+                    'detail': "Request body must be a non-empty JSON array of items.",
+                    'error_code': QRErrorCodes.INVALID_PARAMETERS
+                },
+                status=400
+            )
+        if len(data) > max_items:
+            return Response(
+                {
+                    'detail': QRErrorMessages.get_message(QRErrorCodes.BATCH_TOO_LARGE),
+                    'error_code': QRErrorCodes.BATCH_TOO_LARGE,
+                    'max_items': max_items,
+                },
+                status=400
+            )
+
+        items, errors = build_batch_items(data)
+        if errors:
+            return Response(
+                {
+                    'detail': errors,
+                    'error_code': QRErrorCodes.INVALID_PARAMETERS
+                },
+                status=400
+            )
+
+        logger.info(f"Rendering QR batch of {len(items)} items")
+        response = StreamingHttpResponse(stream_batch_zip(items), content_type=ZIP_CONTENT_TYPE)
+        response['Content-Disposition'] = 'attachment; filename="qr-batch.zip"'
+        return response
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class QrSheetView(GenericAPIView):
+    """
+    여러 QR 코드를 라벨 시트(다중 페이지 벡터 PDF)로 배치
+
+    항목은 배치 엔드포인트와 같은 형식이며, 모듈 행렬만 인코딩해 병합된 사각형으로 그린다.
+    PDF는 페이지 단위로 스트리밍된다.
+    """
+    serializer_class = QRSheetSerializer
+    throttle_scope = 'qr_batch'
+    api_key_scope = 'qr'
+
+    def perform_content_negotiation(self, request: Request, force=False):
+        return super().perform_content_negotiation(request, force=True)
+
+    @swagger_auto_schema(
+        operation_id="QR Label Sheet PDF",
+        operation_description=f"""
+    Lay out many QR codes on print label sheets and stream a multi-page vector PDF.
+    - `items`: array of batch items (`type` + parameters of the matching single endpoint)
+    - `layout`: {', '.join(LABEL_LAYOUTS)}
+    - or a custom grid: `page_size` (a4, letter), `columns`, `rows`, `label_width`, `label_height`,
+      `margin_left`, `margin_top`, `gap_x`, `gap_y`, `padding` (mm)
+    - `fill_color`, `back_color`, `border`: applied to every code (modules are drawn as squares)
+    """,
+        request_body=QRSheetSerializer,
+        tags=["QR Code"],
+        responses={
+            200: openapi.Response("PDF document"),
+            400: openapi.Response("Bad Request"),
+        },
+    )
+    def post(self, request: Request):
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'detail': serializer.errors,
+                    'error_code': QRErrorCodes.INVALID_PARAMETERS
+                },
+                status=400
+            )
+
+        data = serializer.validated_data
+        max_items = getattr(settings, 'QR_SHEET_MAX_ITEMS', DEFAULT_SHEET_MAX_ITEMS)
+        if len(data['items']) > max_items:
+            return Response(
+                {
+                    'detail': QRErrorMessages.get_message(QRErrorCodes.BATCH_TOO_LARGE),
+                    'error_code': QRErrorCodes.BATCH_TOO_LARGE,
+                    'max_items': max_items,
+                },
+                status=400
+            )
+
+        items, errors = build_batch_items(data['items'])
+        if errors:
+            return Response(
+                {
+                    'detail': {'items': errors},
+                    'error_code': QRErrorCodes.INVALID_PARAMETERS
+                },
+                status=400
+            )
+
+        logger.info(f"Composing QR label sheet of {len(items)} items")
+        pdf = stream_label_sheet_pdf(
+            iter_batch_matrices(items),
+            data['sheet_layout'],
+            border=data['border'],
+            fill_rgb=ImageColor.getrgb(data['fill_color']),
+            back_rgb=ImageColor.getrgb(data['back_color']),
+        )
+        response = StreamingHttpResponse(pdf, content_type=PDF_CONTENT_TYPE)
+        response['Content-Disposition'] = 'inline; filename="qr-labels.pdf"'
+        return response
+
+
+class QrJobAccessMixin:
+    """
+    대량 생성 작업은 로그인한 사용자만 등록/조회할 수 있고, 자신이 등록한 작업만 보인다
+    (API 키로 요청하면 그 키로 등록한 작업만)
+    """
+    permission_classes = [IsAuthenticated, APIKeyScopePermission]
+    api_key_scope = 'qr'
+
+    def get_queryset(self):
+        jobs = QRJob.objects.filter(user=self.request.user)
+        if getattr(self.request.auth, 'is_api_key', False):
+            jobs = jobs.filter(api_key=self.request.auth)
+        return jobs
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class QrJobCreateView(QrJobAccessMixin, GenericAPIView):
+    """
+    대량 QR 코드 생성 작업 등록
+
+    CSV(헤더 행 필요) 또는 NDJSON 파일을 업로드하면 작업이 대기 상태로 저장되고,
+    `manage.py qr_worker`가 처리한다. 업로드의 나머지 필드(type, style, format 등)는 모든 행의 기본값이 된다.
+    업로드 크기는 QR_JOB_MAX_UPLOAD_SIZE, 행 수는 QR_JOB_MAX_ITEMS로 제한한다.
+    """
+    serializer_class = QRJobCreateSerializer
+    throttle_scope = 'qr_batch'
+
+    @swagger_auto_schema(
+        operation_id="Create QR Job",
+        operation_description="""
+    Upload a CSV (with a header row) or NDJSON file to generate QR codes in the background.
+    Each row has the parameters of a single endpoint plus `type` (or set `type` for the whole file).
+    Other form fields (`style`, `format`, `size`, ...) are applied to every row.
+    Poll the returned status URL and download the ZIP when the job is completed.
+    """,
+        request_body=QRJobCreateSerializer,
+        tags=["QR Code"],
+        responses={
+            202: openapi.Response("Job accepted", QRJobSerializer),
+            400: openapi.Response("Bad Request"),
+        },
+    )
+    def post(self, request: Request):
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                {
+                    'detail': serializer.errors,
+                    'error_code': QRErrorCodes.INVALID_PARAMETERS
+                },
+                status=400
+            )
+
+        upload = serializer.validated_data['file']
+        input_format = serializer.validated_data.get('input_format')
+        if input_format is None:
+            input_format = guess_input_format(upload.name)
+
+        options = {
+            key: value for key, value in request.data.items()
+            if key not in ('file', 'input_format', 'chunk_size')
+        }
+        job = QRJob(
+            user=request.user,
+            api_key=request.auth if getattr(request.auth, 'is_api_key', False) else None,
+            input_format=input_format,
+            options=options,
+            chunk_size=serializer.validated_data.get(
+                'chunk_size', getattr(settings, 'QR_JOB_CHUNK_SIZE', DEFAULT_JOB_CHUNK_SIZE)
+            ),
+        )
+        job.input_file.save(upload.name, upload, save=False)
+
+        # 행 수를 미리 세어 제한을 넘는 작업은 등록하지 않음 (워커는 다시 세지 않음)
+        max_items = getattr(settings, 'QR_JOB_MAX_ITEMS', DEFAULT_JOB_MAX_ITEMS)
+        try:
+            job.total_items = sum(1 for _ in iter_job_rows(job))
+        except (UnicodeDecodeError, csv.Error) as e:
+            job.input_file.delete(save=False)
+            return Response(
+                {
+                    'detail': {'file': [f"Could not read the file: {e}"]},
+                    'error_code': QRErrorCodes.INVALID_PARAMETERS
+                },
+                status=400
+            )
+        if job.total_items > max_items:
+            job.input_file.delete(save=False)
+            return Response(
+                {
+                    'detail': QRErrorMessages.get_message(QRErrorCodes.BATCH_TOO_LARGE),
+                    'error_code': QRErrorCodes.BATCH_TOO_LARGE,
+                    'max_items': max_items,
+                },
+                status=400
+            )
+        job.save()
+        logger.info(f"Created QR job {job.pk} ({input_format})")
+
+        response = Response(QRJobSerializer(job).data, status=202)
+        response['Location'] = reverse('qr:qr_job_detail_v1', args=[job.pk])
+        return response
+
+
+class QrJobDetailView(QrJobAccessMixin, GenericAPIView):
+    """대량 QR 코드 생성 작업 상태 (진행률, 처리량, 오류)"""
+    serializer_class = QRJobSerializer
+
+    @swagger_auto_schema(operation_id="QR Job Status", tags=["QR Code"], responses={200: QRJobSerializer})
+    def get(self, request: Request, job_id):
+        job = get_object_or_404(self.get_queryset(), pk=job_id)
+        data = QRJobSerializer(job).data
+        data['download_url'] = reverse('qr:qr_job_download_v1', args=[job.pk]) if job.result_file else None
+        return Response(data)
+
+
+class QrJobDownloadView(QrJobAccessMixin, GenericAPIView):
+    """대량 QR 코드 생성 작업 결과 ZIP 다운로드"""
+
+    @swagger_auto_schema(
+        operation_id="Download QR Job Result",
+        tags=["QR Code"],
+        responses={200: openapi.Response("ZIP archive"), 409: openapi.Response("Job not finished")},
+    )
+    def get(self, request: Request, job_id):
+        job = get_object_or_404(self.get_queryset(), pk=job_id)
+        if not job.result_file:
+            return Response(
+                {
+                    'detail': QRErrorMessages.get_message(QRErrorCodes.JOB_NOT_READY),
+                    'error_code': QRErrorCodes.JOB_NOT_READY,
+                    'status': job.status,
+                },
+                status=409
+            )
+        return FileResponse(
+            default_storage.open(job.result_file.name, 'rb'),
+            as_attachment=True,
+            filename=f"qr-job-{job.pk}.zip",
+            content_type=ZIP_CONTENT_TYPE,
+        )
+
+
+class QrRenderPoolView(APIView):
+    """렌더 풀 상태 (이 웹 워커 프로세스 기준의 대기열 길이, 실행 중인 작업 수, 누적 카운터, 관리자만 조회)"""
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(operation_id="QR Render Pool Stats", tags=["QR Code"], responses={200: openapi.Response("Pool stats")})
+    def get(self, request: Request):
+        pool = get_render_pool()
+        if pool is None:
+            return Response({'enabled': False})
+        return Response({'enabled': True, **pool.stats()})
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncQrView(View):
+    """
+    ASGI 서버용 비동기 QR 코드 생성 뷰 (view_class의 검증/렌더링 로직을 그대로 사용)
+
+    요청 본문은 ASGI 핸들러가 이벤트 루프에서 모두 읽은 뒤 뷰를 호출하므로 느린 업로드가 스레드를 점유하지 않는다.
+    DRF 초기화(인증, 권한)와 요청 검증은 짧은 동기 구간에서, 렌더링은 동시 실행 수가 제한된 스레드 풀에서 처리하고
+    이벤트 루프는 결과만 기다린다.
+    """
+    view_class = None
+    http_method_names = ['get', 'post', 'options']
+
+    async def get(self, request, *args, **kwargs):
+        return await self.handle(request, *args, **kwargs)
+
+    async def post(self, request, *args, **kwargs):
+        return await self.handle(request, *args, **kwargs)
+
+    def prepare(self, request, *args, **kwargs):
+        """
+        동기 구간: DRF 요청 초기화, GET 사전 조건, 요청 검증 (인증 등에서 DB를 사용할 수 있으므로 이벤트 루프 밖에서 실행)
+
+        Returns:
+            tuple: (view, DRF 요청, QRRenderPlan 또는 바로 반환할 응답, GET 응답에 붙일 ETag)
+        """
+        view = self.view_class()
+        view.setup(request, *args, **kwargs)
+        drf_request = view.initialize_request(request, *args, **kwargs)
+        view.request = drf_request
+        view.headers = view.default_response_headers
+        try:
+            view.initial(drf_request, *args, **kwargs)
+        except Exception as exc:
+            return view, drf_request, view.handle_exception(exc), None
+
+        etag = None
+        if drf_request.method == 'GET':
+            response, etag = view.check_get_preconditions(drf_request)
+            if response is not None:
+                return view, drf_request, response, etag
+        try:
+            plan = view.prepare_qr_generation(drf_request)
+        except Exception as e:
+            plan = view.internal_error_response(e)
+        return view, drf_request, plan, etag
+
+    @staticmethod
+    def render(view: BaseQrView, request: Request, plan: QRRenderPlan):
+        try:
+            response = view.render_qr_response(request, view.generator_func, plan)
+            view.record_render_usage(request, plan, response)
+            return response
+        except Exception as e:
+            return view.internal_error_response(e)
+
+    async def handle(self, request, *args, **kwargs):
+        view, drf_request, plan, etag = await sync_to_async(self.prepare)(request, *args, **kwargs)
+        if isinstance(plan, QRRenderPlan):
+            response = await arun_in_render_thread(self.render, view, drf_request, plan)
+            if etag and response.status_code == 200:
+                view.patch_render_cache_headers(drf_request, response, etag)
+        else:
+            response = plan
+        return view.finalize_response(drf_request, response, *args, **kwargs)
+
+
+def qr_view(view_class):
+    """
+    ASYNC_VIEWS 설정이 켜져 있으면 ASGI용 AsyncQrView, 아니면 DRF 뷰를 반환 (URL 설정에서 사용)
+
+    API 문서(drf_yasg)는 DRF 뷰 클래스만 인식하므로 비동기 뷰에도 같은 클래스를 cls로 지정해 둔다.
+    """
+    if not getattr(settings, 'ASYNC_VIEWS', False):
+        return view_class.as_view()
+    view = AsyncQrView.as_view(view_class=view_class)
+    view.cls = view_class
+    view.initkwargs = {}
+    return view
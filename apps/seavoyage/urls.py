@@ -1,10 +1,10 @@
 
 from django.urls import include, path
-from .views import SeavoyageHelloView, SeavoyageView
+from .views import SeavoyageHelloView, SeavoyageView, seavoyage_view
 
 app_name = "seavoyage"
 
 urlpatterns = [
-    path("", SeavoyageView.as_view(), name="seavoyage"),
+    path("", seavoyage_view(), name="seavoyage"),
 ]
 
@@ -1,21 +1,67 @@
+import asyncio
 import seavoyage as sv
 import logging
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse
+from django.views import View
 from rest_framework.views import APIView
 from rest_framework.request import Request
 from rest_framework.response import Response
 from drf_yasg.utils import swagger_auto_schema
 from .serializers import CoordinateSerializer, SeaRouteResponseSerializer
 from .models import SeaRoute
+from apps.usage.meter import record_usage
+from apps.usage.models import UsageRecord
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+
+def calculate_route(origin: str, destination: str) -> dict:
+    """'위도,경도' 문자열 두 개로 해상 경로 계산 (CPU를 많이 사용하는 작업)"""
+    m_network = sv.get_m_network_5km()
+
+    origin: tuple[float, float] = tuple(map(float, origin.split(',')))
+    origin = (origin[1], origin[0]) # 입력은 위도, 경도 순으로 들어오지만 좌표계에서는 경도, 위도 순으로 들어가야 함
+    destination: tuple[float, float] = tuple(map(float, destination.split(',')))
+    destination = (destination[1], destination[0]) # 입력은 위도, 경도 순으로 들어오지만 좌표계에서는 경도, 위도 순으로 들어가야 함
+
+    return sv.seavoyage(
+        origin,
+        destination,
+        M=m_network
+    )
+
+
+_route_executor: Optional[ThreadPoolExecutor] = None
+_route_executor_lock = threading.Lock()
+
+
+def get_route_executor() -> ThreadPoolExecutor:
+    """비동기 뷰에서 경로 계산을 실행하는 스레드 풀 (동시 계산 수: SEAVOYAGE_ROUTE_CONCURRENCY)"""
+    global _route_executor
+    if _route_executor is None:
+        with _route_executor_lock:
+            if _route_executor is None:
+                workers = getattr(settings, 'SEAVOYAGE_ROUTE_CONCURRENCY', 2)
+                _route_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='seavoyage-route')
+    return _route_executor
+
+
 class SeavoyageHelloView(APIView):
     def get(self, request):
         return Response({"message": "Hello, World!"})
 
 class SeavoyageView(APIView):
+    throttle_scope = 'seavoyage'
+    api_key_scope = 'seavoyage'
+
     @swagger_auto_schema(
         operation_description="해상 경로를 계산합니다",
         query_serializer=CoordinateSerializer,
@@ -32,18 +78,8 @@ class SeavoyageView(APIView):
             # 입력값 로깅
             logger.info(f"경로 계산 시작 - 출발: {serializer.validated_data['origin']}, 도착: {serializer.validated_data['destination']}, 거리 단위: {serializer.validated_data['units']}")
             
-            m_network = sv.get_m_network_5km()
-            
-            origin: tuple[float, float] = tuple(map(float, serializer.validated_data['origin'].split(',')))
-            origin = (origin[1], origin[0]) # 입력은 위도, 경도 순으로 들어오지만 좌표계에서는 경도, 위도 순으로 들어가야 함
-            destination: tuple[float, float] = tuple(map(float, serializer.validated_data['destination'].split(',')))
-            destination = (destination[1], destination[0]) # 입력은 위도, 경도 순으로 들어오지만 좌표계에서는 경도, 위도 순으로 들어가야 함
-            
-            result = sv.seavoyage(
-                origin,
-                destination,
-                M=m_network
-            )
+            result = calculate_route(serializer.validated_data['origin'], serializer.validated_data['destination'])
+            record_usage(request, UsageRecord.Metric.ROUTE)
             
             # save_to_db 파라미터로 저장 여부 결정 (기본값: False)
             save_to_db = request.query_params.get('save_to_db', '').lower() == 'true'
@@ -72,3 +108,78 @@ class SeavoyageView(APIView):
         except Exception as e:
             logger.error(f"예상치 못한 오류 발생: {str(e)}", exc_info=True)
             return Response({"error": str(e)}, status=500)
+
+
+class AsyncSeavoyageView(View):
+    """
+    ASGI 서버용 비동기 해상 경로 계산 뷰
+
+    경로 계산은 동시 실행 수가 제한된 스레드 풀에서 실행하고, 경로 저장은 비동기 ORM을 사용한다.
+    인증, 권한, 요청 제한은 SeavoyageView와 같은 DRF 설정을 적용한다.
+    """
+
+    def check_request(self, request):
+        """
+        동기 구간: DRF 인증/권한/요청 제한 (DB를 사용할 수 있으므로 이벤트 루프 밖에서 실행)
+
+        Returns:
+            tuple: (DRF 요청, 거절된 경우 바로 반환할 응답 또는 None)
+        """
+        view = SeavoyageView()
+        view.setup(request)
+        drf_request = view.initialize_request(request)
+        view.request = drf_request
+        view.headers = view.default_response_headers
+        try:
+            view.initial(drf_request)
+        except Exception as exc:
+            response = view.finalize_response(drf_request, view.handle_exception(exc))
+            return drf_request, response.render()
+        return drf_request, None
+
+    async def get(self, request):
+        drf_request, response = await sync_to_async(self.check_request)(request)
+        if response is not None:
+            return response
+
+        try:
+            serializer = CoordinateSerializer(data=request.GET)
+            if not serializer.is_valid():
+                logger.error(f"유효하지 않은 입력 데이터: {serializer.errors}")
+                return JsonResponse(serializer.errors, status=400)
+
+            data = serializer.validated_data
+            logger.info(f"경로 계산 시작 - 출발: {data['origin']}, 도착: {data['destination']}, 거리 단위: {data['units']}")
+
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                get_route_executor(), partial(calculate_route, data['origin'], data['destination'])
+            )
+            await sync_to_async(record_usage)(drf_request, UsageRecord.Metric.ROUTE)
+
+            response_data = {
+                'origin': data['origin'],
+                'destination': data['destination'],
+                'distance': result['properties']['length'],
+                'units': data['units'],
+                'geojson': result['geometry']
+            }
+            if request.GET.get('save_to_db', '').lower() == 'true':
+                route = await SeaRoute.objects.acreate(**response_data)
+                response_data = SeaRouteResponseSerializer(route).data
+
+            return JsonResponse(response_data)
+
+        except Exception as e:
+            logger.error(f"예상치 못한 오류 발생: {str(e)}", exc_info=True)
+            return JsonResponse({"error": str(e)}, status=500)
+
+
+def seavoyage_view():
+    """ASYNC_VIEWS 설정이 켜져 있으면 ASGI용 비동기 뷰, 아니면 DRF 뷰 (API 문서는 DRF 뷰 기준)"""
+    if not getattr(settings, 'ASYNC_VIEWS', False):
+        return SeavoyageView.as_view()
+    view = AsyncSeavoyageView.as_view()
+    view.cls = SeavoyageView
+    view.initkwargs = {}
+    return view
@@ -0,0 +1,18 @@
+from django.contrib import admin
+from .models import UsageRecord
+
+@admin.register(UsageRecord)
+class UsageRecordAdmin(admin.ModelAdmin):
+    """일간 사용량 관리자 설정 (집계 값이므로 읽기 전용)"""
+    list_display = ('date', 'metric', 'account', 'user', 'api_key', 'count', 'updated_at')
+    list_filter = ('metric', 'date')
+    search_fields = ('account', 'user__email', 'api_key__prefix', 'api_key__name')
+    date_hierarchy = 'date'
+    list_select_related = ('user', 'api_key')
+    readonly_fields = ('date', 'metric', 'account', 'user', 'api_key', 'count', 'updated_at')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,199 @@
+# usage/meter.py
+"""
+요청별 사용량 집계 (QR 렌더링, 해상 경로 계산)
+
+요청 처리 중에는 프로세스 메모리의 카운터만 증가시키고, 모인 증가분을 USAGE_FLUSH_INTERVAL초마다
+(또는 USAGE_FLUSH_THRESHOLD건이 쌓이면 바로) 백그라운드 스레드에서 (날짜, 항목, 계정)별로 합산해 DB에 더한다.
+새 행은 bulk_create로 한 번에 만들고, 합산은 F() 표현식으로 갱신하므로 여러 웹 워커가 동시에 flush해도 값이 유실되지 않는다.
+
+워커가 종료될 때는 atexit로 남은 증가분을 flush한다. DB를 사용할 수 없어 실패한 증가분은 다음 flush에서 다시 시도한다.
+"""
+import atexit
+import logging
+import os
+import threading
+from collections import Counter
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.db import OperationalError, close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import UsageRecord
+
+
+logger = logging.getLogger(__name__)
+
+# (날짜, 항목, 사용자 id, API 키 id)
+UsageKey = Tuple[object, str, Optional[int], Optional[int]]
+# 이미 DB에 행이 있는 것으로 확인한 키를 기억하는 최대 수 (넘으면 비움)
+MAX_KNOWN_KEYS = 10000
+
+
+def account_key(user_id: Optional[int], api_key_id: Optional[int]) -> str:
+    if api_key_id is not None:
+        return f"key:{api_key_id}"
+    if user_id is not None:
+        return f"user:{user_id}"
+    return "anonymous"
+
+
+def write_usage(counts: Counter, known: set) -> None:
+    """증가분을 DB에 더함: 처음 보는 키의 행을 만들고(이미 있으면 무시), 모든 키를 F()로 갱신"""
+    with transaction.atomic():
+        new_keys = [key for key in counts if key not in known]
+        if new_keys:
+            UsageRecord.objects.bulk_create(
+                [
+                    UsageRecord(date=date, metric=metric, account=account_key(user_id, api_key_id), user_id=user_id, api_key_id=api_key_id)
+                    for date, metric, user_id, api_key_id in new_keys
+                ],
+                ignore_conflicts=True,
+            )
+        for (date, metric, user_id, api_key_id), count in counts.items():
+            UsageRecord.objects.filter(
+                date=date, metric=metric, account=account_key(user_id, api_key_id)
+            ).update(count=F('count') + count, updated_at=timezone.now())
+    if len(known) > MAX_KNOWN_KEYS:
+        known.clear()
+    known.update(counts)
+
+
+class UsageMeter:
+    """
+    프로세스 로컬 사용량 카운터
+
+    Args:
+        flush_interval (float): 백그라운드 flush 간격(초). 0이면 스레드 없이 flush_threshold에 도달할 때 기록한 스레드에서 flush
+        flush_threshold (int): 쌓인 건수가 이 값 이상이면 간격을 기다리지 않고 flush
+    """
+
+    def __init__(self, flush_interval: float, flush_threshold: int):
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self.pid = os.getpid()
+        self._counts = Counter()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._known = set()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = None
+        if flush_interval:
+            self._thread = threading.Thread(target=self._run, name='usage-meter', daemon=True)
+            self._thread.start()
+
+    def record(self, metric: str, user_id: Optional[int] = None, api_key_id: Optional[int] = None, count: int = 1) -> None:
+        key = (timezone.localdate(), metric, user_id, api_key_id)
+        with self._lock:
+            self._counts[key] += count
+            self._pending += count
+            full = self._pending >= self.flush_threshold
+        if full:
+            if self._thread is not None:
+                self._wake.set()
+            else:
+                self.flush()
+
+    def flush(self) -> int:
+        """
+        쌓인 증가분을 DB에 기록
+
+        Returns:
+            int: 기록한 건수
+        """
+        with self._flush_lock:
+            with self._lock:
+                counts, self._counts = self._counts, Counter()
+                self._pending = 0
+            if not counts:
+                return 0
+            try:
+                write_usage(counts, self._known)
+            except OperationalError as e:
+                # DB를 일시적으로 사용할 수 없음: 다음 flush에서 다시 시도
+                logger.warning(f"Usage flush failed, will retry: {e}")
+                with self._lock:
+                    self._counts.update(counts)
+                    self._pending += sum(counts.values())
+                return 0
+            except Exception:
+                logger.exception(f"Usage flush failed, dropping {sum(counts.values())} counts")
+                return 0
+            return sum(counts.values())
+
+    def pending(self) -> int:
+        return self._pending
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._closed:
+                return
+            try:
+                self.flush()
+            finally:
+                close_old_connections()
+
+    def close(self, flush: bool = True) -> None:
+        """백그라운드 스레드를 멈추고 남은 증가분을 flush (flush=False면 버림)"""
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        if flush:
+            self.flush()
+        else:
+            with self._lock:
+                self._counts.clear()
+                self._pending = 0
+
+
+_meter: Optional[UsageMeter] = None
+_meter_lock = threading.Lock()
+
+
+def get_usage_meter() -> UsageMeter:
+    """프로세스별 사용량 카운터 (fork된 웹 워커에서는 부모의 카운터를 이어받지 않고 새로 생성)"""
+    global _meter
+    meter = _meter
+    if meter is None or meter.pid != os.getpid():
+        with _meter_lock:
+            if _meter is None or _meter.pid != os.getpid():
+                _meter = UsageMeter(
+                    flush_interval=getattr(settings, 'USAGE_FLUSH_INTERVAL', 10),
+                    flush_threshold=getattr(settings, 'USAGE_FLUSH_THRESHOLD', 1000),
+                )
+            meter = _meter
+    return meter
+
+
+def reset_usage_meter(flush: bool = False) -> None:
+    """카운터를 닫고 다시 만들도록 초기화 (테스트용, 기본값은 남은 증가분을 버림)"""
+    global _meter
+    with _meter_lock:
+        meter, _meter = _meter, None
+    if meter is not None and meter.pid == os.getpid():
+        meter.close(flush=flush)
+
+
+@atexit.register
+def flush_usage_at_exit() -> None:
+    """웹 워커 종료 시 남은 증가분 기록"""
+    meter = _meter
+    if meter is not None and meter.pid == os.getpid():
+        meter.close(flush=True)
+
+
+def record_usage(request, metric: str, count: int = 1) -> None:
+    """요청의 사용자/API 키 기준으로 사용량 기록 (USAGE_METERING_ENABLED가 False면 무시)"""
+    if not getattr(settings, 'USAGE_METERING_ENABLED', True):
+        return
+    user = getattr(request, 'user', None)
+    user_id = user.pk if user is not None and user.is_authenticated else None
+    api_key = getattr(request, 'auth', None)
+    api_key_id = api_key.pk if getattr(api_key, 'is_api_key', False) else None
+    get_usage_meter().record(metric, user_id, api_key_id, count)
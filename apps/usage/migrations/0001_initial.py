@@ -0,0 +1,37 @@
+# Generated by Django 6.1.2 on 2026-10-17 23:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('accounts', '0006_apikey'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UsageRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='날짜')),
+                ('metric', models.CharField(choices=[('qr_render', 'QR 렌더링'), ('route', '해상 경로 계산')], max_length=32, verbose_name='항목')),
+                ('account', models.CharField(editable=False, max_length=64)),
+                ('count', models.PositiveBigIntegerField(default=0, verbose_name='횟수')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('api_key', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='usage_records', to='accounts.apikey', verbose_name='API 키')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='usage_records', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '사용량',
+                'verbose_name_plural': '사용량 목록',
+                'ordering': ['-date', 'account', 'metric'],
+                'constraints': [models.UniqueConstraint(fields=('date', 'metric', 'account'), name='unique_usage_record')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.db import models
+
+
+class UsageRecord(models.Model):
+    """
+    계정별 일간 사용량 (과금, 용량 계획용)
+
+    요청마다 기록하지 않고 웹 워커가 모은 증가분을 주기적으로 더한다 (apps.usage.meter).
+    account는 집계 단위 키('key:<API 키 id>', 'user:<사용자 id>', 'anonymous')로, 사용자/키가 없는 행도 중복 없이 합산하기 위해 사용한다.
+    """
+
+    class Metric(models.TextChoices):
+        QR_RENDER = 'qr_render', 'QR 렌더링'
+        ROUTE = 'route', '해상 경로 계산'
+
+    date = models.DateField(verbose_name="날짜")
+    metric = models.CharField(max_length=32, choices=Metric.choices, verbose_name="항목")
+    account = models.CharField(max_length=64, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, related_name='usage_records', null=True, blank=True, on_delete=models.SET_NULL,
+        verbose_name="사용자",
+    )
+    api_key = models.ForeignKey(
+        'accounts.APIKey', related_name='usage_records', null=True, blank=True, on_delete=models.SET_NULL,
+        verbose_name="API 키",
+    )
+    count = models.PositiveBigIntegerField(default=0, verbose_name="횟수")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-date', 'account', 'metric']
+        verbose_name = "사용량"
+        verbose_name_plural = "사용량 목록"
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'metric', 'account'], name='unique_usage_record'),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.account} {self.metric}: {self.count}"
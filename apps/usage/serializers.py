@@ -0,0 +1,22 @@
+from rest_framework import serializers
+
+from .models import UsageRecord
+
+class UsageQuerySerializer(serializers.Serializer):
+    """사용량 조회 기간/항목"""
+    start = serializers.DateField(required=False, help_text="시작일 (기본값: 30일 전)")
+    end = serializers.DateField(required=False, help_text="종료일 (기본값: 오늘)")
+    metric = serializers.ChoiceField(choices=UsageRecord.Metric.choices, required=False, help_text="항목")
+
+    def validate(self, attrs):
+        if attrs.get('start') and attrs.get('end') and attrs['start'] > attrs['end']:
+            raise serializers.ValidationError("start must be before end.")
+        return attrs
+
+class UsageRecordSerializer(serializers.ModelSerializer):
+    """일간 사용량 응답을 위한 Serializer"""
+    api_key = serializers.CharField(source='api_key.prefix', default=None, read_only=True)
+
+    class Meta:
+        model = UsageRecord
+        fields = ['date', 'metric', 'api_key', 'count']
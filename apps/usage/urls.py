@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import UsageView
+
+app_name = "usage"
+
+urlpatterns = [
+    path("", UsageView.as_view(), name="usage"),
+]
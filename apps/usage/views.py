@@ -0,0 +1,55 @@
+import datetime
+import logging
+
+from django.db.models import Sum
+from django.utils import timezone
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from apps.accounts.permissions import APIKeyScopePermission
+from .models import UsageRecord
+from .serializers import UsageQuerySerializer, UsageRecordSerializer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USAGE_DAYS = 30
+
+
+class UsageView(GenericAPIView):
+    """
+    로그인한 사용자의 일간 사용량 (API 키로 요청하면 그 키의 사용량만)
+
+    사용량은 웹 워커에서 주기적으로 기록되므로 최근 몇 초(USAGE_FLUSH_INTERVAL)의 요청은 아직 포함되지 않을 수 있다.
+    """
+    serializer_class = UsageRecordSerializer
+    permission_classes = [IsAuthenticated, APIKeyScopePermission]
+    api_key_scope = 'usage'
+
+    @swagger_auto_schema(
+        operation_description="일간 사용량(QR 렌더링, 해상 경로 계산)을 조회합니다",
+        query_serializer=UsageQuerySerializer,
+        responses={200: UsageRecordSerializer(many=True)},
+    )
+    def get(self, request: Request):
+        query = UsageQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return Response(query.errors, status=400)
+
+        end = query.validated_data.get('end') or timezone.localdate()
+        start = query.validated_data.get('start') or end - datetime.timedelta(days=DEFAULT_USAGE_DAYS - 1)
+        records = UsageRecord.objects.filter(user=request.user, date__range=(start, end)).select_related('api_key')
+        if getattr(request.auth, 'is_api_key', False):
+            records = records.filter(api_key=request.auth)
+        if query.validated_data.get('metric'):
+            records = records.filter(metric=query.validated_data['metric'])
+
+        totals = {row['metric']: row['total'] for row in records.order_by().values('metric').annotate(total=Sum('count'))}
+        return Response({
+            'start': start,
+            'end': end,
+            'totals': totals,
+            'results': UsageRecordSerializer(records, many=True).data,
+        })
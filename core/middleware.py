@@ -0,0 +1,385 @@
+# core/middleware.py
+"""
+부하 제어(admission control) 미들웨어
+
+CPU를 많이 쓰는 엔드포인트(QR 렌더링, 해상 경로 계산)의 동시 처리 수를 웹 워커 프로세스별, 호스트별로 제한한다.
+한도를 넘은 요청은 잠시(ADMISSION_MAX_QUEUE_WAIT) 기다렸다가 차례가 오지 않으면 바로 503 + Retry-After로 거절하므로,
+과부하 상황에서도 처리되는 요청의 지연 시간이 일정하게 유지된다.
+
+헬스 체크와 가벼운 엔드포인트(작업 상태 조회 등)는 제한 없이 통과시킨다 (우선 처리).
+호스트 단위 제한은 슬롯 파일에 대한 flock으로 구현해, 프로세스가 죽어도 슬롯이 자동으로 반환된다.
+
+RateLimitHeadersMiddleware는 스로틀(core.throttling)이 기록한 남은 요청 수를 응답 헤더로 알려 준다.
+"""
+import asyncio
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+from typing import List, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import JsonResponse
+
+from core.throttling import RATE_LIMIT_ATTR
+
+try:
+    import fcntl
+except ImportError:  # Windows: 호스트 단위 제한 없이 프로세스 단위로만 동작
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ADMISSION_PATHS = ('/api/v1/qr/', '/api/v1/seavoyage/')
+DEFAULT_ADMISSION_EXEMPT_PATHS = ('/healthz', '/api/v1/qr/jobs', '/api/v1/qr/render-pool')
+# 대기 중 슬롯을 다시 확인하는 간격(초). 다른 프로세스가 반환한 호스트 슬롯은 알림을 받을 수 없으므로 주기적으로 확인
+POLL_INTERVAL = 0.01
+
+
+class HostSlots:
+    """
+    같은 호스트의 웹 워커 프로세스들이 공유하는 동시 처리 슬롯
+
+    slot-N 파일마다 배타적 flock을 잡는 것이 슬롯 하나를 사용하는 것이다.
+    같은 프로세스의 스레드끼리는 파일 잠금으로 구분되지 않으므로 사용 중인 슬롯 번호를 따로 기억한다.
+    """
+
+    def __init__(self, directory: str, size: int):
+        self.directory = directory
+        self.size = size
+        self._files: List = []
+        self._held = set()
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _open(self):
+        # fork로 복제된 프로세스는 부모와 같은 잠금을 공유하므로 파일을 새로 연다
+        if self._pid == os.getpid():
+            return
+        for fp in self._files:
+            fp.close()
+        os.makedirs(self.directory, exist_ok=True)
+        self._files = [open(os.path.join(self.directory, f"slot-{index}"), 'a') for index in range(self.size)]
+        self._held = set()
+        self._pid = os.getpid()
+
+    def try_acquire(self) -> Optional[int]:
+        """비어 있는 슬롯 번호, 없으면 None"""
+        with self._lock:
+            self._open()
+            for index, fp in enumerate(self._files):
+                if index in self._held:
+                    continue
+                try:
+                    fcntl.flock(fp, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue
+                self._held.add(index)
+                return index
+        return None
+
+    def release(self, index: int) -> None:
+        with self._lock:
+            if index in self._held:
+                fcntl.flock(self._files[index], fcntl.LOCK_UN)
+                self._held.discard(index)
+
+
+class AdmissionController:
+    """
+    프로세스 단위 동시 처리 수 제한과 대기열
+
+    Args:
+        max_in_flight (int): 이 프로세스에서 동시에 처리할 요청 수
+        max_queue (int): 차례를 기다릴 수 있는 요청 수. 초과하면 바로 거절
+        max_queue_wait (float): 차례를 기다리는 최대 시간(초)
+        host_slots (HostSlots, optional): 호스트 단위 슬롯 (프로세스 한도와 함께 둘 다 확보해야 처리)
+    """
+
+    def __init__(self, max_in_flight: int, max_queue: int, max_queue_wait: float, host_slots: Optional[HostSlots] = None):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self.host_slots = host_slots
+        self.in_flight = 0
+        self.waiting = 0
+        self.counters = dict.fromkeys(('admitted', 'queued', 'rejected', 'expired'), 0)
+        self._condition = threading.Condition()
+
+    def _try_admit(self):
+        """(처리 가능 여부, 호스트 슬롯 번호). _condition을 잡은 상태에서 호출"""
+        if self.in_flight >= self.max_in_flight:
+            return False, None
+        slot = None
+        if self.host_slots is not None:
+            slot = self.host_slots.try_acquire()
+            if slot is None:
+                return False, None
+        self.in_flight += 1
+        self.counters['admitted'] += 1
+        return True, slot
+
+    def _enqueue(self) -> bool:
+        """대기열에 자리가 있으면 대기 수를 늘리고 True. _condition을 잡은 상태에서 호출"""
+        if self.waiting >= self.max_queue:
+            self.counters['rejected'] += 1
+            return False
+        self.waiting += 1
+        self.counters['queued'] += 1
+        return True
+
+    def acquire(self):
+        """
+        차례가 올 때까지 기다려 처리 권한을 얻음
+
+        Returns:
+            tuple: (처리 가능 여부, release()에 넘길 호스트 슬롯 번호)
+        """
+        deadline = time.monotonic() + self.max_queue_wait
+        with self._condition:
+            admitted, slot = self._try_admit()
+            if admitted or not self._enqueue():
+                return admitted, slot
+            try:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.counters['rejected'] += 1
+                        return False, None
+                    self._condition.wait(min(remaining, POLL_INTERVAL))
+                    admitted, slot = self._try_admit()
+                    if admitted:
+                        return True, slot
+            finally:
+                self.waiting -= 1
+
+    async def aacquire(self):
+        """acquire()의 비동기 버전 (기다리는 동안 이벤트 루프를 막지 않음)"""
+        deadline = time.monotonic() + self.max_queue_wait
+        with self._condition:
+            admitted, slot = self._try_admit()
+            if admitted or not self._enqueue():
+                return admitted, slot
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    with self._condition:
+                        self.counters['rejected'] += 1
+                    return False, None
+                await asyncio.sleep(min(remaining, POLL_INTERVAL))
+                with self._condition:
+                    admitted, slot = self._try_admit()
+                if admitted:
+                    return True, slot
+        finally:
+            with self._condition:
+                self.waiting -= 1
+
+    def release(self, slot: Optional[int]) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            if slot is not None:
+                self.host_slots.release(slot)
+            self._condition.notify()
+
+    def record_expired(self) -> None:
+        with self._condition:
+            self.counters['expired'] += 1
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {
+                'in_flight': self.in_flight,
+                'waiting': self.waiting,
+                'max_in_flight': self.max_in_flight,
+                'max_queue': self.max_queue,
+                **self.counters,
+            }
+
+
+_admission_controller: Optional[AdmissionController] = None
+_admission_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    """프로세스 전역 AdmissionController (처음 사용할 때 설정값으로 생성)"""
+    global _admission_controller
+    if _admission_controller is None:
+        with _admission_controller_lock:
+            if _admission_controller is None:
+                host_max = getattr(settings, 'ADMISSION_HOST_MAX_IN_FLIGHT', 0)
+                host_slots = None
+                if host_max and fcntl is not None:
+                    directory = getattr(settings, 'ADMISSION_HOST_SLOTS_DIR', None) or os.path.join(
+                        tempfile.gettempdir(), 'admission-slots'
+                    )
+                    host_slots = HostSlots(directory, host_max)
+                _admission_controller = AdmissionController(
+                    max_in_flight=getattr(settings, 'ADMISSION_MAX_IN_FLIGHT', 4),
+                    max_queue=getattr(settings, 'ADMISSION_MAX_QUEUE', 16),
+                    max_queue_wait=getattr(settings, 'ADMISSION_MAX_QUEUE_WAIT', 1.0),
+                    host_slots=host_slots,
+                )
+    return _admission_controller
+
+
+def reset_admission_controller() -> None:
+    """설정이 바뀌었을 때 다음 요청에서 새로 만들도록 초기화 (테스트용)"""
+    global _admission_controller
+    with _admission_controller_lock:
+        _admission_controller = None
+
+
+def parse_request_start(value: str) -> Optional[float]:
+    """
+    프록시가 붙인 X-Request-Start 헤더를 epoch 초로 변환
+
+    't=' 접두사를 허용하고, 값의 크기로 초/밀리초/마이크로초 단위를 판별한다.
+    """
+    value = value.strip()
+    if value.startswith('t='):
+        value = value[2:]
+    try:
+        started = float(value)
+    except ValueError:
+        return None
+    if started > 1e14:
+        return started / 1e6
+    if started > 1e11:
+        return started / 1e3
+    return started
+
+
+def overloaded_response() -> JsonResponse:
+    response = JsonResponse(
+        {
+            'detail': "Server is busy. Please retry shortly.",
+            'error_code': 'SERVER_BUSY',
+        },
+        status=503,
+    )
+    response['Retry-After'] = str(getattr(settings, 'ADMISSION_RETRY_AFTER', 1))
+    return response
+
+
+class AdmissionControlMiddleware:
+    """
+    CPU를 많이 쓰는 엔드포인트에 대한 부하 제어 (동기/비동기 요청 처리 모두 지원)
+
+    ADMISSION_CONTROL_PATHS로 시작하는 경로만 제한하고, ADMISSION_CONTROL_EXEMPT_PATHS와 OPTIONS 요청은 바로 통과시킨다.
+    프록시가 X-Request-Start를 붙이는 경우, 웹 서버 대기열에서 ADMISSION_MAX_REQUEST_AGE초 이상 기다린 요청은
+    클라이언트가 이미 포기했을 가능성이 높으므로 처리하지 않고 거절한다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def is_controlled(self, request) -> bool:
+        if not getattr(settings, 'ADMISSION_CONTROL_ENABLED', True) or request.method == 'OPTIONS':
+            return False
+        path = request.path
+        if path.startswith(tuple(getattr(settings, 'ADMISSION_CONTROL_EXEMPT_PATHS', DEFAULT_ADMISSION_EXEMPT_PATHS))):
+            return False
+        return path.startswith(tuple(getattr(settings, 'ADMISSION_CONTROL_PATHS', DEFAULT_ADMISSION_PATHS)))
+
+    def is_expired(self, request) -> bool:
+        """웹 서버 대기열에서 너무 오래 기다린 요청인지 확인"""
+        max_age = getattr(settings, 'ADMISSION_MAX_REQUEST_AGE', 0)
+        header = request.META.get('HTTP_X_REQUEST_START')
+        if not max_age or not header:
+            return False
+        started = parse_request_start(header)
+        return started is not None and time.time() - started > max_age
+
+    def release_after(self, response, controller: AdmissionController, slot: Optional[int]):
+        """
+        스트리밍 응답(배치 ZIP, 라벨 PDF)은 본문을 만드는 동안 렌더링하므로 전송이 끝나 응답이 닫힐 때 반환
+        (FileResponse가 파일을 닫을 때 쓰는 것과 같은 _resource_closers 사용)
+        """
+        if response.streaming:
+            response._resource_closers.append(lambda: controller.release(slot))
+        else:
+            controller.release(slot)
+        return response
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not self.is_controlled(request):
+            return self.get_response(request)
+
+        controller = get_admission_controller()
+        if self.is_expired(request):
+            controller.record_expired()
+            return overloaded_response()
+        admitted, slot = controller.acquire()
+        if not admitted:
+            logger.warning(f"Shedding request to {request.path}: {controller.stats()}")
+            return overloaded_response()
+        try:
+            response = self.get_response(request)
+        except BaseException:
+            controller.release(slot)
+            raise
+        return self.release_after(response, controller, slot)
+
+    async def __acall__(self, request):
+        if not self.is_controlled(request):
+            return await self.get_response(request)
+
+        controller = get_admission_controller()
+        if self.is_expired(request):
+            controller.record_expired()
+            return overloaded_response()
+        admitted, slot = await controller.aacquire()
+        if not admitted:
+            logger.warning(f"Shedding request to {request.path}: {controller.stats()}")
+            return overloaded_response()
+        try:
+            response = await self.get_response(request)
+        except BaseException:
+            controller.release(slot)
+            raise
+        return self.release_after(response, controller, slot)
+
+
+class RateLimitHeadersMiddleware:
+    """
+    스로틀이 요청에 기록한 버킷 상태를 X-RateLimit-Limit/Remaining/Reset 헤더로 반환 (동기/비동기 요청 처리 모두 지원)
+
+    Reset은 버킷이 다시 가득 찰 때까지 남은 시간(초)이다. 거절된 요청(429)에는 DRF가 Retry-After를 붙인다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def add_headers(self, request, response):
+        limit = getattr(request, RATE_LIMIT_ATTR, None)
+        if limit is not None:
+            response['X-RateLimit-Limit'] = limit.limit
+            response['X-RateLimit-Remaining'] = limit.remaining
+            response['X-RateLimit-Reset'] = math.ceil(limit.reset)
+        return response
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.add_headers(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.add_headers(request, await self.get_response(request))
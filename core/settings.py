@@ -93,6 +93,7 @@ INSTALLED_APPS = [
     "apps.qr",
     "apps.home",
     "apps.seavoyage",
+    "apps.usage",
 
     # Third Party apps
     "jazzmin",
@@ -120,8 +121,11 @@ AUTHENTICATION_BACKENDS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    # 부하 제어로 거절된 503에도 CORS 헤더가 붙도록 CorsMiddleware 아래에 둔다
     "corsheaders.middleware.CorsMiddleware",
+    "core.middleware.AdmissionControlMiddleware",
+    "core.middleware.RateLimitHeadersMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
     "apps.accounts.middleware.AuthMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -280,6 +284,8 @@ CORS_ALLOWED_ORIGINS = [
     "http://127.0.0.1:5174",
     "https://qrcode.piusdev.com",
 ]
+# 브라우저 클라이언트가 읽을 수 있는 응답 헤더 (QR 렌더링 예상 비용과 레인)
+CORS_EXPOSE_HEADERS = ["X-QR-Render-Cost", "X-QR-Render-Lane", "X-RateLimit-Limit", "X-RateLimit-Remaining", "X-RateLimit-Reset", "Retry-After"]
 
 # Internal IPs
 INTERNAL_IPS = [
@@ -498,3 +504,135 @@ SIMPLE_JWT = {
     'SLIDING_TOKEN_LIFETIME': timedelta(minutes=5),
     'SLIDING_TOKEN_REFRESH_LIFETIME': timedelta(days=1),
 }
+
+# QR 렌더링 캐시 설정
+# 동일한 입력(데이터, 스타일, 색상 등)으로 생성된 QR 이미지를 메모리에 캐시
+QR_RENDER_CACHE_MAX_BYTES = int(os.environ.get("QR_RENDER_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+QR_RENDER_CACHE_MAX_ITEM_BYTES = QR_RENDER_CACHE_MAX_BYTES // 8
+# 2차 캐시로 사용할 CACHES 별칭 (None이면 프로세스 내 캐시만 사용)
+QR_RENDER_CACHE_BACKEND = os.environ.get("QR_RENDER_CACHE_BACKEND") or None
+QR_RENDER_CACHE_TIMEOUT = 60 * 60 * 24
+# 스타일과 무관한 QR 모듈 행렬 캐시 용량
+QR_MATRIX_CACHE_MAX_BYTES = 8 * 1024 * 1024
+# 그라데이션 색상 레이어 캐시 용량 (마스크 종류, 픽셀 크기, 색상별로 재사용)
+QR_GRADIENT_LAYER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# 모듈 스프라이트 레지스트리 용량 (스타일, box_size, 색상별 미리 렌더링한 모듈 이미지)
+QR_SPRITE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+# QR 이미지 인코딩 설정 (PNG zlib 압축 레벨 0-9, 무손실 WebP 압축 방식 0-6)
+QR_PNG_COMPRESS_LEVEL = int(os.environ.get("QR_PNG_COMPRESS_LEVEL", 6))
+QR_WEBP_METHOD = int(os.environ.get("QR_WEBP_METHOD", 4))
+# QR 이미지 한 변의 최대 픽셀 수와 초과 시 처리 방식 ('clamp': box_size 축소, 'reject': 400 응답)
+QR_MAX_IMAGE_PIXELS = int(os.environ.get("QR_MAX_IMAGE_PIXELS", 2048))
+QR_PIXEL_BUDGET_POLICY = os.environ.get("QR_PIXEL_BUDGET_POLICY", "clamp")
+# GET 렌더링 응답의 Cache-Control max-age(초)와 URL 서명 키 (설정하면 GET 요청에 sig 파라미터 필요)
+QR_GET_CACHE_MAX_AGE = 60 * 60 * 24 * 365
+QR_URL_SIGNING_KEY = os.environ.get("QR_URL_SIGNING_KEY") or None
+# 디스크 렌더 저장소 (MEDIA_ROOT/qr-renders, 같은 호스트의 워커가 공유)
+QR_RENDER_STORE_ENABLED = os.environ.get("QR_RENDER_STORE_ENABLED", "False").lower() == "true"
+QR_RENDER_STORE_ROOT = os.environ.get("QR_RENDER_STORE_ROOT") or os.path.join(MEDIA_ROOT, "qr-renders")
+QR_RENDER_STORE_MAX_BYTES = int(os.environ.get("QR_RENDER_STORE_MAX_BYTES", 1024 * 1024 * 1024))
+# 파일 전송 방식: None(FileResponse), "x-sendfile"(Apache), "x-accel-redirect"(nginx internal location)
+QR_RENDER_STORE_SENDFILE = os.environ.get("QR_RENDER_STORE_SENDFILE") or None
+QR_RENDER_STORE_ACCEL_PREFIX = "/protected/qr-renders/"
+# 배치 엔드포인트: 렌더링 워커 프로세스 수 (None이면 CPU 수, 0이면 요청 스레드에서 렌더링)와 요청당 최대 항목 수
+QR_BATCH_WORKERS = int(os.environ["QR_BATCH_WORKERS"]) if os.environ.get("QR_BATCH_WORKERS") else None
+QR_BATCH_MAX_ITEMS = int(os.environ.get("QR_BATCH_MAX_ITEMS", 1000))
+# 배치 워커 프로세스 시작 방식 (스레드가 있는 웹 워커에서 fork하지 않도록 기본값은 forkserver)
+QR_BATCH_START_METHOD = os.environ.get("QR_BATCH_START_METHOD", "forkserver")
+# 라벨 시트 PDF 요청당 최대 라벨 수
+QR_SHEET_MAX_ITEMS = int(os.environ.get("QR_SHEET_MAX_ITEMS", 10000))
+# 대량 생성 작업 (manage.py qr_worker): 청크당 행 수, 청크 최대 시도 횟수, 멈춘 작업을 다른 워커가 이어받기까지의 시간(초)
+QR_JOB_CHUNK_SIZE = int(os.environ.get("QR_JOB_CHUNK_SIZE", 500))
+QR_JOB_MAX_ATTEMPTS = 3
+QR_JOB_STALE_SECONDS = 600
+# 대량 생성 작업의 최대 업로드 크기(바이트)와 최대 행 수
+QR_JOB_MAX_UPLOAD_SIZE = int(os.environ.get("QR_JOB_MAX_UPLOAD_SIZE", 50 * 1024 * 1024))
+QR_JOB_MAX_ITEMS = int(os.environ.get("QR_JOB_MAX_ITEMS", 100000))
+# 요청 렌더링용 상주 프로세스 풀 (웹 워커마다 생성, 0이면 요청 스레드에서 렌더링)
+# 대기열 최대 길이, 작업당 실행/대기 제한 시간(초), 워커 교체 기준(처리한 작업 수, 최대 RSS MB, 0이면 제한 없음)
+QR_RENDER_POOL_WORKERS = int(os.environ.get("QR_RENDER_POOL_WORKERS", 0))
+QR_RENDER_POOL_MAX_QUEUE = int(os.environ.get("QR_RENDER_POOL_MAX_QUEUE", 64))
+QR_RENDER_POOL_TIMEOUT = float(os.environ.get("QR_RENDER_POOL_TIMEOUT", 10))
+QR_RENDER_POOL_QUEUE_TIMEOUT = float(os.environ.get("QR_RENDER_POOL_QUEUE_TIMEOUT", 10))
+QR_RENDER_POOL_MAX_JOBS_PER_WORKER = int(os.environ.get("QR_RENDER_POOL_MAX_JOBS_PER_WORKER", 1000))
+QR_RENDER_POOL_MAX_MEMORY_MB = int(os.environ.get("QR_RENDER_POOL_MAX_MEMORY_MB", 512))
+# 워커 프로세스 시작 방식 (스레드가 있는 웹 워커에서 fork하지 않도록 기본값은 forkserver)
+QR_RENDER_POOL_START_METHOD = os.environ.get("QR_RENDER_POOL_START_METHOD", "forkserver")
+# ASGI 서버(core.asgi)에서 QR/해상 경로 엔드포인트를 비동기 뷰로 제공
+# 비동기 QR 뷰의 동시 렌더링 수 (None이면 CPU 수)와 동시 경로 계산 수
+ASYNC_VIEWS = os.environ.get("ASYNC_VIEWS", "False").lower() == "true"
+QR_ASYNC_RENDER_CONCURRENCY = int(os.environ["QR_ASYNC_RENDER_CONCURRENCY"]) if os.environ.get("QR_ASYNC_RENDER_CONCURRENCY") else None
+SEAVOYAGE_ROUTE_CONCURRENCY = int(os.environ.get("SEAVOYAGE_ROUTE_CONCURRENCY", 2))
+# 부하 제어: QR/해상 경로 엔드포인트의 동시 처리 수 (웹 워커 프로세스별, 호스트 전체(0이면 제한 없음))
+# 차례를 기다릴 수 있는 요청 수와 최대 대기 시간(초), 프록시 대기열에서 이 시간(초) 이상 기다린 요청은 거절 (X-Request-Start 기준, 0이면 확인 안 함)
+ADMISSION_CONTROL_ENABLED = os.environ.get("ADMISSION_CONTROL_ENABLED", "True").lower() == "true"
+# 프로세스별 기본값은 gunicorn 스레드 수(Procfile의 GUNICORN_THREADS)와 같게 두어 모든 요청 스레드가 QR/해상 경로 요청을 처리할 수 있게 한다
+GUNICORN_THREADS = int(os.environ.get("GUNICORN_THREADS", 4))
+ADMISSION_MAX_IN_FLIGHT = int(os.environ.get("ADMISSION_MAX_IN_FLIGHT", GUNICORN_THREADS))
+ADMISSION_HOST_MAX_IN_FLIGHT = int(os.environ.get("ADMISSION_HOST_MAX_IN_FLIGHT", (os.cpu_count() or 1) * 2))
+ADMISSION_HOST_SLOTS_DIR = os.environ.get("ADMISSION_HOST_SLOTS_DIR") or None
+ADMISSION_MAX_QUEUE = int(os.environ.get("ADMISSION_MAX_QUEUE", 16))
+ADMISSION_MAX_QUEUE_WAIT = float(os.environ.get("ADMISSION_MAX_QUEUE_WAIT", 1.0))
+ADMISSION_MAX_REQUEST_AGE = float(os.environ.get("ADMISSION_MAX_REQUEST_AGE", 10))
+ADMISSION_RETRY_AFTER = 1
+# 부하 제어 대상 경로와 제외 경로 (헬스 체크, 작업 상태 조회처럼 가벼운 요청은 바로 처리)
+ADMISSION_CONTROL_PATHS = ["/api/v1/qr/", "/api/v1/seavoyage/"]
+ADMISSION_CONTROL_EXEMPT_PATHS = ["/healthz", "/api/v1/qr/jobs", "/api/v1/qr/render-pool"]
+# 비용 기반 렌더링 레인: 예상 비용(ms)이 기준 이상이면 느린 레인에서 렌더링
+# 느린 레인의 프로세스당 동시 렌더링 수와 차례를 기다리는 최대 시간(초, 초과 시 503)
+QR_SLOW_LANE_THRESHOLD = float(os.environ.get("QR_SLOW_LANE_THRESHOLD", 100))
+QR_SLOW_LANE_CONCURRENCY = int(os.environ.get("QR_SLOW_LANE_CONCURRENCY", 1))
+QR_SLOW_LANE_QUEUE_TIMEOUT = float(os.environ.get("QR_SLOW_LANE_QUEUE_TIMEOUT", 0.5))
+# 요청 제한 (core.throttling): 토큰 버킷 카운터는 THROTTLE_CACHE_URL(redis://...)의 공유 캐시에 저장해 모든 웹 워커가 함께 사용
+# 지정하지 않으면 프로세스별 로컬 메모리 캐시 (개발/테스트용, 웹 워커 수만큼 한도가 늘어남)
+THROTTLE_CACHE_ALIAS = "throttle"
+THROTTLE_CACHE_URL = os.environ.get("THROTTLE_CACHE_URL")
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    THROTTLE_CACHE_ALIAS: {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": THROTTLE_CACHE_URL,
+    } if THROTTLE_CACHE_URL else {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "throttle",
+    },
+}
+# 인증: API 키(B2B 연동, 키의 scopes로 사용 가능한 API 제한), 세션, Basic
+# 요청 제한: IP별, 사용자별 전체 요청 수와 엔드포인트 종류별 요청 수 (단순 QR, 스타일/그라데이션 등 비용이 큰 QR, 배치/작업, 해상 경로)
+# API 키 요청은 키별 요청 수만 제한 (키의 throttle_rate, 없으면 api_key)
+REST_FRAMEWORK = {
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "apps.accounts.authentication.APIKeyAuthentication",
+        "rest_framework.authentication.SessionAuthentication",
+        "rest_framework.authentication.BasicAuthentication",
+    ],
+    "DEFAULT_PERMISSION_CLASSES": [
+        "apps.accounts.permissions.APIKeyScopePermission",
+    ],
+    "DEFAULT_THROTTLE_CLASSES": [
+        "core.throttling.IPRateThrottle",
+        "core.throttling.UserRateThrottle",
+        "core.throttling.EndpointRateThrottle",
+        "core.throttling.APIKeyRateThrottle",
+    ],
+    "DEFAULT_THROTTLE_RATES": {
+        "ip": os.environ.get("THROTTLE_RATE_IP", "300/min"),
+        "user": os.environ.get("THROTTLE_RATE_USER", "600/min"),
+        "qr": os.environ.get("THROTTLE_RATE_QR", "120/min"),
+        "qr_heavy": os.environ.get("THROTTLE_RATE_QR_HEAVY", "20/min"),
+        "qr_batch": os.environ.get("THROTTLE_RATE_QR_BATCH", "10/min"),
+        "seavoyage": os.environ.get("THROTTLE_RATE_SEAVOYAGE", "10/min"),
+        "api_key": os.environ.get("THROTTLE_RATE_API_KEY", "1200/min"),
+    },
+}
+# API 키 검증 캐시: 프로세스별 보관 시간(초)과 최대 키 수, 폐기 여부를 확인하는 간격(초)과 이를 공유하는 캐시
+API_KEY_CACHE_TTL = int(os.environ.get("API_KEY_CACHE_TTL", 60))
+API_KEY_CACHE_MAX_SIZE = 10000
+API_KEY_CACHE_SYNC_INTERVAL = float(os.environ.get("API_KEY_CACHE_SYNC_INTERVAL", 5))
+API_KEY_CACHE_ALIAS = THROTTLE_CACHE_ALIAS
+# 사용량 집계 (apps.usage): 웹 워커별로 모은 증가분을 기록하는 간격(초)과 간격 전에 바로 기록하는 건수
+USAGE_METERING_ENABLED = os.environ.get("USAGE_METERING_ENABLED", "True").lower() == "true"
+USAGE_FLUSH_INTERVAL = float(os.environ.get("USAGE_FLUSH_INTERVAL", 10))
+USAGE_FLUSH_THRESHOLD = int(os.environ.get("USAGE_FLUSH_THRESHOLD", 1000))
@@ -0,0 +1,204 @@
+# core/throttling.py
+"""
+캐시 기반 토큰 버킷 스로틀링 (DRF throttle 클래스)
+
+버킷 상태를 GCRA(generic cell rate algorithm) 방식으로 "버킷이 다시 가득 차는 시각"(TAT, ms) 하나로 저장하므로,
+요청마다 캐시 연산 몇 번(get, incr, touch)으로 끝나고 요청 기록 목록을 저장하지 않는다 (DRF SimpleRateThrottle과 다른 점).
+토큰 사용은 캐시의 원자적 incr로 처리해 여러 웹 워커가 같은 캐시(THROTTLE_CACHE_ALIAS)를 공유해도 초과 허용이 없다.
+DB는 사용하지 않는다.
+
+요율은 REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']의 'num/period' 형식이며, 버킷 크기가 num, 보충 속도가 num/period이다.
+API 키로 인증한 요청은 IP/사용자/엔드포인트 제한 대신 키별 제한(APIKeyRateThrottle)만 적용한다.
+"""
+import math
+import time
+from typing import NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+
+RATE_LIMIT_ATTR = 'rate_limit'
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+class RateLimit(NamedTuple):
+    """응답 헤더로 알려 줄 버킷 상태"""
+    limit: int
+    remaining: int
+    reset: float  # 버킷이 다시 가득 찰 때까지 남은 시간(초)
+
+
+def parse_rate(rate: Optional[str]) -> Optional[Tuple[int, int]]:
+    """'100/min' -> (버킷 크기 100, 토큰 하나가 보충되는 간격 600ms)"""
+    if rate is None:
+        return None
+    num, period = rate.split('/')
+    capacity = int(num)
+    return capacity, PERIODS[period[0]] * 1000 // capacity
+
+
+def consume_token(cache, key: str, capacity: int, interval: int, now: Optional[int] = None) -> Tuple[bool, RateLimit, float]:
+    """
+    버킷에서 토큰 하나를 사용
+
+    Args:
+        cache: Django 캐시 (incr이 원자적인 백엔드: locmem, redis, memcached)
+        key (str): 버킷 키
+        capacity (int): 버킷 크기 (연속으로 허용하는 요청 수)
+        interval (int): 토큰 하나가 보충되는 간격(ms)
+        now (int, optional): 현재 시각(ms). 테스트용
+
+    Returns:
+        tuple: (허용 여부, RateLimit, 거절된 경우 다음 토큰까지 기다릴 시간(초))
+    """
+    now = int(time.time() * 1000) if now is None else now
+    tolerance = interval * (capacity - 1)
+    timeout = math.ceil((tolerance + interval) / 1000) + 1
+
+    tat = cache.get(key)
+    if tat is None or tat <= now:
+        # 버킷이 가득 찬 상태. 동시에 도착한 요청끼리 경쟁하면 토큰 하나가 덜 사용될 수 있다 (거절 쪽으로는 틀리지 않음)
+        tat = now + interval
+        cache.set(key, tat, timeout)
+    else:
+        try:
+            tat = cache.incr(key, interval)
+        except ValueError:
+            # get과 incr 사이에 만료됨
+            tat = now + interval
+            cache.set(key, tat, timeout)
+        else:
+            if tat - now > tolerance + interval:
+                # 사용한 토큰을 되돌리고 거절
+                try:
+                    cache.decr(key, interval)
+                except ValueError:
+                    pass
+                wait = (tat - interval - tolerance - now) / 1000
+                return False, RateLimit(capacity, 0, (tat - interval - now) / 1000), wait
+            cache.touch(key, timeout)
+
+    remaining = (tolerance + interval - (tat - now)) // interval
+    return True, RateLimit(capacity, remaining, (tat - now) / 1000), 0.0
+
+
+def get_throttle_cache():
+    return caches[getattr(settings, 'THROTTLE_CACHE_ALIAS', 'default')]
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    토큰 버킷 스로틀 기본 클래스
+
+    하위 클래스는 scope와 get_cache_key()를 정의한다. applies_to_api_keys가 False이면 API 키 요청은 제한하지 않는다. 허용된 요청의 버킷 상태는 요청 객체에 기록되어
+    RateLimitHeadersMiddleware가 X-RateLimit-* 헤더로 반환한다 (여러 스로틀 중 남은 요청 수가 가장 적은 것).
+    """
+    scope = None
+    applies_to_api_keys = False
+
+    def __init__(self):
+        self._wait = None
+
+    def get_rate(self, scope: str) -> Optional[str]:
+        return api_settings.DEFAULT_THROTTLE_RATES.get(scope)
+
+    def get_cache_key(self, request, view) -> Optional[str]:
+        raise NotImplementedError('.get_cache_key() must be overridden')
+
+    def allow_request(self, request, view) -> bool:
+        if not self.applies_to_api_keys and get_api_key(request) is not None:
+            return True
+        rate = parse_rate(self.get_rate(self.scope)) if self.scope else None
+        key = self.get_cache_key(request, view) if rate else None
+        if key is None:
+            return True
+
+        allowed, limit, self._wait = consume_token(get_throttle_cache(), key, *rate)
+        record_rate_limit(request, limit)
+        return allowed
+
+    def wait(self) -> Optional[float]:
+        return self._wait
+
+    def get_user(self, request):
+        """로그인한 사용자 (AuthenticationMiddleware를 거치지 않은 요청이면 None)"""
+        user = getattr(request, 'user', None)
+        return user if user is not None and user.is_authenticated else None
+
+    def get_user_or_ident(self, request) -> str:
+        user = self.get_user(request)
+        if user is not None:
+            return f"user:{user.pk}"
+        return f"ip:{self.get_ident(request)}"
+
+
+class IPRateThrottle(TokenBucketThrottle):
+    """클라이언트 IP별 전체 요청 제한 (인증 여부와 무관)"""
+    scope = 'ip'
+
+    def get_cache_key(self, request, view):
+        return f"throttle:{self.scope}:{self.get_ident(request)}"
+
+
+class UserRateThrottle(TokenBucketThrottle):
+    """로그인한 사용자별 전체 요청 제한"""
+    scope = 'user'
+
+    def get_cache_key(self, request, view):
+        user = self.get_user(request)
+        if user is None:
+            return None
+        return f"throttle:{self.scope}:{user.pk}"
+
+
+class EndpointRateThrottle(TokenBucketThrottle):
+    """
+    엔드포인트 종류별 제한 (사용자 또는 IP 기준)
+
+    뷰의 get_throttle_scope(request)가 있으면 요청마다 범위를 정하고(예: 비용이 큰 QR 렌더링),
+    없으면 throttle_scope 속성을 사용한다. 범위가 없는 뷰는 제한하지 않는다.
+    """
+
+    def allow_request(self, request, view) -> bool:
+        get_scope = getattr(view, 'get_throttle_scope', None)
+        self.scope = get_scope(request) if get_scope else getattr(view, 'throttle_scope', None)
+        return super().allow_request(request, view)
+
+    def get_cache_key(self, request, view):
+        return f"throttle:{self.scope}:{self.get_user_or_ident(request)}"
+
+
+class APIKeyRateThrottle(TokenBucketThrottle):
+    """API 키별 제한 (키의 throttle_rate, 없으면 'api_key' 기본 요율)"""
+    scope = 'api_key'
+    applies_to_api_keys = True
+
+    def allow_request(self, request, view) -> bool:
+        self.api_key = get_api_key(request)
+        if self.api_key is None:
+            return True
+        return super().allow_request(request, view)
+
+    def get_rate(self, scope: str) -> Optional[str]:
+        return self.api_key.throttle_rate or super().get_rate(scope)
+
+    def get_cache_key(self, request, view):
+        return f"throttle:{self.scope}:{self.api_key.pk}"
+
+
+def get_api_key(request):
+    """API 키로 인증한 요청이면 키 (apps.accounts.models.APIKey), 아니면 None"""
+    auth = getattr(request, 'auth', None)
+    return auth if getattr(auth, 'is_api_key', False) else None
+
+
+def record_rate_limit(request, limit: RateLimit) -> None:
+    """남은 요청 수가 가장 적은 버킷 상태를 Django 요청 객체에 기록 (DRF Request면 내부 요청에)"""
+    django_request = getattr(request, '_request', request)
+    current = getattr(django_request, RATE_LIMIT_ATTR, None)
+    if current is None or limit.remaining < current.remaining:
+        setattr(django_request, RATE_LIMIT_ATTR, limit)
+
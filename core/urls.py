@@ -7,6 +7,8 @@ from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 from django.conf.urls.static import static
 
+from core.views import health_check
+
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -23,12 +25,14 @@ schema_view = get_schema_view(
 urlpatterns = [
     path("", include("apps.home.urls", namespace="home")),
     path("pius_hwang/", admin.site.urls),
+    path("healthz", health_check, name="healthz"),
     
     # API v1 엔드포인트
     path('api/v1/', include([
         path('qr/', include('apps.qr.urls', namespace='qr')),
         path('auth/', include('apps.accounts.urls', namespace='accounts')),
         path('seavoyage/', include('apps.seavoyage.urls', namespace='seavoyage')),
+        path('usage/', include('apps.usage.urls', namespace='usage')),
     ])),
 
     # API Documentation
@@ -0,0 +1,8 @@
+from django.http import JsonResponse
+
+from core.middleware import get_admission_controller
+
+
+def health_check(request):
+    """헬스 체크 (부하 제어 대상이 아니므로 과부하 중에도 바로 응답). 이 프로세스의 부하 제어 상태를 함께 반환"""
+    return JsonResponse({'status': 'ok', 'admission': get_admission_controller().stats()})
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 
 application = get_wsgi_application()
+
+# 렌더 풀을 웹 워커 시작 시 미리 띄워 첫 요청부터 워밍업된 워커를 사용 (QR_RENDER_POOL_WORKERS가 0이면 아무것도 하지 않음)
+from apps.qr.utils.pool import get_render_pool  # noqa: E402
+
+get_render_pool()
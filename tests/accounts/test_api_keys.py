@@ -0,0 +1,112 @@
+# tests/accounts/test_api_keys.py
+import pytest
+from django.core.exceptions import ValidationError
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework.exceptions import AuthenticationFailed
+
+from apps.accounts.api_keys import VERSION_CACHE_KEY, get_shared_cache, reset_api_key_cache
+from apps.accounts.authentication import APIKeyAuthentication
+from apps.accounts.models import APIKey, User
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def api_key_settings(settings):
+    settings.API_KEY_CACHE_SYNC_INTERVAL = 0
+    reset_api_key_cache()
+    yield settings
+    reset_api_key_cache()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create_user(username='partner', email='partner@example.com', password='password', is_active=True)
+
+
+def authenticate(raw_key):
+    request = RequestFactory().get('/', HTTP_AUTHORIZATION=f'Api-Key {raw_key}')
+    return APIKeyAuthentication().authenticate(request)
+
+
+def test_key_is_stored_hashed_and_cached_after_first_use(api_key_settings, user, django_assert_num_queries):
+    api_key, raw_key = APIKey.objects.create_key(user, 'partner')
+
+    assert raw_key.startswith(api_key.prefix + '.')
+    assert raw_key not in api_key.hashed_key
+    with django_assert_num_queries(1):
+        assert authenticate(raw_key) == (user, api_key)
+    with django_assert_num_queries(0):
+        assert authenticate(raw_key)[1].pk == api_key.pk
+
+
+def test_unknown_key_is_rejected_and_cached(api_key_settings, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        with pytest.raises(AuthenticationFailed):
+            authenticate('missing.key')
+    with django_assert_num_queries(0):
+        with pytest.raises(AuthenticationFailed):
+            authenticate('missing.key')
+
+
+def test_revocation_invalidates_cached_key(api_key_settings, user):
+    api_key, raw_key = APIKey.objects.create_key(user, 'partner')
+    authenticate(raw_key)
+
+    APIKey.objects.filter(pk=api_key.pk).revoke()
+
+    with pytest.raises(AuthenticationFailed):
+        authenticate(raw_key)
+
+
+def test_revocation_in_another_process_clears_local_cache(api_key_settings, user):
+    api_key, raw_key = APIKey.objects.create_key(user, 'partner')
+    authenticate(raw_key)
+
+    # 다른 프로세스에서 폐기: DB 갱신 후 공유 버전만 증가 (이 프로세스의 시그널은 실행되지 않음)
+    APIKey.objects.filter(pk=api_key.pk).update(is_active=False)
+    shared = get_shared_cache()
+    shared.add(VERSION_CACHE_KEY, 0, timeout=None)
+    shared.incr(VERSION_CACHE_KEY)
+
+    with pytest.raises(AuthenticationFailed):
+        authenticate(raw_key)
+
+
+def test_deactivated_user_keys_are_rejected(api_key_settings, user):
+    _, raw_key = APIKey.objects.create_key(user, 'partner')
+    authenticate(raw_key)
+
+    user.is_active = False
+    user.save()
+
+    with pytest.raises(AuthenticationFailed):
+        authenticate(raw_key)
+
+
+@pytest.mark.parametrize('rate', ['abc', '10/', '0/min', '10/week', '5000/s'])
+def test_invalid_throttle_rate_is_rejected(user, rate):
+    with pytest.raises(ValidationError):
+        APIKey.objects.create_key(user, 'partner', throttle_rate=rate)
+
+
+def test_key_scopes_limit_endpoints(client, api_key_settings, user):
+    _, raw_key = APIKey.objects.create_key(user, 'routes only', scopes=['seavoyage'])
+    client.credentials(HTTP_X_API_KEY=raw_key)
+
+    response = client.post(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com'}, format='json')
+
+    assert response.status_code == 403
+
+
+def test_key_rate_limit_replaces_default_limits(client, api_key_settings, user):
+    _, raw_key = APIKey.objects.create_key(user, 'partner', throttle_rate='2/min')
+    client.credentials(HTTP_AUTHORIZATION=f'Api-Key {raw_key}')
+    url = reverse('qr:qr_url_v1')
+
+    responses = [client.post(url, {'url': 'https://www.example.com'}, format='json') for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [200, 200, 429]
+    assert responses[0]['X-RateLimit-Limit'] == '2'
@@ -2,6 +2,33 @@ import pytest
 from rest_framework.test import APIClient
 from django.contrib.staticfiles.testing import StaticLiveServerTestCase
 
+from apps.qr.utils.cache import get_render_cache
+from apps.qr.utils.matrix import get_matrix_cache
+from apps.usage.meter import reset_usage_meter
+from core.throttling import get_throttle_cache
+
+@pytest.fixture(autouse=True)
+def clear_throttle_cache():
+    # 요청 제한 카운터가 테스트 사이에 이어지지 않도록 초기화
+    get_throttle_cache().clear()
+
+@pytest.fixture(autouse=True)
+def usage_meter(settings):
+    # 사용량은 테스트에서 직접 flush (백그라운드 flush 스레드 없이), 테스트 사이에 이어지지 않도록 초기화
+    settings.USAGE_FLUSH_INTERVAL = 0
+    reset_usage_meter()
+    yield
+    reset_usage_meter()
+
+@pytest.fixture(autouse=True)
+def clear_qr_caches():
+    # QR 모듈 행렬/렌더링 결과 캐시가 테스트 사이에 이어지지 않도록 초기화
+    get_matrix_cache().clear()
+    get_render_cache().clear()
+    yield
+    get_matrix_cache().clear()
+    get_render_cache().clear()
+
 @pytest.fixture
 def client():
     return APIClient()
@@ -0,0 +1,126 @@
+# tests/core/test_admission.py
+import threading
+import time
+
+import pytest
+from django.urls import reverse
+
+from apps.accounts.models import User
+from apps.qr.utils.batch import shutdown_batch_executor
+from core.middleware import (
+    AdmissionController,
+    HostSlots,
+    get_admission_controller,
+    parse_request_start,
+    reset_admission_controller,
+)
+
+
+@pytest.fixture
+def admission(settings, tmp_path):
+    settings.ADMISSION_HOST_SLOTS_DIR = str(tmp_path)
+    reset_admission_controller()
+    yield settings
+    reset_admission_controller()
+    shutdown_batch_executor()
+
+
+def test_controller_rejects_when_full_and_queue_is_empty():
+    controller = AdmissionController(max_in_flight=1, max_queue=0, max_queue_wait=1)
+
+    admitted, slot = controller.acquire()
+
+    assert admitted
+    assert controller.acquire() == (False, None)
+    controller.release(slot)
+    assert controller.acquire()[0]
+    assert controller.stats()['rejected'] == 1
+
+
+def test_queued_request_is_admitted_when_slot_is_released():
+    controller = AdmissionController(max_in_flight=1, max_queue=1, max_queue_wait=2)
+    _, slot = controller.acquire()
+    threading.Timer(0.05, controller.release, args=(slot,)).start()
+
+    started = time.monotonic()
+    admitted, _ = controller.acquire()
+
+    assert admitted
+    assert time.monotonic() - started < 1
+    assert controller.stats()['queued'] == 1
+
+
+def test_host_slots_are_shared_between_processes(tmp_path):
+    # 같은 파일을 따로 연 두 인스턴스는 서로 다른 프로세스처럼 잠금이 충돌한다
+    first, second = HostSlots(str(tmp_path), 1), HostSlots(str(tmp_path), 1)
+
+    slot = first.try_acquire()
+
+    assert slot == 0
+    assert second.try_acquire() is None
+    first.release(slot)
+    assert second.try_acquire() == 0
+
+
+def test_parse_request_start_units():
+    assert parse_request_start('t=1700000000.5') == 1700000000.5
+    assert parse_request_start('1700000000500') == 1700000000.5
+    assert parse_request_start('t=1700000000500000') == 1700000000.5
+    assert parse_request_start('garbage') is None
+
+
+@pytest.mark.django_db
+def test_overloaded_render_endpoint_returns_503_but_health_check_passes(client, admission):
+    admission.ADMISSION_MAX_IN_FLIGHT = 0
+    admission.ADMISSION_MAX_QUEUE_WAIT = 0
+
+    shed = client.post(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com'}, format='json')
+    health = client.get(reverse('healthz'))
+    staff = User.objects.create_user(username='staff', email='staff@example.com', password='password', is_active=True, is_staff=True)
+    client.force_authenticate(staff)
+    pool = client.get(reverse('qr:qr_render_pool_v1'))
+
+    assert shed.status_code == 503
+    assert shed['Retry-After'] == '1'
+    assert shed.json()['error_code'] == 'SERVER_BUSY'
+    assert health.status_code == 200
+    assert health.json()['admission']['rejected'] == 1
+    assert pool.status_code == 200
+
+
+def test_shed_response_carries_cors_headers(client, admission):
+    admission.ADMISSION_MAX_IN_FLIGHT = 0
+    admission.ADMISSION_MAX_QUEUE_WAIT = 0
+
+    shed = client.post(
+        reverse('qr:qr_url_v1'), {'url': 'https://www.example.com'}, format='json',
+        HTTP_ORIGIN='https://qrcode.piusdev.com',
+    )
+
+    assert shed.status_code == 503
+    assert shed['Access-Control-Allow-Origin'] == 'https://qrcode.piusdev.com'
+    assert 'Retry-After' in shed['Access-Control-Expose-Headers']
+
+
+def test_request_that_waited_too_long_upstream_is_shed(client, admission):
+    admission.ADMISSION_MAX_REQUEST_AGE = 5
+    stale = f"t={time.time() - 30:.3f}"
+
+    response = client.post(
+        reverse('qr:qr_url_v1'), {'url': 'https://www.example.com'}, format='json', HTTP_X_REQUEST_START=stale
+    )
+    fresh = client.post(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com'}, format='json')
+
+    assert response.status_code == 503
+    assert fresh.status_code == 200
+
+
+@pytest.mark.django_db
+def test_streaming_response_holds_slot_until_closed(client, admission):
+    admission.QR_BATCH_WORKERS = 0
+    response = client.post(reverse('qr:qr_batch_v1'), [{'type': 'text', 'text': 'label'}], format='json')
+
+    assert get_admission_controller().stats()['in_flight'] == 1
+    b''.join(response.streaming_content)
+    response.close()
+    assert get_admission_controller().stats()['in_flight'] == 0
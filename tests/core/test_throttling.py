@@ -0,0 +1,62 @@
+# tests/core/test_throttling.py
+import pytest
+from django.urls import reverse
+
+from core.throttling import consume_token, get_throttle_cache, parse_rate
+
+
+@pytest.fixture
+def throttle_rates(settings):
+    settings.REST_FRAMEWORK = {
+        'DEFAULT_THROTTLE_CLASSES': settings.REST_FRAMEWORK['DEFAULT_THROTTLE_CLASSES'],
+        'DEFAULT_THROTTLE_RATES': {
+            'ip': '100/min',
+            'user': '100/min',
+            'qr': '2/min',
+            'qr_heavy': '1/min',
+            'qr_batch': '1/min',
+            'seavoyage': '1/min',
+        },
+    }
+    return settings
+
+
+def test_parse_rate():
+    assert parse_rate('120/min') == (120, 500)
+    assert parse_rate('10/s') == (10, 100)
+    assert parse_rate(None) is None
+
+
+def test_bucket_allows_burst_then_refills():
+    cache = get_throttle_cache()
+    results = [consume_token(cache, 'test', capacity=3, interval=1000, now=0) for _ in range(4)]
+
+    assert [allowed for allowed, _, _ in results] == [True, True, True, False]
+    assert [limit.remaining for _, limit, _ in results] == [2, 1, 0, 0]
+    assert results[-1][2] == 1.0
+
+    # 거절된 요청은 토큰을 사용하지 않으므로 1초 뒤 하나가 보충됨
+    allowed, limit, _ = consume_token(cache, 'test', capacity=3, interval=1000, now=1000)
+    assert allowed and limit.remaining == 0
+    allowed, limit, _ = consume_token(cache, 'test', capacity=3, interval=1000, now=10000)
+    assert allowed and limit.remaining == 2
+
+
+def test_qr_endpoint_is_throttled_with_quota_headers(client, throttle_rates):
+    url = reverse('qr:qr_url_v1')
+    responses = [client.post(url, {'url': 'https://www.example.com'}, format='json') for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [200, 200, 429]
+    assert responses[0]['X-RateLimit-Limit'] == '2'
+    assert responses[0]['X-RateLimit-Remaining'] == '1'
+    assert responses[1]['X-RateLimit-Remaining'] == '0'
+    assert int(responses[2]['Retry-After']) > 0
+
+
+def test_heavy_renders_use_separate_bucket(client, throttle_rates):
+    url = reverse('qr:qr_url_v1')
+    heavy = {'url': 'https://www.example.com', 'style': 'CIRCLE_MODULE', 'color_mask': 'RADIAL_GRADIANT', 'size': 1000}
+
+    assert client.post(url, heavy, format='json').status_code == 200
+    assert client.post(url, heavy, format='json').status_code == 429
+    assert client.post(url, {'url': 'https://www.example.com'}, format='json').status_code == 200
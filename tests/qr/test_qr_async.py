@@ -0,0 +1,60 @@
+# tests/qr/test_qr_async.py
+import json
+
+from asgiref.sync import async_to_sync
+from django.test import AsyncRequestFactory
+
+from apps.qr.constants.error_codes import QRErrorCodes
+from apps.qr.utils.qr_utils import generate_url_qr
+from apps.qr.views import AsyncQrView, QrUrlView, qr_view
+
+
+factory = AsyncRequestFactory()
+async_url_view = AsyncQrView.as_view(view_class=QrUrlView)
+
+
+def _call(request):
+    response = async_to_sync(async_url_view)(request)
+    if hasattr(response, 'render'):
+        response.render()
+    return response
+
+
+def test_async_view_renders_same_bytes_as_sync_view():
+    request = factory.post(
+        '/api/v1/qr/url', json.dumps({'url': 'https://www.example.com'}), content_type='application/json'
+    )
+    response = _call(request)
+
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'image/png'
+    assert response.content == generate_url_qr(url='https://www.example.com')
+
+
+def test_async_view_validates_request():
+    request = factory.post('/api/v1/qr/url', json.dumps({}), content_type='application/json')
+    response = _call(request)
+
+    assert response.status_code == 400
+    assert response.data['error_code'] == QRErrorCodes.INVALID_PARAMETERS
+
+
+def test_async_get_returns_304_for_matching_etag():
+    first = _call(factory.get('/api/v1/qr/url', {'url': 'https://www.example.com'}))
+    second = _call(factory.get(
+        '/api/v1/qr/url', {'url': 'https://www.example.com'}, headers={'if-none-match': first['ETag']}
+    ))
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+
+
+def test_qr_view_switches_on_async_setting(settings):
+    settings.ASYNC_VIEWS = False
+    assert qr_view(QrUrlView).cls is QrUrlView
+    assert qr_view(QrUrlView).view_class is QrUrlView
+
+    settings.ASYNC_VIEWS = True
+    view = qr_view(QrUrlView)
+    assert view.view_class is AsyncQrView
+    assert view.cls is QrUrlView
@@ -0,0 +1,104 @@
+# tests/qr/test_qr_batch.py
+import io
+import json
+import zipfile
+
+import pytest
+from django.urls import reverse
+
+from apps.qr.constants.enums import QROutputFormats
+from apps.qr.constants.error_codes import QRErrorCodes
+from apps.qr.utils.batch import BatchItem, make_batch_executor, shutdown_batch_executor, stream_batch_zip
+from apps.qr.utils.qr_utils import generate_text_qr, generate_url_qr
+
+
+@pytest.fixture(autouse=True)
+def inline_batch(settings):
+    settings.QR_BATCH_WORKERS = 0
+    shutdown_batch_executor()
+    yield
+    shutdown_batch_executor()
+
+
+def _post_batch(client, items):
+    return client.post(reverse('qr:qr_batch_v1'), items, format='json')
+
+
+def _read_zip(response):
+    return zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+
+
+def test_batch_streams_zip_in_request_order(client):
+    response = _post_batch(client, [
+        {'type': 'url', 'url': 'https://www.example.com'},
+        {'type': 'wifi', 'ssid': 'home', 'password': 'secret', 'format': 'svg'},
+        {'type': 'text', 'text': 'hello', 'format': 'webp'},
+    ])
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert response['Content-Type'] == 'application/zip'
+
+    archive = _read_zip(response)
+    assert archive.namelist() == ['00001-url.png', '00002-wifi.svg', '00003-text.webp', 'manifest.json']
+    assert archive.read('00001-url.png').startswith(b'\x89PNG')
+    assert b'<svg' in archive.read('00002-wifi.svg')
+
+    manifest = json.loads(archive.read('manifest.json'))
+    assert [entry['filename'] for entry in manifest['items']] == archive.namelist()[:3]
+
+
+def test_batch_validates_every_item_before_rendering(client):
+    response = _post_batch(client, [
+        {'type': 'url', 'url': 'https://www.example.com'},
+        {'type': 'url'},
+        {'type': 'unknown'},
+    ])
+
+    assert response.status_code == 400
+    detail = response.json()['detail']
+    assert set(detail) == {'1', '2'}
+    assert 'url' in detail['1']
+    assert 'type' in detail['2']
+
+
+def test_batch_rejects_non_list_and_oversized_bodies(client, settings):
+    settings.QR_BATCH_MAX_ITEMS = 2
+
+    assert _post_batch(client, {'type': 'url'}).status_code == 400
+
+    response = _post_batch(client, [{'type': 'text', 'text': str(i)} for i in range(3)])
+    assert response.status_code == 400
+    assert response.json()['error_code'] == QRErrorCodes.BATCH_TOO_LARGE
+
+
+def test_batch_records_failed_items_in_manifest(client, settings):
+    settings.QR_PIXEL_BUDGET_POLICY = 'reject'
+    settings.QR_MAX_IMAGE_PIXELS = 100
+
+    response = _post_batch(client, [
+        {'type': 'text', 'text': 'ok', 'size': 50},
+        {'type': 'text', 'text': 'too large', 'size': 1000},
+    ])
+
+    archive = _read_zip(response)
+    manifest = json.loads(archive.read('manifest.json'))['items']
+    assert 'filename' in manifest[0]
+    assert 'error' in manifest[1]
+    assert archive.namelist() == ['00001-text.png', 'manifest.json']
+
+
+def test_stream_batch_zip_on_process_pool():
+    items = [
+        BatchItem(i, 'text', generate_text_qr, {'text': f'label-{i}'}, QROutputFormats.PNG)
+        for i in range(6)
+    ] + [BatchItem(6, 'url', generate_url_qr, {'url': 'https://www.example.com'}, QROutputFormats.PNG)]
+
+    with make_batch_executor(2) as executor:
+        assert executor._mp_context.get_start_method() == 'forkserver'
+        chunks = list(stream_batch_zip(items, executor=executor, window=2))
+
+    archive = zipfile.ZipFile(io.BytesIO(b''.join(chunks)))
+    assert len(chunks) == len(items) + 1
+    assert archive.namelist()[-2:] == ['00007-url.png', 'manifest.json']
+    assert archive.read('00001-text.png') == generate_text_qr(text='label-0')
@@ -0,0 +1,70 @@
+# tests/qr/test_qr_bulk.py
+import io
+import json
+import zipfile
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.qr.utils.qr_utils import generate_url_qr
+
+
+def _bulk(*args):
+    out = io.StringIO()
+    call_command('generate_qr_bulk', *[str(arg) for arg in args], '--workers', '0', stdout=out)
+    return out.getvalue()
+
+
+def test_bulk_renders_csv_into_directory(tmp_path):
+    source = tmp_path / 'labels.csv'
+    source.write_text("url,style\nhttps://www.example.com/1,CIRCLE_MODULE\nhttps://www.example.com/2,\n")
+    output = tmp_path / 'out'
+
+    message = _bulk(source, output, '--type', 'url')
+
+    assert 'codes/sec' in message
+    assert sorted(p.name for p in output.iterdir()) == ['00001-url.png', '00002-url.png', 'manifest.json']
+    assert (output / '00002-url.png').read_bytes() == generate_url_qr(url='https://www.example.com/2')
+
+
+def test_bulk_dedupes_identical_rows_into_zip(tmp_path):
+    source = tmp_path / 'items.jsonl'
+    row = json.dumps({'type': 'text', 'text': 'same'})
+    source.write_text('\n'.join([row, row, json.dumps({'type': 'text', 'text': 'other'}), '{"type": "url"}']))
+    output = tmp_path / 'out.zip'
+
+    _bulk(source, output, '--dedupe', '--option', 'format=svg')
+
+    archive = zipfile.ZipFile(output)
+    svgs = [name for name in archive.namelist() if name.endswith('.svg')]
+    manifest = json.loads(archive.read('manifest.json'))
+    assert len(svgs) == 2
+    assert manifest['duplicates'] == 1
+    assert manifest['failed'] == 1
+    assert manifest['items'][0]['filename'] == manifest['items'][1]['filename']
+
+
+def test_bulk_resume_skips_existing_outputs(tmp_path):
+    source = tmp_path / 'labels.csv'
+    source.write_text("text\na\nb\nc\n")
+    output = tmp_path / 'out'
+    output.mkdir()
+    (output / '00002-text.png').write_bytes(b'kept')
+
+    _bulk(source, output, '--type', 'text', '--resume')
+
+    manifest = json.loads((output / 'manifest.json').read_text())
+    assert manifest['rendered'] == 2
+    assert manifest['skipped'] == 1
+    assert (output / '00002-text.png').read_bytes() == b'kept'
+
+
+def test_bulk_refuses_to_overwrite_zip_without_resume(tmp_path):
+    source = tmp_path / 'labels.csv'
+    source.write_text("text\na\n")
+    output = tmp_path / 'out.zip'
+    output.write_bytes(b'')
+
+    with pytest.raises(CommandError):
+        _bulk(source, output, '--type', 'text')
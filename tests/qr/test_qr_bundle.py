@@ -0,0 +1,70 @@
+# tests/qr/test_qr_bundle.py
+import zipfile
+from email import message_from_bytes
+from io import BytesIO
+
+import pytest
+from django.urls import reverse
+from PIL import Image
+
+from apps.qr.constants.enums import QROutputFormats
+from apps.qr.utils.bundle import build_multipart, build_zip, render_variants
+from apps.qr.utils.matrix import get_matrix_cache
+from apps.qr.utils.qr_utils import create_qr_code
+
+
+def _render(size, output_format):
+    return create_qr_code('bundle', size=size, output_format=output_format)
+
+
+def test_variants_share_a_single_encode():
+    variants = render_variants(_render, [58, 116, 116, 290], [QROutputFormats.PNG])
+
+    assert [variant.size for variant in variants] == [58, 116, 290]
+    assert get_matrix_cache().stats()['misses'] == 1
+    sizes = [Image.open(BytesIO(variant.content)).size[0] for variant in variants]
+    assert sizes == [58, 116, 290]
+
+
+def test_zip_contains_every_variant():
+    variants = render_variants(_render, [58, 116], ['png', 'svg'])
+    archive = zipfile.ZipFile(BytesIO(build_zip(variants)))
+
+    assert archive.namelist() == ['qr-code-58.png', 'qr-code-58.svg', 'qr-code-116.png', 'qr-code-116.svg']
+    assert archive.read('qr-code-116.png') == variants[2].content
+
+
+def test_multipart_parts_round_trip():
+    variants = render_variants(_render, [58, 116], [QROutputFormats.PNG])
+    body, content_type = build_multipart(variants, boundary='qr-boundary')
+    message = message_from_bytes(f'Content-Type: {content_type}\r\n\r\n'.encode() + body)
+
+    parts = message.get_payload()
+    assert [part.get_content_type() for part in parts] == ['image/png', 'image/png']
+    assert parts[1].get_payload(decode=True) == variants[1].content
+
+
+@pytest.mark.django_db
+class TestBundleEndpoint:
+    def test_sizes_returns_zip(self, client):
+        response = client.post(reverse('qr:qr_text_v1'), data={'text': 'bundle', 'sizes': [64, 256]})
+
+        assert response.status_code == 200
+        assert response.get('Content-Type') == 'application/zip'
+        assert len(zipfile.ZipFile(BytesIO(response.content)).namelist()) == 2
+
+    def test_sizes_returns_multipart_when_accepted(self, client):
+        response = client.post(
+            reverse('qr:qr_text_v1'),
+            data={'text': 'bundle', 'sizes': [64, 256], 'formats': ['png', 'webp']},
+            HTTP_ACCEPT='multipart/mixed',
+        )
+
+        assert response.status_code == 200
+        assert response.get('Content-Type').startswith('multipart/mixed; boundary=')
+        assert response.content.count(b'Content-Type: image/webp') == 2
+
+    def test_too_many_sizes_is_rejected(self, client):
+        response = client.post(reverse('qr:qr_text_v1'), data={'text': 'bundle', 'sizes': list(range(64, 74))})
+        assert response.status_code == 400
+        assert 'sizes' in response.json()['detail']
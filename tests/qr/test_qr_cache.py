@@ -0,0 +1,75 @@
+# tests/qr/test_qr_cache.py
+import pytest
+from PIL import Image
+
+from apps.qr.constants.enums import QRColorMasks, QRStyles
+from apps.qr.utils.cache import LRUByteCache, get_render_cache, image_digest, make_render_key
+from apps.qr.utils.qr_utils import create_qr_code
+
+
+class TestLRUByteCache:
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = LRUByteCache(max_bytes=10)
+        cache.set('a', b'xxxx')
+        cache.set('b', b'yyyy')
+        cache.get('a')  # a를 최근 사용으로 갱신
+        cache.set('c', b'zzzz')
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+        assert cache.stats()['bytes'] == 8
+        assert cache.stats()['evictions'] == 1
+
+    def test_skips_items_larger_than_limit(self):
+        cache = LRUByteCache(max_bytes=100, max_item_bytes=4)
+        assert cache.set('big', b'12345') is False
+        assert 'big' not in cache
+
+    def test_hit_miss_counters(self):
+        cache = LRUByteCache(max_bytes=100)
+        cache.set('a', b'1')
+        cache.get('a')
+        cache.get('missing')
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+
+
+class TestRenderKey:
+    def test_key_is_order_independent_and_normalizes_enums(self):
+        key1 = make_render_key(data='x', style=QRStyles.SQUARE_MODULE, fill_color=(0, 0, 0))
+        key2 = make_render_key(fill_color=[0, 0, 0], style='SQUARE_MODULE', data='x')
+        assert key1 == key2
+
+    def test_key_changes_with_input(self):
+        assert make_render_key(data='x') != make_render_key(data='y')
+
+    def test_image_digest_depends_on_content(self):
+        red = Image.new('RGB', (4, 4), 'red')
+        blue = Image.new('RGB', (4, 4), 'blue')
+        assert image_digest(red) == image_digest(red.copy())
+        assert image_digest(red) != image_digest(blue)
+        assert image_digest(None) is None
+
+
+class TestCreateQrCodeCache:
+    def test_repeated_render_is_served_from_cache(self):
+        first = create_qr_code('https://www.example.com')
+        second = create_qr_code('https://www.example.com')
+
+        assert first == second
+        stats = get_render_cache().stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+
+    def test_equivalent_colors_share_cache_entry(self):
+        create_qr_code('hello', fill_color='red', back_color='white')
+        create_qr_code('hello', fill_color='#FF0000', back_color='#FFFFFF')
+        assert get_render_cache().stats()['hits'] == 1
+
+    def test_style_change_misses_cache(self):
+        create_qr_code('hello', style=QRStyles.SQUARE_MODULE)
+        create_qr_code('hello', style=QRStyles.CIRCLE_MODULE)
+        create_qr_code('hello', color_mask=QRColorMasks.RADIAL_GRADIANT)
+        assert get_render_cache().stats()['hits'] == 0
@@ -0,0 +1,62 @@
+# tests/qr/test_qr_colormasks.py
+import numpy as np
+import pytest
+from qrcode.image.styledpil import StyledPilImage
+from qrcode.image.styles import colormasks as qrcode_colormasks
+from qrcode.image.styles.moduledrawers.pil import CircleModuleDrawer, SquareModuleDrawer
+
+from apps.qr.utils import colormasks
+from apps.qr.utils.colormasks import get_gradient_layer_cache
+from apps.qr.utils.matrix import encode_qr_matrix
+from apps.qr.utils.renderers import render_square_image
+
+
+MASK_CASES = [
+    ('RadialGradiantColorMask', {'back_color': (255, 255, 255), 'center_color': (255, 0, 0), 'edge_color': (255, 255, 255)}),
+    ('SquareGradiantColorMask', {'back_color': (250, 250, 250), 'center_color': (0, 0, 255), 'edge_color': (250, 250, 250)}),
+    ('HorizontalGradiantColorMask', {'back_color': (255, 255, 255), 'left_color': (0, 128, 0), 'right_color': (255, 255, 255)}),
+    ('VerticalGradiantColorMask', {'back_color': (255, 255, 255), 'bottom_color': (20, 40, 60), 'top_color': (255, 255, 255)}),
+]
+
+
+def _render(mask, drawer):
+    qr = encode_qr_matrix('https://www.example.com').to_qrcode(box_size=4, border=2)
+    img = qr.make_image(image_factory=StyledPilImage, module_drawer=drawer, color_mask=mask)
+    return np.asarray(img.get_image())
+
+
+@pytest.mark.parametrize('drawer_class', [SquareModuleDrawer, CircleModuleDrawer])
+@pytest.mark.parametrize('mask_name,kwargs', MASK_CASES)
+def test_vectorized_mask_matches_qrcode(mask_name, kwargs, drawer_class):
+    """안티앨리어싱된 픽셀을 포함해 qrcode 구현과 픽셀 단위로 동일해야 함"""
+    expected = _render(getattr(qrcode_colormasks, mask_name)(**kwargs), drawer_class())
+    actual = _render(getattr(colormasks, mask_name)(**kwargs), drawer_class())
+    assert np.array_equal(actual, expected)
+
+
+@pytest.mark.parametrize('mask_name,kwargs', MASK_CASES)
+def test_square_renderer_composites_cached_layer(mask_name, kwargs):
+    """사각 모듈 렌더러의 레이어 합성 결과가 StyledPilImage 결과와 동일해야 함"""
+    get_gradient_layer_cache().clear()
+    matrix = encode_qr_matrix('https://www.example.com')
+    mask = getattr(colormasks, mask_name)(**kwargs)
+    expected = _render(getattr(qrcode_colormasks, mask_name)(**kwargs), SquareModuleDrawer())
+
+    actual = render_square_image(
+        matrix, box_size=4, border=2, back_color=kwargs['back_color'], gradient_mask=mask,
+    )
+    assert np.array_equal(np.asarray(actual), expected)
+
+    render_square_image(matrix, box_size=4, border=2, back_color=kwargs['back_color'], gradient_mask=mask)
+    stats = get_gradient_layer_cache().stats()
+    assert stats['misses'] == 1
+    assert stats['hits'] == 1
+
+
+def test_layer_cache_is_shared_across_payloads():
+    get_gradient_layer_cache().clear()
+    mask = colormasks.RadialGradiantColorMask(center_color=(255, 0, 0), edge_color=(255, 255, 255))
+    for data in ('first', 'second'):  # 버전이 같으면 픽셀 크기도 같음
+        matrix = encode_qr_matrix(data)
+        render_square_image(matrix, gradient_mask=mask)
+    assert get_gradient_layer_cache().stats()['hits'] == 1
@@ -0,0 +1,87 @@
+# tests/qr/test_qr_cost.py
+import pytest
+from django.urls import reverse
+
+from apps.qr.constants import QRColorMasks, QROutputFormats, QRStyles
+from apps.qr.constants.error_codes import QRErrorCodes
+from apps.qr.utils.cost import (
+    FAST_LANE,
+    SLOW_LANE,
+    RenderLane,
+    RenderLaneFull,
+    estimate_render_cost,
+    estimate_request_cost,
+    estimate_version,
+    get_render_lane,
+    reset_render_lanes,
+)
+from apps.qr.utils.matrix import encode_qr_matrix
+
+
+@pytest.fixture(autouse=True)
+def lanes():
+    reset_render_lanes()
+    yield
+    reset_render_lanes()
+
+
+@pytest.mark.parametrize('length', [1, 17, 100, 500, 2000])
+def test_estimated_version_is_not_smaller_than_actual(length):
+    actual = (encode_qr_matrix('a' * length).size - 17) // 4
+    assert estimate_version(length) >= actual
+
+
+def test_styled_gradient_and_large_renders_cost_more():
+    base = {'text': 'hello', 'output_format': QROutputFormats.PNG}
+    square = estimate_render_cost(base)
+    gradient = estimate_render_cost({**base, 'color_mask': QRColorMasks.RADIAL_GRADIANT})
+    styled = estimate_render_cost({**base, 'style': QRStyles.CIRCLE_MODULE})
+    heavy = estimate_render_cost({
+        **base, 'style': QRStyles.CIRCLE_MODULE, 'color_mask': QRColorMasks.RADIAL_GRADIANT, 'size': 2048,
+    })
+
+    assert square < styled < heavy
+    assert square < gradient < heavy
+    assert get_render_lane(square).name == FAST_LANE
+    assert get_render_lane(heavy).name == SLOW_LANE
+    assert estimate_render_cost({**base, 'output_format': QROutputFormats.MATRIX}) < square
+
+
+def test_bundle_cost_is_sum_of_variants():
+    params = {'text': 'hello', 'output_format': QROutputFormats.PNG}
+    single = estimate_render_cost({**params, 'size': 256})
+
+    assert estimate_request_cost(params, [256, 256], [QROutputFormats.PNG]) == single
+    assert estimate_request_cost(params, [256, 512], [QROutputFormats.PNG]) > single
+
+
+def test_full_lane_rejects_after_timeout():
+    lane = RenderLane(SLOW_LANE, concurrency=1, queue_timeout=0.01)
+    with lane.slot():
+        with pytest.raises(RenderLaneFull):
+            with lane.slot():
+                pass
+    with lane.slot():
+        pass
+
+
+def test_response_reports_cost_and_lane(client):
+    response = client.post(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com'}, format='json')
+
+    assert response.status_code == 200
+    assert response['X-QR-Render-Lane'] == FAST_LANE
+    assert int(response['X-QR-Render-Cost']) >= 0
+
+
+def test_slow_lane_full_returns_503_while_fast_lane_renders(client, settings):
+    settings.QR_SLOW_LANE_QUEUE_TIMEOUT = 0
+    heavy = {'url': 'https://www.example.com', 'style': 'CIRCLE_MODULE', 'color_mask': 'RADIAL_GRADIANT', 'size': 2048}
+    lane = get_render_lane(float('inf'))
+    with lane.slot():
+        shed = client.post(reverse('qr:qr_url_v1'), heavy, format='json')
+        fast = client.post(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com'}, format='json')
+
+    assert shed.status_code == 503
+    assert shed.json()['error_code'] == QRErrorCodes.RENDER_BUSY
+    assert shed['X-QR-Render-Lane'] == SLOW_LANE
+    assert fast.status_code == 200
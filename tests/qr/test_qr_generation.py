@@ -120,6 +120,27 @@ class QrTestBase:
             self.mock_qr_request['color_mask'] = mask
             response = client.post(url, data=self.mock_qr_request)
             self._validate_qr_response(response)
+
+    def test_qr_svg_format(self, client):
+        """format=svg 파라미터 테스트"""
+        url = reverse(self.view_name)
+        qr_request = self.mock_qr_request.copy()
+        qr_request['format'] = 'svg'
+
+        response = client.post(url, data=qr_request)
+
+        assert response.status_code == 200
+        assert response.get('Content-Type') == 'image/svg+xml'
+        assert response.content.startswith(b'<svg')
+
+    def test_qr_svg_accept_header(self, client):
+        """Accept 헤더로 SVG 요청 테스트"""
+        url = reverse(self.view_name)
+        response = client.post(url, data=self.mock_qr_request, HTTP_ACCEPT='image/svg+xml')
+
+        assert response.status_code == 200
+        assert response.get('Content-Type') == 'image/svg+xml'
+        assert 'Accept' in response.get('Vary')
             
 @pytest.mark.django_db
 class TestQRUrlEndpoint(QrTestBase):
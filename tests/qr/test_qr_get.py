@@ -0,0 +1,117 @@
+# tests/qr/test_qr_get.py
+import time
+
+import pytest
+from django.urls import reverse
+
+from apps.qr.constants.error_codes import QRErrorCodes
+from apps.qr.utils.signing import compute_signature, sign_url, verify_signature
+
+
+SIGNING_KEY = 'test-signing-key'
+
+
+def test_get_renders_with_cache_headers(client):
+    response = client.get(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com'})
+
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'image/png'
+    assert response['ETag'].startswith('"')
+    assert 'immutable' in response['Cache-Control']
+    assert 'public' in response['Cache-Control']
+    assert 'Accept' in response['Vary']
+
+
+def test_etag_ignores_query_order_and_depends_on_format(client):
+    url = reverse('qr:qr_url_v1')
+    first = client.get(f"{url}?url=https://www.example.com&style=CIRCLE_MODULE")
+    second = client.get(f"{url}?style=CIRCLE_MODULE&url=https://www.example.com")
+    svg = client.get(f"{url}?style=CIRCLE_MODULE&url=https://www.example.com&format=svg")
+
+    assert first['ETag'] == second['ETag']
+    assert first['ETag'] != svg['ETag']
+
+
+def test_if_none_match_returns_not_modified(client):
+    url = reverse('qr:qr_url_v1')
+    params = {'url': 'https://www.example.com'}
+    etag = client.get(url, params)['ETag']
+
+    response = client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response['ETag'] == etag
+    assert not response.content
+
+
+def test_get_validation_error(client):
+    response = client.get(reverse('qr:qr_url_v1'))
+
+    assert response.status_code == 400
+    assert 'ETag' not in response
+
+
+def test_get_invalid_format_is_bad_request(client):
+    response = client.get(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com', 'format': 'gif'})
+
+    assert response.status_code == 400
+    assert response.json()['error_code'] == QRErrorCodes.INVALID_PARAMETERS
+
+
+def test_get_ignores_unknown_params(client):
+    url = reverse('qr:qr_url_v1')
+    plain = client.get(url, {'url': 'https://www.example.com'})
+    tracked = client.get(url, {'url': 'https://www.example.com', 'utm_source': 'newsletter', '_': '123'})
+
+    assert tracked.status_code == 200
+    assert tracked['ETag'] == plain['ETag']
+    assert tracked.content == plain.content
+
+
+def test_unsigned_get_rejected_when_key_configured(client, settings):
+    settings.QR_URL_SIGNING_KEY = SIGNING_KEY
+
+    response = client.get(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com'})
+
+    assert response.status_code == 403
+    assert response.json()['error_code'] == QRErrorCodes.INVALID_SIGNATURE
+
+
+def test_signed_get_accepted(client, settings):
+    settings.QR_URL_SIGNING_KEY = SIGNING_KEY
+
+    response = client.get(sign_url(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com', 'size': 300}))
+
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'image/png'
+
+
+def test_expiring_signed_get_caps_max_age(client, settings):
+    settings.QR_URL_SIGNING_KEY = SIGNING_KEY
+
+    response = client.get(sign_url(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com'}, expires_in=600))
+    max_age = int(response['Cache-Control'].split('max-age=')[1].split(',')[0])
+
+    assert response.status_code == 200
+    assert 590 <= max_age <= 600
+    assert 'immutable' not in response['Cache-Control']
+
+
+def test_tampered_or_expired_signature_rejected(client, settings):
+    settings.QR_URL_SIGNING_KEY = SIGNING_KEY
+    path = reverse('qr:qr_url_v1')
+
+    tampered = sign_url(path, {'url': 'https://www.example.com'}).replace('example', 'attacker')
+    expired = sign_url(path, {'url': 'https://www.example.com'}, expires_in=-10)
+
+    assert client.get(tampered).status_code == 403
+    assert client.get(expired).status_code == 403
+
+
+def test_verify_signature_checks_expiry():
+    params = {'url': 'https://www.example.com', 'expires': str(int(time.time()) + 60)}
+    params['sig'] = compute_signature('/qr', params, key=SIGNING_KEY)
+
+    assert verify_signature('/qr', params, key=SIGNING_KEY)
+    assert not verify_signature('/qr', params, key=SIGNING_KEY, now=time.time() + 120)
+    assert not verify_signature('/other', params, key=SIGNING_KEY)
@@ -0,0 +1,148 @@
+# tests/qr/test_qr_jobs.py
+import io
+import json
+import zipfile
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+
+from apps.accounts.models import User
+from apps.qr import jobs
+from apps.qr.constants.error_codes import QRErrorCodes
+from apps.qr.models import QRJob
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def owner(client):
+    user = User.objects.create_user(username='owner', email='owner@example.com', password='password', is_active=True)
+    client.force_authenticate(user)
+    return user
+
+
+def _upload(client, name, content, **fields):
+    upload = SimpleUploadedFile(name, content.encode('utf-8'))
+    return client.post(reverse('qr:qr_job_create_v1'), {'file': upload, **fields}, format='multipart')
+
+
+def _run_worker():
+    call_command('qr_worker', '--once', '--workers', '0', stdout=io.StringIO())
+
+
+def test_csv_job_renders_all_rows(client):
+    rows = '\n'.join(f"https://www.example.com/{i}" for i in range(5))
+    response = _upload(client, 'labels.csv', f"url\n{rows}\n", type='url', chunk_size=2, format='svg')
+
+    assert response.status_code == 202
+    assert response.json()['status'] == QRJob.Status.PENDING
+    status_url = response['Location']
+
+    _run_worker()
+
+    status = client.get(status_url).json()
+    assert status['status'] == QRJob.Status.COMPLETED
+    assert status['total_items'] == 5
+    assert status['rendered_items'] == 5
+    assert status['progress'] == 1.0
+    assert status['chunks'] == {'total': 3, 'completed': 3, 'failed': 0}
+
+    download = client.get(status['download_url'])
+    archive = zipfile.ZipFile(io.BytesIO(b''.join(download.streaming_content)))
+    assert archive.namelist() == [f"{i:05d}-url.svg" for i in range(1, 6)] + ['manifest.json']
+
+
+def test_ndjson_job_reports_row_errors(client):
+    lines = [
+        json.dumps({'type': 'text', 'text': 'hello'}),
+        json.dumps({'type': 'wifi', 'ssid': 'home', 'password': 'secret'}),
+        json.dumps({'type': 'url'}),
+        'not json',
+    ]
+    response = _upload(client, 'items.ndjson', '\n'.join(lines))
+    _run_worker()
+
+    status = client.get(response['Location']).json()
+    assert status['status'] == QRJob.Status.COMPLETED
+    assert status['rendered_items'] == 2
+    assert status['failed_items'] == 2
+    assert [error['index'] for error in status['errors']] == [2, 3]
+
+
+def test_download_before_completion_is_conflict(client):
+    response = _upload(client, 'labels.csv', "url\nhttps://www.example.com\n", type='url')
+    job_id = response.json()['id']
+
+    download = client.get(reverse('qr:qr_job_download_v1', args=[job_id]))
+
+    assert download.status_code == 409
+    assert download.json()['error_code'] == QRErrorCodes.JOB_NOT_READY
+
+
+def test_failed_chunk_is_retried_without_redoing_completed_chunks(client, monkeypatch):
+    rows = '\n'.join(f"label-{i}" for i in range(4))
+    response = _upload(client, 'labels.csv', f"text\n{rows}\n", type='text', chunk_size=2)
+
+    original = jobs.write_chunk_archive
+    calls = []
+
+    def flaky_write(job, chunk, results):
+        calls.append(chunk.index)
+        if chunk.index == 1 and calls.count(1) == 1:
+            raise OSError("disk full")
+        return original(job, chunk, results)
+
+    monkeypatch.setattr(jobs, 'write_chunk_archive', flaky_write)
+    _run_worker()
+
+    job = QRJob.objects.get(pk=response.json()['id'])
+    assert job.status == QRJob.Status.COMPLETED
+    assert job.rendered_items == 4
+    assert calls == [0, 1, 1]
+    assert job.chunks.get(index=1).attempts == 2
+
+
+def test_claim_next_job_is_exclusive(client):
+    _upload(client, 'labels.csv', "url\nhttps://www.example.com\n", type='url')
+
+    assert jobs.claim_next_job('worker-a') is not None
+    assert jobs.claim_next_job('worker-b') is None
+
+
+def test_jobs_are_visible_only_to_their_owner(client, owner):
+    response = _upload(client, 'labels.csv', "url\nhttps://www.example.com\n", type='url')
+    job_id = response.json()['id']
+    assert QRJob.objects.get(pk=job_id).user == owner
+
+    other = User.objects.create_user(username='other', email='other@example.com', password='password', is_active=True)
+    client.force_authenticate(other)
+    assert client.get(reverse('qr:qr_job_detail_v1', args=[job_id])).status_code == 404
+    assert client.get(reverse('qr:qr_job_download_v1', args=[job_id])).status_code == 404
+
+    client.force_authenticate(None)
+    assert client.get(reverse('qr:qr_job_detail_v1', args=[job_id])).status_code in (401, 403)
+    assert _upload(client, 'labels.csv', "url\nhttps://www.example.com\n", type='url').status_code in (401, 403)
+
+
+def test_upload_size_and_row_count_are_limited(client, settings):
+    settings.QR_JOB_MAX_ITEMS = 2
+    rows = '\n'.join(f"https://www.example.com/{i}" for i in range(3))
+    too_many = _upload(client, 'labels.csv', f"url\n{rows}\n", type='url')
+
+    settings.QR_JOB_MAX_UPLOAD_SIZE = 10
+    too_large = _upload(client, 'labels.csv', "url\nhttps://www.example.com\n", type='url')
+
+    assert too_many.status_code == 400
+    assert too_many.json()['error_code'] == QRErrorCodes.BATCH_TOO_LARGE
+    assert too_large.status_code == 400
+    assert 'file' in too_large.json()['detail']
+    assert not QRJob.objects.exists()
@@ -0,0 +1,96 @@
+# tests/qr/test_qr_matrix.py
+import base64
+import json
+
+import pytest
+from django.urls import reverse
+from qrcode.constants import ERROR_CORRECT_H, ERROR_CORRECT_L
+from qrcode.main import QRCode
+
+from apps.qr.constants.enums import QROutputFormats, QRStyles
+from apps.qr.utils.cache import get_render_cache
+from apps.qr.utils.matrix import QRMatrix, encode_qr_matrix, get_matrix_cache, get_qr_matrix
+from apps.qr.utils.payloads import build_wifi_payload
+from apps.qr.utils.qr_utils import create_qr_code
+
+
+def _reference_modules(data, error_correction=ERROR_CORRECT_L, version=None):
+    qr = QRCode(version=version, error_correction=error_correction)
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr
+
+
+@pytest.mark.parametrize('data,error_correction,version', [
+    ('https://www.example.com', ERROR_CORRECT_L, None),
+    ('WIFI:T:WPA;S:home;P:secret;;', ERROR_CORRECT_L, 2),
+    ('x' * 500, ERROR_CORRECT_H, None),
+])
+def test_matrix_matches_qrcode_output(data, error_correction, version):
+    reference = _reference_modules(data, error_correction, version)
+    matrix = encode_qr_matrix(data, error_correction=error_correction, version=version)
+
+    assert matrix.version == reference.version
+    assert matrix.size == reference.modules_count
+    assert matrix.rows() == [[bool(m) for m in row] for row in reference.modules]
+    assert 0 <= matrix.mask_pattern <= 7
+
+
+def test_matrix_is_bit_packed():
+    matrix = encode_qr_matrix('hello')
+    assert matrix.size == 21
+    assert matrix.nbytes == 21 * 3
+    assert matrix.is_dark(0, 0)  # finder pattern 모서리
+
+
+def test_matrix_cache_reused_across_styles():
+    create_qr_code('https://www.example.com', style=QRStyles.SQUARE_MODULE)
+    create_qr_code('https://www.example.com', style=QRStyles.CIRCLE_MODULE)
+
+    stats = get_matrix_cache().stats()
+    assert stats['misses'] == 1
+    assert stats['hits'] == 1
+
+
+def test_get_qr_matrix_keyed_by_error_correction():
+    low = get_qr_matrix('hello', error_correction=ERROR_CORRECT_L)
+    high = get_qr_matrix('hello', error_correction=ERROR_CORRECT_H)
+    assert low is get_qr_matrix('hello', error_correction=ERROR_CORRECT_L)
+    assert low != high
+
+
+def test_matrix_binary_round_trip():
+    matrix = encode_qr_matrix('round trip', error_correction=ERROR_CORRECT_H)
+    data = matrix.to_bytes()
+
+    assert len(data) == 4 + matrix.nbytes
+    assert data[:4] == bytes((matrix.size, matrix.version, 3, matrix.mask_pattern))
+    assert QRMatrix.from_bytes(data) == matrix
+
+
+def test_matrix_dict_metadata():
+    matrix = encode_qr_matrix('json')
+    result = matrix.to_dict()
+
+    assert result['error_correction'] == 'L'
+    assert result['size'] == matrix.size
+    assert base64.b64decode(result['data']) == matrix.packed
+
+
+def test_create_qr_code_matrix_format_skips_rendering():
+    data = create_qr_code('matrix only', style=QRStyles.CIRCLE_MODULE, output_format=QROutputFormats.MATRIX)
+    assert QRMatrix.from_bytes(data) == get_qr_matrix('matrix only')
+    assert get_render_cache().stats()['misses'] == 0
+
+
+@pytest.mark.django_db
+def test_view_returns_matrix_json_for_wifi_payload(client):
+    response = client.post(
+        reverse('qr:qr_wifi_v1'),
+        data={'ssid': 'office', 'password': 'secret', 'encryption': 'WPA', 'format': 'matrix_json'},
+    )
+
+    assert response.status_code == 200
+    assert response.get('Content-Type') == 'application/json'
+    expected = get_qr_matrix(build_wifi_payload('office', password='secret', encryption='WPA'), version=2)
+    assert json.loads(response.content) == expected.to_dict()
@@ -0,0 +1,88 @@
+# tests/qr/test_qr_output.py
+from io import BytesIO
+
+import numpy as np
+import pytest
+from django.urls import reverse
+from PIL import Image
+
+from apps.qr.constants.enums import QRColorMasks, QREyeStyles, QROutputFormats, QRStyles
+from apps.qr.utils.output import png_save_options, to_indexed, write_image
+from apps.qr.utils.matrix import get_qr_matrix
+from apps.qr.utils.qr_utils import _render_styled_image, create_qr_code
+
+
+def _two_color_image():
+    image = Image.new('RGB', (40, 40), (250, 250, 250))
+    image.paste((200, 0, 0), (0, 0, 20, 20))
+    return image
+
+
+def test_to_indexed_keeps_pixels_and_shrinks_bit_depth():
+    image = _two_color_image()
+    indexed = to_indexed(image)
+
+    assert indexed.mode == 'P'
+    assert np.array_equal(np.asarray(indexed.convert('RGB')), np.asarray(image))
+    assert png_save_options(indexed)['bits'] == 1
+
+
+def test_to_indexed_leaves_many_color_images():
+    noise = np.random.default_rng(0).integers(0, 256, size=(40, 40, 3), dtype=np.uint8)
+    image = Image.fromarray(noise)
+    assert to_indexed(image) is image
+
+
+def test_styled_png_is_written_as_palette():
+    image = Image.open(BytesIO(create_qr_code('palette', style=QRStyles.CIRCLE_MODULE)))
+    assert image.mode == 'P'
+
+
+@pytest.mark.parametrize('color_mask, back_color', [
+    (QRColorMasks.SOLID_FILL, (255, 255, 255)),
+    (QRColorMasks.RADIAL_GRADIANT, (250, 250, 250)),
+])
+def test_styled_png_keeps_exact_pixels(color_mask, back_color):
+    image = _render_styled_image(
+        get_qr_matrix('palette'),
+        fill_rgb=(0, 0, 0),
+        back_rgb=back_color,
+        style=QRStyles.CIRCLE_MODULE,
+        color_mask=color_mask,
+        eye_style=QREyeStyles.SQUARE,
+        embeded_image=None,
+        embeded_image_ratio=0.25,
+        box_size=10,
+        border=4,
+    ).convert('RGB')
+    buffer = BytesIO()
+    write_image(image, buffer)
+
+    decoded = Image.open(BytesIO(buffer.getvalue()))
+    assert decoded.mode == 'P'
+    assert np.array_equal(np.asarray(decoded.convert('RGB')), np.asarray(image))
+
+
+def test_webp_is_lossless():
+    image = _two_color_image()
+    buffer = BytesIO()
+    write_image(image, buffer, QROutputFormats.WEBP)
+
+    decoded = Image.open(BytesIO(buffer.getvalue()))
+    assert decoded.format == 'WEBP'
+    assert np.array_equal(np.asarray(decoded.convert('RGB')), np.asarray(image))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('accept, content_type', [
+    ('image/webp', 'image/webp'),
+    ('image/webp;q=0.5, image/png', 'image/png'),
+    ('image/png, image/webp', 'image/png'),
+    ('*/*', 'image/png'),
+])
+def test_view_negotiates_raster_format(client, accept, content_type):
+    response = client.post(reverse('qr:qr_text_v1'), data={'text': 'negotiate'}, HTTP_ACCEPT=accept)
+
+    assert response.status_code == 200
+    assert response.get('Content-Type') == content_type
+    assert 'Accept' in response.get('Vary')
@@ -0,0 +1,94 @@
+# tests/qr/test_qr_pdf.py
+import re
+import zlib
+
+import numpy as np
+import pytest
+from django.urls import reverse
+
+from apps.qr.utils.batch import shutdown_batch_executor
+from apps.qr.utils.matrix import encode_qr_matrix
+from apps.qr.utils.pdf import LABEL_LAYOUTS, custom_layout, stream_label_sheet_pdf
+from apps.qr.utils.renderers import matrix_to_array
+
+
+@pytest.fixture(autouse=True)
+def inline_batch(settings):
+    settings.QR_BATCH_WORKERS = 0
+    shutdown_batch_executor()
+    yield
+    shutdown_batch_executor()
+
+
+def _content_streams(pdf: bytes):
+    return [
+        zlib.decompress(match.group(1))
+        for match in re.finditer(rb'stream\n(.*?)\nendstream', pdf, re.S)
+    ]
+
+
+def _assert_valid_xref(pdf: bytes):
+    startxref = int(pdf.rsplit(b'startxref\n', 1)[1].split(b'\n')[0])
+    assert pdf[startxref:].startswith(b'xref')
+    entries = re.findall(rb'(\d{10}) 00000 n', pdf[startxref:])
+    for number, offset in enumerate(entries, 1):
+        assert pdf[int(offset):].startswith(f"{number} 0 obj".encode())
+
+
+def test_sheet_pdf_paginates_and_has_valid_xref():
+    layout = LABEL_LAYOUTS['avery-5160']
+    matrices = [encode_qr_matrix(f"https://www.example.com/{i}") for i in range(31)]
+
+    chunks = list(stream_label_sheet_pdf(matrices, layout))
+    pdf = b''.join(chunks)
+
+    assert pdf.startswith(b'%PDF-1.4')
+    assert pdf.endswith(b'%%EOF\n')
+    assert b'/Count 2' in pdf
+    # 헤더 + 페이지 2개 + 마지막(Pages, Catalog, xref)
+    assert len(chunks) == 4
+    assert b'/Image' not in pdf
+    _assert_valid_xref(pdf)
+
+
+def test_sheet_pdf_draws_modules_as_vector_rects():
+    matrix = encode_qr_matrix('WIFI:T:WPA;S:home;P:secret;;')
+    pdf = b''.join(stream_label_sheet_pdf([matrix], LABEL_LAYOUTS['avery-l7160']))
+
+    content = _content_streams(pdf)[0].decode('ascii')
+    modules = np.zeros((matrix.size, matrix.size), dtype=bool)
+    for x, y, w, h in re.findall(r'^(\d+) (\d+) (\d+) (\d+) re$', content, re.M):
+        x, y, w, h = map(int, (x, y, w, h))
+        assert not modules[y:y + h, x:x + w].any()
+        modules[y:y + h, x:x + w] = True
+
+    assert (modules == matrix_to_array(matrix)).all()
+
+
+def test_custom_layout_must_fit_on_page():
+    assert custom_layout('a4', 2, 2, 50, 50).per_page == 4
+    with pytest.raises(ValueError):
+        custom_layout('a4', 5, 2, 50, 50)
+
+
+def test_sheet_view_streams_pdf(client):
+    items = [{'type': 'url', 'url': f'https://www.example.com/{i}'} for i in range(22)]
+    response = client.post(reverse('qr:qr_sheet_v1'), {'items': items, 'layout': 'avery-l7160'}, format='json')
+
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'application/pdf'
+    pdf = b''.join(response.streaming_content)
+    assert b'/Count 2' in pdf
+    _assert_valid_xref(pdf)
+
+
+def test_sheet_view_validates_layout_and_items(client):
+    url = reverse('qr:qr_sheet_v1')
+
+    missing_grid = client.post(url, {'items': [{'type': 'text', 'text': 'a'}]}, format='json')
+    bad_item = client.post(url, {'items': [{'type': 'url'}], 'layout': 'avery-5160'}, format='json')
+
+    assert missing_grid.status_code == 400
+    assert 'columns' in missing_grid.json()['detail']
+    assert bad_item.status_code == 400
+    assert '0' in bad_item.json()['detail']['items']
@@ -0,0 +1,143 @@
+# tests/qr/test_qr_pool.py
+import os
+import time
+
+import pytest
+from django.urls import reverse
+
+from apps.accounts.models import User
+from apps.qr.constants import QROutputFormats
+from apps.qr.constants.error_codes import QRErrorCodes
+from apps.qr.utils.pool import RenderPool, RenderPoolFull, RenderTimeout, shutdown_render_pool
+from apps.qr.utils.qr_utils import generate_url_qr
+from apps.qr.utils.sizing import PixelBudgetExceeded
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return os.getpid()
+
+
+def _raise_budget():
+    raise PixelBudgetExceeded(5000, 2048)
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def factory(**kwargs):
+        kwargs.setdefault('warm_up', False)
+        pool = RenderPool(**kwargs)
+        pools.append(pool)
+        return pool
+
+    yield factory
+    for pool in pools:
+        pool.shutdown()
+
+
+@pytest.fixture
+def render_pool_settings(settings):
+    settings.QR_RENDER_POOL_WORKERS = 1
+    shutdown_render_pool()
+    yield settings
+    shutdown_render_pool()
+
+
+def test_pool_renders_same_bytes_as_inline(make_pool):
+    pool = make_pool(workers=1)
+    kwargs = {'url': 'https://www.example.com', 'output_format': QROutputFormats.PNG}
+
+    assert pool._context.get_start_method() == 'forkserver'
+    assert pool.run(generate_url_qr, kwargs=kwargs) == generate_url_qr(**kwargs)
+    assert pool.stats()['completed'] == 1
+
+
+def test_worker_exceptions_are_reraised(make_pool):
+    pool = make_pool(workers=1)
+
+    with pytest.raises(PixelBudgetExceeded) as excinfo:
+        pool.run(_raise_budget)
+
+    assert excinfo.value.max_pixels == 2048
+
+
+def test_bounded_queue_rejects_when_full(make_pool):
+    pool = make_pool(workers=1, max_queue=1)
+    running = pool.submit(_sleep, (0.5,))
+    while pool.stats()['busy_workers'] == 0:
+        time.sleep(0.01)
+    queued = pool.submit(_sleep, (0,))
+
+    assert pool.stats()['queue_depth'] == 1
+    with pytest.raises(RenderPoolFull):
+        pool.submit(_sleep, (0,))
+    assert running.result(timeout=5) == queued.result(timeout=5)
+    assert pool.stats()['rejected'] == 1
+
+
+def test_timed_out_job_kills_and_replaces_worker(make_pool):
+    pool = make_pool(workers=1, timeout=0.3)
+    first_pid = pool.run(_sleep, (0,))
+
+    with pytest.raises(RenderTimeout):
+        pool.run(_sleep, (30,))
+
+    assert pool.run(_sleep, (0,)) != first_pid
+    assert pool.stats()['timeouts'] == 1
+
+
+def test_workers_are_recycled_after_max_jobs(make_pool):
+    pool = make_pool(workers=1, max_jobs_per_worker=2)
+
+    pids = [pool.run(_sleep, (0,)) for _ in range(4)]
+
+    assert pids[0] == pids[1] != pids[2] == pids[3]
+    assert pool.stats()['recycled'] >= 1
+
+
+@pytest.mark.django_db
+def test_view_renders_through_pool(client, render_pool_settings):
+    response = client.post(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com'}, format='json')
+    staff = User.objects.create_user(username='staff', email='staff@example.com', password='password', is_active=True, is_staff=True)
+    client.force_authenticate(staff)
+    stats = client.get(reverse('qr:qr_render_pool_v1')).json()
+
+    assert response.status_code == 200
+    assert response.content == generate_url_qr(url='https://www.example.com')
+    assert stats['enabled'] is True
+    assert stats['completed'] == 1
+
+
+def test_view_returns_503_when_pool_is_full(client, render_pool_settings, monkeypatch):
+    def full(*args, **kwargs):
+        raise RenderPoolFull("full")
+
+    monkeypatch.setattr('apps.qr.views.run_render', full)
+    response = client.post(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com'}, format='json')
+
+    assert response.status_code == 503
+    assert response['Retry-After'] == '1'
+    assert response.json()['error_code'] == QRErrorCodes.RENDER_BUSY
+
+
+@pytest.mark.django_db
+def test_pool_stats_are_admin_only(client, render_pool_settings):
+    assert client.get(reverse('qr:qr_render_pool_v1')).status_code in (401, 403)
+
+    user = User.objects.create_user(username='partner', email='partner@example.com', password='password', is_active=True)
+    client.force_authenticate(user)
+    assert client.get(reverse('qr:qr_render_pool_v1')).status_code == 403
+
+
+def test_view_returns_503_with_retry_after_on_timeout(client, render_pool_settings, monkeypatch):
+    def timeout(*args, **kwargs):
+        raise RenderTimeout("timeout")
+
+    monkeypatch.setattr('apps.qr.views.run_render', timeout)
+    response = client.post(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com'}, format='json')
+
+    assert response.status_code == 503
+    assert response['Retry-After'] == '1'
+    assert response.json()['error_code'] == QRErrorCodes.RENDER_TIMEOUT
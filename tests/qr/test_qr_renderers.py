@@ -0,0 +1,52 @@
+# tests/qr/test_qr_renderers.py
+from io import BytesIO
+
+import numpy as np
+import pytest
+from PIL import Image
+from qrcode.image.styledpil import StyledPilImage
+from qrcode.image.styles.colormasks import SolidFillColorMask
+
+from apps.qr.utils.matrix import encode_qr_matrix
+from apps.qr.utils.qr_utils import create_qr_code
+from apps.qr.utils.renderers import matrix_to_array, render_square_image
+
+
+def _styled_reference(matrix, fill_rgb, back_rgb, box_size=10, border=4):
+    qr = matrix.to_qrcode(box_size=box_size, border=border)
+    img = qr.make_image(
+        image_factory=StyledPilImage,
+        color_mask=SolidFillColorMask(front_color=fill_rgb, back_color=back_rgb),
+    )
+    return np.asarray(img.get_image().convert('RGB'))
+
+
+def test_matrix_to_array_matches_rows():
+    matrix = encode_qr_matrix('https://www.example.com')
+    assert matrix_to_array(matrix).tolist() == matrix.rows()
+
+
+@pytest.mark.parametrize('fill_rgb,back_rgb', [
+    ((0, 0, 0), (255, 255, 255)),
+    ((255, 0, 0), (255, 255, 255)),
+    ((10, 20, 30), (250, 240, 230)),
+])
+def test_square_renderer_is_pixel_identical_to_styled_pil(fill_rgb, back_rgb):
+    matrix = encode_qr_matrix('https://www.example.com/some/path?q=1')
+    fast = np.asarray(render_square_image(matrix, fill_color=fill_rgb, back_color=back_rgb).convert('RGB'))
+    assert np.array_equal(fast, _styled_reference(matrix, fill_rgb, back_rgb))
+
+
+def test_square_renderer_respects_box_size_and_border():
+    matrix = encode_qr_matrix('hello')
+    image = render_square_image(matrix, box_size=3, border=2)
+    assert image.size == ((matrix.size + 4) * 3,) * 2
+
+
+def test_create_qr_code_uses_compact_png_for_defaults():
+    image = Image.open(BytesIO(create_qr_code('https://www.example.com')))
+    assert image.mode == '1'
+
+    image = Image.open(BytesIO(create_qr_code('https://www.example.com', fill_color='red')))
+    assert image.mode == 'P'
+    assert image.convert('RGB').getpixel((0, 0)) == (255, 255, 255)
@@ -0,0 +1,50 @@
+# tests/qr/test_qr_sizing.py
+from io import BytesIO
+
+import pytest
+from django.urls import reverse
+from PIL import Image
+
+from apps.qr.constants.error_codes import QRErrorCodes
+from apps.qr.utils.qr_utils import create_qr_code
+from apps.qr.utils.sizing import PixelBudgetExceeded, resolve_box_size
+
+
+def test_default_box_size():
+    assert resolve_box_size(21) == 10
+
+
+def test_size_picks_largest_box_that_fits():
+    # 21 모듈 + 테두리 8 = 29 모듈
+    assert resolve_box_size(21, border=4, size=300) == 10
+    assert resolve_box_size(21, border=4, size=289) == 9
+    assert resolve_box_size(21, border=0, size=10) == 1
+
+
+def test_oversized_request_is_clamped(settings):
+    settings.QR_MAX_IMAGE_PIXELS = 1000
+    settings.QR_PIXEL_BUDGET_POLICY = 'clamp'
+    assert resolve_box_size(177, border=4, size=5000) == 1000 // 185
+
+
+def test_oversized_request_is_rejected(settings):
+    settings.QR_MAX_IMAGE_PIXELS = 1000
+    settings.QR_PIXEL_BUDGET_POLICY = 'reject'
+    with pytest.raises(PixelBudgetExceeded):
+        resolve_box_size(177, border=4)
+
+
+def test_create_qr_code_honours_size_and_border():
+    image = Image.open(BytesIO(create_qr_code('sized', size=200, border=1)))
+    # 버전 1 (21 모듈) + 테두리 2 모듈 = 23 모듈, box_size 8
+    assert image.size == (184, 184)
+
+
+@pytest.mark.django_db
+def test_view_rejects_over_budget(client, settings):
+    settings.QR_MAX_IMAGE_PIXELS = 100
+    settings.QR_PIXEL_BUDGET_POLICY = 'reject'
+    response = client.post(reverse('qr:qr_text_v1'), data={'text': 'too large', 'size': 5000})
+
+    assert response.status_code == 400
+    assert response.json()['error_code'] == QRErrorCodes.IMAGE_TOO_LARGE
@@ -0,0 +1,88 @@
+# tests/qr/test_qr_sprites.py
+import numpy as np
+import pytest
+from qrcode.image.styledpil import StyledPilImage
+from qrcode.image.styles import colormasks as qrcode_colormasks
+from qrcode.image.styles.moduledrawers.pil import (
+    CircleModuleDrawer,
+    GappedSquareModuleDrawer,
+    HorizontalBarsDrawer,
+    RoundedModuleDrawer,
+    SquareModuleDrawer,
+    VerticalBarsDrawer,
+)
+
+from apps.qr.constants.enums import QREyeStyles, QRStyles
+from apps.qr.utils import colormasks
+from apps.qr.utils.matrix import encode_qr_matrix
+from apps.qr.utils.qr_utils import create_qr_code
+from apps.qr.utils.sprites import SpriteStyledPilImage, get_sprite_registry, supports_sprites
+
+
+DRAWERS = [
+    SquareModuleDrawer,
+    CircleModuleDrawer,
+    RoundedModuleDrawer,
+    HorizontalBarsDrawer,
+    VerticalBarsDrawer,
+]
+
+
+def _render(image_factory, drawer, color_mask, box_size, eye_drawer=None):
+    qr = encode_qr_matrix('https://www.example.com/sprites').to_qrcode(box_size=box_size, border=4)
+    img = qr.make_image(
+        image_factory=image_factory, module_drawer=drawer, eye_drawer=eye_drawer, color_mask=color_mask
+    )
+    return np.asarray(img.get_image())
+
+
+@pytest.mark.parametrize('box_size', [10, 7])
+@pytest.mark.parametrize('drawer_class', DRAWERS)
+def test_sprite_stamping_matches_drawer_output(drawer_class, box_size):
+    expected = _render(StyledPilImage, drawer_class(), qrcode_colormasks.SolidFillColorMask(), box_size)
+    actual = _render(SpriteStyledPilImage, drawer_class(), qrcode_colormasks.SolidFillColorMask(), box_size)
+    assert np.array_equal(actual, expected)
+
+
+@pytest.mark.parametrize('drawer_class', [CircleModuleDrawer, RoundedModuleDrawer])
+def test_sprite_stamping_with_colored_masks(drawer_class):
+    solid = {'back_color': (250, 250, 250), 'front_color': (200, 0, 0)}
+    expected = _render(StyledPilImage, drawer_class(), qrcode_colormasks.SolidFillColorMask(**solid), 10)
+    actual = _render(SpriteStyledPilImage, drawer_class(), colormasks.SolidFillColorMask(**solid), 10)
+    assert np.array_equal(actual, expected)
+
+
+@pytest.mark.parametrize('eye_drawer_class', [CircleModuleDrawer, RoundedModuleDrawer])
+@pytest.mark.parametrize('drawer_class', [SquareModuleDrawer, VerticalBarsDrawer])
+def test_finder_sprites_match_eye_drawer_output(drawer_class, eye_drawer_class):
+    expected = _render(
+        StyledPilImage, drawer_class(), qrcode_colormasks.SolidFillColorMask(), 10, eye_drawer_class()
+    )
+    actual = _render(
+        SpriteStyledPilImage, drawer_class(), qrcode_colormasks.SolidFillColorMask(), 10, eye_drawer_class()
+    )
+    assert np.array_equal(actual, expected)
+
+
+def test_gapped_square_falls_back_to_drawer():
+    assert not supports_sprites(GappedSquareModuleDrawer())
+    assert supports_sprites(CircleModuleDrawer())
+
+
+def test_sprites_are_rendered_once_per_context():
+    registry = get_sprite_registry()
+    registry.clear()
+    for _ in range(2):
+        _render(SpriteStyledPilImage, CircleModuleDrawer(), qrcode_colormasks.SolidFillColorMask(), 10)
+    stats = registry.stats()
+    # 모듈 스프라이트 세트와 파인더 스프라이트가 각각 한 번씩만 렌더링된다
+    assert stats['misses'] == 3
+    assert stats['hits'] == 2
+
+
+@pytest.mark.parametrize('style', [QRStyles.SQUARE_MODULE, QRStyles.CIRCLE_MODULE])
+def test_eye_style_is_applied(style):
+    square = create_qr_code('eye style', style=style, eye_style=QREyeStyles.SQUARE)
+    circle = create_qr_code('eye style', style=style, eye_style=QREyeStyles.CIRCLE)
+    assert square != circle
+    assert create_qr_code('eye style', style=style, eye_style=None) == square
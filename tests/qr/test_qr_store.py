@@ -0,0 +1,95 @@
+# tests/qr/test_qr_store.py
+import os
+
+import pytest
+from django.urls import reverse
+
+from apps.qr.constants.enums import QROutputFormats
+from apps.qr.utils.store import RenderStore, get_render_store, reset_render_store
+
+
+@pytest.fixture
+def render_store(settings, tmp_path):
+    settings.QR_RENDER_STORE_ENABLED = True
+    settings.QR_RENDER_STORE_ROOT = str(tmp_path / 'qr-renders')
+    reset_render_store()
+    yield get_render_store()
+    reset_render_store()
+
+
+def test_store_paths_are_sharded_by_key_prefix(tmp_path):
+    store = RenderStore(str(tmp_path), max_bytes=1024)
+    key = 'abcdef' + '0' * 58
+
+    assert store.relative_path(key, QROutputFormats.SVG) == f"ab/cd/{key}.svg"
+    assert store.get(key, QROutputFormats.SVG) is None
+
+    path = store.put(key, QROutputFormats.SVG, b'<svg/>')
+
+    assert path == tmp_path / 'ab' / 'cd' / f"{key}.svg"
+    assert store.get(key, QROutputFormats.SVG).read_bytes() == b'<svg/>'
+    assert store.stats()['hits'] == 1
+
+
+def test_store_evicts_least_recently_used_files(tmp_path):
+    store = RenderStore(str(tmp_path), max_bytes=250, sweep_interval_bytes=10 ** 6)
+    keys = [f"{i:02d}" * 32 for i in range(3)]
+    for age, key in enumerate(keys):
+        path = store.put(key, QROutputFormats.PNG, b'x' * 100)
+        os.utime(path, (1000 + age, 1000 + age))
+
+    assert store.evict() == 1
+    assert store.get(keys[0], QROutputFormats.PNG) is None
+    assert store.get(keys[1], QROutputFormats.PNG) is not None
+    assert store.get(keys[2], QROutputFormats.PNG) is not None
+
+
+def test_view_serves_repeated_request_from_store(client, render_store):
+    url = reverse('qr:qr_url_v1')
+    data = {'url': 'https://www.example.com', 'format': 'svg'}
+
+    first = client.post(url, data, format='json')
+    second = client.post(url, data, format='json')
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.streaming
+    assert b''.join(second.streaming_content) == first.content
+    assert second['Content-Type'] == 'image/svg+xml'
+    assert render_store.stats()['hits'] == 1
+
+
+def test_view_renders_when_stored_file_is_evicted_after_lookup(client, render_store, monkeypatch):
+    url = reverse('qr:qr_url_v1')
+    data = {'url': 'https://www.example.com', 'format': 'svg'}
+    first = client.post(url, data, format='json')
+
+    # 조회와 파일 열기 사이에 다른 워커가 파일을 정리한 경우
+    lookup = RenderStore.get
+
+    def get_then_evict(self, key, output_format):
+        path = lookup(self, key, output_format)
+        if path is not None:
+            path.unlink()
+        return path
+
+    monkeypatch.setattr(RenderStore, 'get', get_then_evict)
+    second = client.post(url, data, format='json')
+
+    assert second.status_code == 200
+    assert not second.streaming
+    assert second.content == first.content
+
+
+def test_view_uses_x_accel_redirect(client, render_store, settings):
+    settings.QR_RENDER_STORE_SENDFILE = 'x-accel-redirect'
+    url = reverse('qr:qr_url_v1')
+
+    client.get(url, {'url': 'https://www.example.com'})
+    response = client.get(url, {'url': 'https://www.example.com'})
+
+    assert response.status_code == 200
+    assert response['X-Accel-Redirect'].startswith('/protected/qr-renders/')
+    assert response['X-Accel-Redirect'].endswith('.png')
+    assert response['ETag']
+    assert not response.content
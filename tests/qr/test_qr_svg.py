@@ -0,0 +1,68 @@
+# tests/qr/test_qr_svg.py
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pytest
+
+from apps.qr.constants.enums import QRColorMasks, QREyeStyles, QROutputFormats, QRStyles
+from apps.qr.utils.colormasks import HorizontalGradiantColorMask, RadialGradiantColorMask
+from apps.qr.utils.matrix import encode_qr_matrix
+from apps.qr.utils.qr_utils import create_qr_code
+from apps.qr.utils.renderers import matrix_to_array
+from apps.qr.utils.svg import merged_rects, render_svg
+
+
+SVG_NS = '{http://www.w3.org/2000/svg}'
+
+
+@pytest.fixture
+def matrix():
+    return encode_qr_matrix('https://www.example.com/svg')
+
+
+def test_merged_rects_cover_exactly_the_dark_modules(matrix):
+    modules = matrix_to_array(matrix)
+    covered = np.zeros(modules.shape, dtype=int)
+    for x, y, w, h in merged_rects(modules):
+        covered[y:y + h, x:x + w] += 1
+
+    assert np.array_equal(covered, modules.astype(int))  # 겹치는 사각형 없음
+    assert len(merged_rects(modules)) < modules.sum()
+
+
+def test_square_svg_uses_single_path(matrix):
+    root = ET.fromstring(render_svg(matrix, box_size=10, border=4))
+    extent = matrix.size + 8
+
+    assert root.get('viewBox') == f'0 0 {extent} {extent}'
+    assert root.get('width') == str(extent * 10)
+    assert len(root.findall(f'{SVG_NS}path')) == 1
+
+
+@pytest.mark.parametrize('style', list(QRStyles))
+@pytest.mark.parametrize('eye_style', list(QREyeStyles))
+def test_all_styles_produce_valid_svg(matrix, style, eye_style):
+    root = ET.fromstring(render_svg(matrix, style=style, eye_style=eye_style))
+    assert root.find(f'{SVG_NS}path').get('d')
+
+
+@pytest.mark.parametrize('mask, tag', [
+    (HorizontalGradiantColorMask(left_color=(255, 0, 0), right_color=(0, 0, 255)), 'linearGradient'),
+    (RadialGradiantColorMask(center_color=(255, 0, 0), edge_color=(0, 0, 255)), 'radialGradient'),
+])
+def test_gradients_are_svg_gradients(matrix, mask, tag):
+    root = ET.fromstring(render_svg(matrix, color_mask=mask))
+    gradient = root.find(f'{SVG_NS}defs/{SVG_NS}{tag}')
+
+    assert gradient is not None
+    assert [stop.get('stop-color') for stop in gradient] == ['#ff0000', '#0000ff']
+    assert root.find(f'{SVG_NS}path').get('fill') == f"url(#{gradient.get('id')})"
+
+
+def test_create_qr_code_svg_output():
+    svg = create_qr_code(
+        'hello', fill_color='red', color_mask=QRColorMasks.SOLID_FILL, output_format=QROutputFormats.SVG
+    )
+    root = ET.fromstring(svg)
+    assert root.find(f'{SVG_NS}path').get('fill') == '#ff0000'
+    assert create_qr_code('hello', fill_color='red') != svg
@@ -0,0 +1,47 @@
+# tests/seavoyage/test_seavoyage_async.py
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncRequestFactory
+
+from apps.seavoyage import views
+from apps.seavoyage.models import SeaRoute
+
+
+factory = AsyncRequestFactory()
+ROUTE = {'properties': {'length': 42.5}, 'geometry': {'type': 'LineString', 'coordinates': [[126.9, 37.5], [129.0, 35.1]]}}
+
+
+@pytest.fixture
+def fixed_route(monkeypatch):
+    calls = []
+
+    def calculate_route(origin, destination):
+        calls.append((origin, destination))
+        return ROUTE
+
+    monkeypatch.setattr(views, 'calculate_route', calculate_route)
+    return calls
+
+
+@pytest.mark.django_db
+def test_async_route_is_saved_with_async_orm(fixed_route):
+    request = factory.get('/api/v1/seavoyage/', {
+        'origin': '37.5,126.9', 'destination': '35.1,129.0', 'save_to_db': 'true',
+    })
+    response = async_to_sync(views.AsyncSeavoyageView.as_view())(request)
+
+    assert response.status_code == 200
+    assert json.loads(response.content)['distance'] == 42.5
+    assert fixed_route == [('37.5,126.9', '35.1,129.0')]
+    assert SeaRoute.objects.get().geojson == ROUTE['geometry']
+
+
+def test_async_route_rejects_invalid_coordinates(fixed_route):
+    request = factory.get('/api/v1/seavoyage/', {'origin': '91,0', 'destination': '35.1,129.0'})
+    response = async_to_sync(views.AsyncSeavoyageView.as_view())(request)
+
+    assert response.status_code == 400
+    assert 'origin' in json.loads(response.content)
+    assert fixed_route == []
@@ -0,0 +1,89 @@
+# tests/usage/test_usage_meter.py
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.accounts.models import APIKey, User
+from apps.usage.meter import UsageMeter, get_usage_meter
+from apps.usage.models import UsageRecord
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def user():
+    return User.objects.create_user(username='partner', email='partner@example.com', password='password', is_active=True)
+
+
+def test_counts_are_aggregated_until_flush(user, django_assert_num_queries):
+    meter = UsageMeter(flush_interval=0, flush_threshold=1000)
+    for _ in range(50):
+        meter.record(UsageRecord.Metric.QR_RENDER, user.pk)
+    meter.record(UsageRecord.Metric.ROUTE)
+
+    assert not UsageRecord.objects.exists()
+    assert meter.flush() == 51
+    assert UsageRecord.objects.get(account=f'user:{user.pk}', metric='qr_render').count == 50
+    assert UsageRecord.objects.get(account='anonymous', metric='route').count == 1
+
+    # 이미 있는 행은 F() 갱신만
+    meter.record(UsageRecord.Metric.QR_RENDER, user.pk, count=5)
+    with django_assert_num_queries(3):  # savepoint, update, release
+        meter.flush()
+    assert UsageRecord.objects.get(account=f'user:{user.pk}', metric='qr_render').count == 55
+
+
+def test_threshold_triggers_flush(user):
+    meter = UsageMeter(flush_interval=0, flush_threshold=3)
+    meter.record(UsageRecord.Metric.ROUTE, user.pk, count=2)
+    assert not UsageRecord.objects.exists()
+
+    meter.record(UsageRecord.Metric.ROUTE, user.pk)
+
+    assert UsageRecord.objects.get().count == 3
+    assert meter.pending() == 0
+
+
+def test_concurrent_meters_add_to_same_row(user):
+    # 여러 웹 워커가 같은 계정의 증가분을 각자 flush
+    first, second = UsageMeter(0, 1000), UsageMeter(0, 1000)
+    first.record(UsageRecord.Metric.QR_RENDER, user.pk, count=2)
+    second.record(UsageRecord.Metric.QR_RENDER, user.pk, count=3)
+
+    first.flush()
+    second.flush()
+
+    assert UsageRecord.objects.get().count == 5
+
+
+def test_views_record_usage_per_api_key(client, user):
+    api_key, raw_key = APIKey.objects.create_key(user, 'partner')
+    client.credentials(HTTP_X_API_KEY=raw_key)
+
+    client.post(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com'}, format='json')
+    client.post(reverse('qr:qr_url_v1'), {'url': 'https://www.example.com', 'sizes': [128, 256]}, format='json')
+    client.post(reverse('qr:qr_url_v1'), {}, format='json')
+    get_usage_meter().flush()
+
+    record = UsageRecord.objects.get()
+    assert (record.user, record.api_key, record.count) == (user, api_key, 3)
+
+
+def test_usage_api_returns_daily_rollups(client, user):
+    other = User.objects.create_user(username='other', email='other@example.com', password='password')
+    today = timezone.localdate()
+    UsageRecord.objects.create(date=today, metric='qr_render', account=f'user:{user.pk}', user=user, count=7)
+    UsageRecord.objects.create(date=today, metric='route', account=f'user:{user.pk}', user=user, count=2)
+    UsageRecord.objects.create(date=today, metric='route', account=f'user:{other.pk}', user=other, count=9)
+    client.force_authenticate(user)
+
+    response = client.get(reverse('usage:usage'))
+
+    assert response.status_code == 200
+    assert response.json()['totals'] == {'qr_render': 7, 'route': 2}
+    assert len(response.json()['results']) == 2
+
+
+def test_usage_api_requires_authentication(client):
+    assert client.get(reverse('usage:usage')).status_code in (401, 403)